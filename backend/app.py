@@ -1,16 +1,30 @@
+from utils.startup import StartupReport
+startup = StartupReport()
+
 from flask import Flask
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 import os
+import tempfile
+import threading
 
+import utils.limiter_storage  # registers the mmap:// limiter storage
 from routes.auth import auth_bp
 from routes.summary import summary_bp
 from routes.companies import companies_bp
 from routes.problems import problems_bp
+from routes.user import user_bp
+from routes.revpro import revpro_bp
+from routes.metrics import metrics_bp
+from services.jobs import WorkerPool
+from services.passwords import password_pool
 from utils.errors import register_error_handlers
+from utils.request_metrics import init_request_metrics
 from utils.db import create_indexes
 
+startup.mark("imports")
+
 app = Flask(__name__)
 
 # CORS configuration - restrict origins for security
@@ -23,12 +37,19 @@ CORS(
     expose_headers=["Content-Type", "Authorization"]
 )
 
-# Rate limiting
+# Rate limiting, with counters shared by all worker processes on this host
+# (utils/limiter_storage.py); set RATELIMIT_STORAGE_URI=memory:// for per-process counters.
+# asgi.py applies the same limits to the routes it serves with Quart.
+RATE_LIMIT_DEFAULTS = ["200 per day", "50 per hour"]
+RATE_LIMIT_STORAGE_URI = os.getenv("RATELIMIT_STORAGE_URI", f"mmap://{tempfile.gettempdir()}/leetcode_tracker_limits")
+RATE_LIMIT_STRATEGY = "sliding-window-counter"
+
 limiter = Limiter(
     get_remote_address,
     app=app,
-    default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://"
+    default_limits=RATE_LIMIT_DEFAULTS,
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy=RATE_LIMIT_STRATEGY,
 )
 
 # Apply stricter limits to auth endpoints
@@ -39,15 +60,65 @@ def auth_rate_limit():
 # Register error handlers
 register_error_handlers(app)
 
+# Per-route latency, size, status and in-flight metrics (served at /metrics)
+init_request_metrics(app)
+
 # Register blueprints
 app.register_blueprint(auth_bp)
 app.register_blueprint(summary_bp)
 app.register_blueprint(companies_bp)
 app.register_blueprint(problems_bp)
+app.register_blueprint(user_bp)
+app.register_blueprint(revpro_bp)
+app.register_blueprint(metrics_bp)
+
+# Scrapers poll far more often than the default limits allow
+limiter.exempt(metrics_bp)
+
+startup.mark("app setup")
+
+startup.ready()
+startup.attach(app)
+
+_background_lock = threading.Lock()
+_background_started = False
+
+
+def start_background():
+    """
+    Start index reconciliation, the background ingestion workers and the
+    bcrypt worker processes for a serving process. Called by the server
+    entry points (below and in asgi.py), never on import, so importing the
+    app does not connect to MongoDB and scripts, tests and the debug
+    reloader's parent process stay inert. Set INGEST_WORKERS=0 to run
+    workers via scripts/run_workers.py only.
+    """
+    global _background_started
+    with _background_lock:
+        if _background_started:
+            return
+        _background_started = True
+
+    # "background" (default) reconciles indexes in a thread, "sync" blocks on
+    # it, "off" leaves it to scripts/create_indexes.py (e.g. once per deploy
+    # instead of once per worker)
+    index_mode = os.getenv("INDEX_ON_STARTUP", "background")
+    if index_mode == "sync":
+        create_indexes()
+    elif index_mode == "background":
+        threading.Thread(target=create_indexes, name="create-indexes", daemon=True).start()
+
+    ingest_workers = int(os.getenv("INGEST_WORKERS", "1"))
+    if ingest_workers > 0:
+        WorkerPool(ingest_workers).start()
+
+    # bcrypt worker processes, so the first login does not start them
+    password_pool.warm()
 
-# Create database indexes on startup
-with app.app_context():
-    create_indexes()
 
 if __name__ == "__main__":
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    debug = True
+    # With the reloader on, only the child process that serves requests starts them
+    if not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_background()
+    app.run(host='0.0.0.0', port=5000, debug=debug)
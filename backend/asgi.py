@@ -0,0 +1,101 @@
+"""
+ASGI entry point: async read routes plus the existing Flask app.
+
+The dashboard reads (summary, companies, problems) are served by a Quart
+app whose views await motor instead of holding a thread per request. Any
+request those views do not handle (auth, user, the /api/problems explorer,
+...) is passed to the Flask app from app.py, which hypercorn runs on its
+thread pool, so every sync blueprint keeps working unchanged. Both apps
+build their responses with services/read_views.py and apply the same
+default rate limits.
+
+Run with:
+    hypercorn asgi:application --bind 0.0.0.0:5000
+or:
+    python asgi.py
+"""
+
+import os
+from quart import Quart, jsonify
+from quart_cors import cors
+from hypercorn.middleware import AsyncioWSGIMiddleware
+from werkzeug.exceptions import HTTPException
+
+from app import (
+    app as flask_app, allowed_origins, start_background, limiter,
+    RATE_LIMIT_DEFAULTS, RATE_LIMIT_STORAGE_URI, RATE_LIMIT_STRATEGY,
+)
+from async_routes.summary import summary_bp
+from async_routes.companies import companies_bp
+from async_routes.problems import problems_bp
+from middleware.async_rate_limit import init_rate_limits
+from utils.request_metrics import init_async_request_metrics
+from utils import async_db
+from utils.errors import APIError
+
+async_app = Quart(__name__)
+
+# Same CORS policy as the Flask app
+async_app = cors(
+    async_app,
+    allow_origin=allowed_origins,
+    allow_credentials=True,
+    allow_headers=["Content-Type", "Authorization"],
+    expose_headers=["Content-Type", "Authorization"],
+)
+
+# Same default limits and shared counters as Flask-Limiter on the Flask app
+init_rate_limits(async_app, limiter, RATE_LIMIT_DEFAULTS, RATE_LIMIT_STORAGE_URI, RATE_LIMIT_STRATEGY)
+
+# Per-route request metrics next to the Flask routes (blueprints end in "_async")
+init_async_request_metrics(async_app)
+
+async_app.register_blueprint(summary_bp)
+async_app.register_blueprint(companies_bp)
+async_app.register_blueprint(problems_bp)
+
+@async_app.errorhandler(APIError)
+async def handle_api_error(error):
+    return jsonify({"error": error.message}), error.status_code
+
+@async_app.before_serving
+async def start_background_work():
+    start_background()
+
+@async_app.after_serving
+async def close_async_client():
+    async_db.close_client()
+
+
+class RouteDispatcher:
+    """Send requests matching an async route to Quart and everything else to Flask."""
+
+    def __init__(self, async_app, wsgi_app):
+        self.async_app = async_app
+        self.wsgi_app = AsyncioWSGIMiddleware(wsgi_app)
+        self.adapter = async_app.url_map.bind("")
+
+    def is_async(self, scope) -> bool:
+        try:
+            self.adapter.match(scope["path"], method=scope["method"])
+            return True
+        except HTTPException:
+            return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not self.is_async(scope):
+            return await self.wsgi_app(scope, receive, send)
+        return await self.async_app(scope, receive, send)
+
+
+application = RouteDispatcher(async_app, flask_app)
+
+
+if __name__ == "__main__":
+    import asyncio
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    config = Config()
+    config.bind = [f"0.0.0.0:{os.getenv('PORT', '5000')}"]
+    asyncio.run(serve(application, config))
@@ -0,0 +1,82 @@
+# backend/async_routes/companies.py
+"""Async (Quart) versions of routes/companies.py, served from asgi.py."""
+from quart import Blueprint, Response, jsonify, request, g
+from utils import async_db
+from utils.streaming import wants_ndjson, ndjson_lines, NDJSON_MIMETYPE, STREAM_BATCH_SIZE
+from middleware.async_auth import require_auth
+from services import async_reads
+from services.read_views import (
+    top_companies_payload, company_query, company_problem_row, COMPANY_PROBLEM_PROJECTION,
+    plan_options, plan_rows, PLAN_PROJECTION,
+)
+from urllib.parse import unquote
+import asyncio
+
+companies_bp = Blueprint("companies_async", __name__)
+
+# ---------- TOP COMPANIES ----------
+@companies_bp.route("/api/companies/top", methods=["GET"])
+@require_auth
+async def top_companies():
+    user = g.user
+
+    solved, engine = await asyncio.gather(
+        async_reads.get_solved_set(user),
+        async_reads.readiness_engine(),
+    )
+
+    weighted = request.args.get("mode") == "weighted"
+    return jsonify(top_companies_payload(engine, solved, weighted))
+
+
+# ---------- COMPANY PROBLEMS ----------
+@companies_bp.route("/api/companies/<company>", methods=["GET"])
+@require_auth
+async def company_problems(company):
+    company = unquote(company)
+    user = g.user
+
+    solved = await async_reads.get_solved_set(user)
+
+    async def rows():
+        cursor = async_db.problems_master.find(
+            company_query(company), COMPANY_PROBLEM_PROJECTION, batch_size=STREAM_BATCH_SIZE
+        )
+        async for p in cursor:
+            row = company_problem_row(p, solved)
+            if row is not None:
+                yield row
+
+    if wants_ndjson(request):
+        return Response(ndjson_lines(rows()), mimetype=NDJSON_MIMETYPE)
+
+    return jsonify({"problems": [row async for row in rows()]})
+
+# ---------- SMART PLAN ----------
+@companies_bp.route("/api/companies/<company>/smart_plan", methods=["POST"])
+@require_auth
+async def smart_plan(company):
+    company = unquote(company)
+    data = await request.get_json(force=True, silent=True)
+
+    user = g.user
+
+    num, include_solved, difficulties, seed = plan_options(data)
+
+    solved, sampler = await asyncio.gather(
+        async_reads.get_solved_set(user),
+        async_reads.sampler(),
+    )
+
+    slugs = sampler.sample(
+        company,
+        num,
+        difficulties,
+        exclude=None if include_solved else solved,
+        seed=seed,
+    )
+
+    cursor = async_db.problems_master.find({"_id": {"$in": slugs}}, PLAN_PROJECTION)
+    docs = {p["_id"]: p async for p in cursor}
+
+    return jsonify(plan_rows(slugs, docs, solved))
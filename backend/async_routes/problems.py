@@ -0,0 +1,54 @@
+# backend/async_routes/problems.py
+"""Async (Quart) versions of routes/problems.py, served from asgi.py."""
+from quart import Blueprint, Response, jsonify, request, g
+from utils import async_db
+from utils.streaming import wants_ndjson, ndjson_lines, NDJSON_MIMETYPE, STREAM_BATCH_SIZE
+from middleware.async_auth import require_auth
+from services import async_reads
+from services.read_views import (
+    search_query, search_row, SEARCH_PROJECTION, review_rows, REVIEW_PROJECTION, REVIEW_LIMIT,
+)
+
+problems_bp = Blueprint("problems_async", __name__)
+
+# ---------- SEARCH ----------
+@problems_bp.route("/api/problems/search", methods=["GET"])
+@require_auth
+async def search():
+    topic = request.args.get("topic")
+    difficulty = request.args.get("difficulty")
+
+    user = g.user
+
+    solved = await async_reads.get_solved_set(user)
+
+    async def rows():
+        cursor = async_db.problems_master.find(
+            search_query(topic, difficulty), SEARCH_PROJECTION, batch_size=STREAM_BATCH_SIZE
+        )
+        async for p in cursor:
+            yield search_row(p, solved)
+
+    if wants_ndjson(request):
+        return Response(ndjson_lines(rows()), mimetype=NDJSON_MIMETYPE)
+
+    return jsonify([row async for row in rows()])
+
+
+# ---------- REVIEW ----------
+@problems_bp.route("/api/review/today", methods=["GET"])
+@require_auth
+async def review_today():
+    user = g.user
+
+    solved = await async_reads.recent_solved(user, REVIEW_LIMIT)
+
+    if not solved:
+        return jsonify([])
+
+    slugs = [s["slug"] for s in solved]
+
+    cursor = async_db.problems_master.find({"_id": {"$in": slugs}}, REVIEW_PROJECTION)
+    master_docs = {p["_id"]: p async for p in cursor}
+
+    return jsonify(review_rows(solved, master_docs))
@@ -0,0 +1,36 @@
+# backend/async_routes/summary.py
+"""Async (Quart) versions of routes/summary.py, served from asgi.py."""
+from quart import Blueprint, jsonify, g
+from middleware.async_auth import require_auth
+from services import async_reads
+from services.read_views import summary_payload, has_topic_stats, insights_payload, EMPTY_INSIGHTS
+import asyncio
+
+summary_bp = Blueprint("summary_async", __name__)
+
+@summary_bp.route("/api/summary", methods=["GET"])
+@require_auth
+async def summary():
+    user = g.user
+
+    stats, total_solved = await asyncio.gather(
+        async_reads.catalog_stats(),
+        async_reads.count_solved(user),
+    )
+
+    return jsonify(summary_payload(stats, total_solved))
+
+@summary_bp.route("/api/insights", methods=["GET"])
+@require_auth
+async def insights():
+    user = g.user
+    stats = await async_reads.catalog_stats()
+
+    if not has_topic_stats(stats):
+        return jsonify(EMPTY_INSIGHTS)
+
+    coverage, total_solved = await asyncio.gather(
+        async_reads.get_coverage(user),
+        async_reads.count_solved(user),
+    )
+    return jsonify(insights_payload(user, stats, coverage, total_solved))
@@ -0,0 +1,46 @@
+from functools import wraps
+from quart import request, jsonify, g
+from bson.errors import InvalidId
+from middleware.auth import get_secret_key
+from services.async_reads import get_user
+import jwt
+
+def require_auth(f):
+    """
+    Async counterpart of middleware.auth.require_auth for Quart views.
+    Sets g.user_id, g.user_email and g.user (cached user record).
+    """
+    @wraps(f)
+    async def decorated(*args, **kwargs):
+        token = None
+        auth_header = request.headers.get("Authorization")
+
+        if auth_header and auth_header.startswith("Bearer "):
+            token = auth_header.split(" ")[1]
+
+        if not token:
+            return jsonify({"error": "Missing authentication token"}), 401
+
+        try:
+            secret_key = get_secret_key()
+            if not secret_key:
+                return jsonify({"error": "Server configuration error"}), 500
+
+            payload = jwt.decode(token, secret_key, algorithms=["HS256"])
+            g.user_id = payload["user_id"]
+            g.user_email = payload["email"]
+            g.user = await get_user(g.user_id)
+
+        except jwt.ExpiredSignatureError:
+            return jsonify({"error": "Token expired"}), 401
+        except (jwt.InvalidTokenError, InvalidId):
+            return jsonify({"error": "Invalid token"}), 401
+        except Exception as e:
+            return jsonify({"error": "Authentication failed"}), 401
+
+        if g.user is None:
+            return jsonify({"error": "User not found"}), 404
+
+        return await f(*args, **kwargs)
+
+    return decorated
@@ -0,0 +1,30 @@
+"""
+Default rate limits for the Quart views served from asgi.py.
+
+Flask-Limiter only hooks into Flask, so without this the routes moved to
+Quart would lose the default limits. The same limits are applied here per
+client address and endpoint, with the same `limits` storage (the shared
+mmap:// table by default) and strategy as the Flask limiter, and switched
+off together with it (limiter.enabled).
+"""
+
+from limits import parse_many
+from limits.storage import storage_from_string
+from limits.strategies import STRATEGIES
+from quart import request, jsonify
+
+
+def init_rate_limits(app, flask_limiter, default_limits, storage_uri, strategy):
+    rate_limiter = STRATEGIES[strategy](storage_from_string(storage_uri))
+    limits = [item for spec in default_limits for item in parse_many(spec)]
+
+    @app.before_request
+    async def check_rate_limits():
+        if not flask_limiter.enabled or request.endpoint is None:
+            return None
+
+        client = request.remote_addr or "127.0.0.1"
+        for item in limits:
+            if not rate_limiter.hit(item, "quart", client, request.endpoint):
+                return jsonify({"error": f"Rate limit exceeded: {item}"}), 429
+        return None
@@ -1,10 +1,24 @@
 from functools import wraps
 from flask import request, jsonify, g
+from bson.errors import InvalidId
+from services.user_cache import get_user
 import jwt
 import os
 
+_secret_key = None
+
+def get_secret_key():
+    """JWT_SECRET_KEY, read from the environment once."""
+    global _secret_key
+    if _secret_key is None:
+        _secret_key = os.getenv("JWT_SECRET_KEY")
+    return _secret_key
+
 def require_auth(f):
-    """Decorator to protect routes with JWT authentication."""
+    """
+    Decorator to protect routes with JWT authentication.
+    Sets g.user_id, g.user_email and g.user (cached user record).
+    """
     @wraps(f)
     def decorated(*args, **kwargs):
         token = None
@@ -17,21 +31,25 @@ def require_auth(f):
             return jsonify({"error": "Missing authentication token"}), 401
 
         try:
-            secret_key = os.getenv("JWT_SECRET_KEY")
+            secret_key = get_secret_key()
             if not secret_key:
                 return jsonify({"error": "Server configuration error"}), 500
 
             payload = jwt.decode(token, secret_key, algorithms=["HS256"])
             g.user_id = payload["user_id"]
             g.user_email = payload["email"]
+            g.user = get_user(g.user_id)
 
         except jwt.ExpiredSignatureError:
             return jsonify({"error": "Token expired"}), 401
-        except jwt.InvalidTokenError:
+        except (jwt.InvalidTokenError, InvalidId):
             return jsonify({"error": "Invalid token"}), 401
         except Exception as e:
             return jsonify({"error": "Authentication failed"}), 401
 
+        if g.user is None:
+            return jsonify({"error": "User not found"}), 404
+
         return f(*args, **kwargs)
 
     return decorated
@@ -4,7 +4,9 @@ from utils.validation import validate_email, validate_password, validate_usernam
 from utils.crypto import encrypt_credential
 from utils.errors import APIError
 from middleware.auth import require_auth
-import bcrypt
+from services import passwords
+from services.passwords import PasswordPoolBusy
+from services.solved_store import SHARED_STORE
 import jwt
 import time
 import os
@@ -19,12 +21,18 @@ ACCESS_TOKEN_EXPIRY = 900  # 15 minutes
 REFRESH_TOKEN_EXPIRY = 604800  # 7 days
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    """Hash a password using bcrypt (on the password pool)."""
+    try:
+        return passwords.hash_password(password)
+    except PasswordPoolBusy:
+        raise APIError("Server is busy, please try again shortly", 503)
 
 def verify_password(password: str, password_hash: str) -> bool:
-    """Verify a password against its hash."""
-    return bcrypt.checkpw(password.encode(), password_hash.encode())
+    """Verify a password against its hash (on the password pool)."""
+    try:
+        return passwords.verify_password(password, password_hash)
+    except PasswordPoolBusy:
+        raise APIError("Server is busy, please try again shortly", 503)
 
 def create_access_token(user_id: str, email: str) -> str:
     """Create a JWT access token."""
@@ -99,6 +107,9 @@ def register():
             "leetcode_csrf_encrypted": encrypt_credential(leetcode_csrf) if leetcode_csrf else None,
             "ingestion_status": "ready",
             "last_ingested_at": None,
+            # New users never had a legacy archive_solved_* collection
+            "solved_store": SHARED_STORE,
+            "solved_count": 0,
             "created_at": time.time(),
             "updated_at": time.time()
         }
@@ -221,10 +232,7 @@ def logout():
 def get_current_user():
     """Get current authenticated user profile."""
     try:
-        user = users_col.find_one({"_id": ObjectId(g.user_id)})
-
-        if not user:
-            raise APIError("User not found", 404)
+        user = g.user
 
         return jsonify({
             "id": str(user["_id"]),
@@ -0,0 +1,33 @@
+# backend/routes/metrics.py
+from flask import Blueprint, Response, request, jsonify
+from utils.metrics import render
+import hmac
+import ipaddress
+import os
+
+metrics_bp = Blueprint("metrics", __name__)
+
+# Bearer token for scrapers; without one the endpoint only answers local
+# requests, since query shapes and collection names are not public
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+def is_local(address) -> bool:
+    try:
+        return ipaddress.ip_address(address or "").is_loopback
+    except ValueError:
+        return False
+
+# ---------- METRICS (Prometheus text format) ----------
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    if METRICS_TOKEN:
+        supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        # bytes: compare_digest rejects non-ASCII str, which a client controls
+        if not hmac.compare_digest(supplied.encode(), METRICS_TOKEN.encode()):
+            return jsonify({"error": "Invalid metrics token"}), 401
+    elif not is_local(request.remote_addr):
+        return jsonify({"error": "Set METRICS_TOKEN to scrape metrics remotely"}), 403
+
+    return Response(render(), content_type=PROMETHEUS_CONTENT_TYPE)
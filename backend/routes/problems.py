@@ -1,8 +1,13 @@
 # backend/routes/problems.py
 from flask import Blueprint, jsonify, request, g
-from utils.db import problems_master, user_solved_col, users_col
+from utils.db import problems_master
+from utils.streaming import wants_ndjson, ndjson_response, STREAM_BATCH_SIZE
 from middleware.auth import require_auth
-from bson import ObjectId
+from services.solved_store import recent_solved
+from services.solved_cache import get_solved_set
+from services.read_views import (
+    search_query, search_row, SEARCH_PROJECTION, review_rows, REVIEW_PROJECTION, REVIEW_LIMIT,
+)
 
 problems_bp = Blueprint("problems", __name__)
 
@@ -13,54 +18,30 @@ def search():
     topic = request.args.get("topic")
     difficulty = request.args.get("difficulty")
 
-    user = users_col.find_one({"_id": ObjectId(g.user_id)})
-    if not user:
-        return jsonify({"error": "User not found"}), 404
+    user = g.user
 
-    username = user["username"]
-    solved = {
-        d["slug"]
-        for d in user_solved_col(username).find({}, {"_id": 0, "slug": 1})
-    }
-
-    query = {}
-    if topic:
-        query["topics"] = topic.lower()
-    if difficulty:
-        query["difficulty"] = difficulty.capitalize()
+    solved = get_solved_set(user)
 
-    projection = {
-        "_id": 0,
-        "id": 1,
-        "title": 1,
-        "difficulty": 1,
-        "topics": 1
-    }
+    def rows():
+        cursor = problems_master.find(
+            search_query(topic, difficulty), SEARCH_PROJECTION, batch_size=STREAM_BATCH_SIZE
+        )
+        for p in cursor:
+            yield search_row(p, solved)
 
-    results = []
-    for p in problems_master.find(query, projection):
-        p["is_solved"] = p["id"] in solved
-        p["link"] = f"https://leetcode.com/problems/{p['id']}/"
-        results.append(p)
+    if wants_ndjson():
+        return ndjson_response(rows())
 
-    return jsonify(results)
+    return jsonify(list(rows()))
 
 
 # ---------- REVIEW ----------
 @problems_bp.route("/api/review/today", methods=["GET"])
 @require_auth
 def review_today():
-    user = users_col.find_one({"_id": ObjectId(g.user_id)})
-    if not user:
-        return jsonify({"error": "User not found"}), 404
+    user = g.user
 
-    username = user["username"]
-    solved = list(
-        user_solved_col(username)
-        .find({}, {"_id": 0, "slug": 1, "title": 1})
-        .sort("archived_at", -1)
-        .limit(15)
-    )
+    solved = recent_solved(user, REVIEW_LIMIT)
 
     if not solved:
         return jsonify([])
@@ -69,37 +50,7 @@ def review_today():
 
     master_docs = {
         p["_id"]: p
-        for p in problems_master.find(
-            {"_id": {"$in": slugs}},
-            {
-                "_id": 1,
-                "title": 1,
-                "difficulty": 1,
-                "acRate": 1,
-                "topics": 1,
-                "paidOnly": 1,
-                "hasSolution": 1,
-                "hasVideoSolution": 1,
-            }
-        )
+        for p in problems_master.find({"_id": {"$in": slugs}}, REVIEW_PROJECTION)
     }
 
-    results = []
-    for s in solved:
-        slug = s["slug"]
-        m = master_docs.get(slug)
-
-        results.append({
-            "slug": slug,
-            "title": m["title"] if m else s.get("title", slug),
-            "difficulty": m["difficulty"] if m else "—",
-            "acRate": m.get("acRate") if m else None,
-            "topics": m.get("topics", []) if m else [],
-            "paidOnly": m.get("paidOnly", False) if m else False,
-            "hasSolution": m.get("hasSolution", False) if m else False,
-            "hasVideoSolution": m.get("hasVideoSolution", False) if m else False,
-            "link": f"https://leetcode.com/problems/{slug}/",
-            "indexed": bool(m),
-        })
-
-    return jsonify(results)
\ No newline at end of file
+    return jsonify(review_rows(solved, master_docs))
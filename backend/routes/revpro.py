@@ -1,8 +1,19 @@
 # backend/routes/revpro.py
-from flask import Blueprint, jsonify, request
-from utils.db import solved_col, unsolved_col
+import base64
+import json
+from flask import Blueprint, jsonify, request, g
+from utils.db import problems_master
+from utils.cache import TTLCache
+from utils.errors import APIError
+from middleware.auth import require_auth
+from services.catalog import get_catalog_version
+from services.solved_cache import get_solved_set
 
-problems_bp = Blueprint("problems", __name__, url_prefix="/api/problems")
+revpro_bp = Blueprint("revpro", __name__, url_prefix="/api/problems")
+
+# Total counts per filter signature; cheap to be slightly stale
+COUNT_CACHE_TTL = 300
+_count_cache = TTLCache(maxsize=4096, ttl=COUNT_CACHE_TTL)
 
 
 # ---------------------------------------------------------
@@ -15,35 +26,102 @@ def parse_int(value, default):
         return default
 
 
+# ---------------------------------------------------------
+# Helper: opaque keyset cursor = last (sort value, _id) seen
+# ---------------------------------------------------------
+def encode_cursor(value, last_id):
+    raw = json.dumps([value, last_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """(sort value, last _id) from a cursor; anything but [scalar or null, str] is rejected."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        decoded = json.loads(raw)
+    except ValueError:
+        raise APIError("Invalid cursor", 400)
+
+    # Both values go into the query, so operator documents must never get through
+    if not isinstance(decoded, list) or len(decoded) != 2:
+        raise APIError("Invalid cursor", 400)
+    value, last_id = decoded
+    if isinstance(value, bool) or not isinstance(value, (str, int, float, type(None))):
+        raise APIError("Invalid cursor", 400)
+    if not isinstance(last_id, str):
+        raise APIError("Invalid cursor", 400)
+
+    return value, last_id
+
+
+def keyset_filter(field, order, value, last_id):
+    """Documents strictly after (value, last_id) in (field, _id) order; nulls sort lowest."""
+    if order == 1:
+        if value is None:
+            return {"$or": [
+                {field: None, "_id": {"$gt": last_id}},
+                {field: {"$ne": None}},
+            ]}
+        return {"$or": [
+            {field: {"$gt": value}},
+            {field: value, "_id": {"$gt": last_id}},
+        ]}
+
+    if value is None:
+        return {field: None, "_id": {"$lt": last_id}}
+    return {"$or": [
+        {field: {"$lt": value}},
+        {field: value, "_id": {"$lt": last_id}},
+        {field: None},
+    ]}
+
+
+def cached_count(query, signature):
+    """count_documents for `query`, cached under `signature`."""
+    total = _count_cache.get(signature)
+    if total is None:
+        if query:
+            total = problems_master.count_documents(query)
+        else:
+            total = problems_master.estimated_document_count()
+        _count_cache.set(signature, total)
+    return total
+
+
 # ---------------------------------------------------------
 # GET /api/problems
 # Unified, powerful problems explorer
 # ---------------------------------------------------------
-@problems_bp.route("", methods=["GET"])
+@revpro_bp.route("", methods=["GET"])
+@require_auth
 def list_problems():
     """
     Query params:
-    - solved=true|false
+    - solved=true|false|all
     - topic=graphs
     - difficulty=Easy|Medium|Hard
     - min_ac=0..100
     - max_ac=0..100
-    - sort=acRate|num_occur|title
+    - sort=acRate|num_occur|title|difficulty
     - order=asc|desc
-    - page=1
     - limit=50
+    - cursor=<meta.next_cursor of the previous page>
     """
 
-    # ---------- Source selection ----------
-    solved = request.args.get("solved", "true").lower() == "true"
-    col = solved_col if solved else unsolved_col
+    # ---------- Solved overlay ----------
+    solved_filter = request.args.get("solved", "true").lower()
+    if solved_filter not in ("true", "false"):
+        solved_filter = "all"
+
+    user = g.user
+    solved = get_solved_set(user)
 
     # ---------- Filters ----------
     query = {}
 
     topic = request.args.get("topic")
     if topic:
-        query["all_topics"] = {"$in": [topic]}
+        query["topics"] = topic.lower()
 
     difficulty = request.args.get("difficulty")
     if difficulty:
@@ -54,6 +132,11 @@ def list_problems():
     if min_ac > 0 or max_ac < 100:
         query["acRate"] = {"$gte": min_ac, "$lte": max_ac}
 
+    if solved_filter == "true":
+        query["_id"] = {"$in": sorted(solved)}
+    elif solved_filter == "false":
+        query["_id"] = {"$nin": sorted(solved)}
+
     # ---------- Sorting ----------
     sort_field = request.args.get("sort", "title")
     order = -1 if request.args.get("order") == "desc" else 1
@@ -63,41 +146,76 @@ def list_problems():
         sort_field = "title"
 
     # ---------- Pagination ----------
-    page = max(parse_int(request.args.get("page"), 1), 1)
-    limit = min(parse_int(request.args.get("limit"), 50), 100)
-    skip = (page - 1) * limit
+    limit = max(min(parse_int(request.args.get("limit"), 50), 100), 1)
+
+    page_query = query
+    cursor = request.args.get("cursor")
+    if cursor:
+        value, last_id = decode_cursor(cursor)
+        page_query = {"$and": [query, keyset_filter(sort_field, order, value, last_id)]}
 
     # ---------- Projection ----------
     projection = {
-        "_id": 0,
+        "_id": 1,
         "title": 1,
         "difficulty": 1,
-        "all_topics": 1,
+        "topics": 1,
         "companies": 1,
-        "link": 1,
         "num_occur": 1,
         "acRate": 1,
     }
 
     # ---------- Query execution ----------
-    cursor = (
-        col.find(query, projection)
-        .sort(sort_field, order)
-        .skip(skip)
-        .limit(limit)
+    docs = list(
+        problems_master.find(page_query, projection)
+        .sort([(sort_field, order), ("_id", order)])
+        .limit(limit + 1)
     )
 
-    problems = list(cursor)
-    total = col.count_documents(query)
+    has_more = len(docs) > limit
+    docs = docs[:limit]
+
+    next_cursor = None
+    if has_more:
+        last = docs[-1]
+        next_cursor = encode_cursor(last.get(sort_field), last["_id"])
+
+    # ---------- Total (cached per filter signature) ----------
+    signature = (
+        get_catalog_version(),
+        topic and topic.lower(),
+        difficulty and difficulty.capitalize(),
+        min_ac,
+        max_ac,
+        solved_filter,
+        # the solved overlay makes the count user-specific
+        None if solved_filter == "all" else (str(user["_id"]), user.get("solved_version", 0)),
+    )
+    total = cached_count(query, signature)
+
+    problems = []
+    for p in docs:
+        slug = p["_id"]
+        problems.append({
+            "slug": slug,
+            "title": p.get("title"),
+            "difficulty": p.get("difficulty"),
+            "topics": p.get("topics", []),
+            "companies": p.get("companies", []),
+            "num_occur": p.get("num_occur", 0),
+            "acRate": p.get("acRate"),
+            "is_solved": slug in solved,
+            "link": f"https://leetcode.com/problems/{slug}/",
+        })
 
     # ---------- Response ----------
     return jsonify({
         "meta": {
-            "page": page,
             "limit": limit,
             "total": total,
             "returned": len(problems),
-            "solved": solved
+            "solved": solved_filter,
+            "next_cursor": next_cursor,
         },
         "filters": {
             "topic": topic,
@@ -1,52 +1,70 @@
 import time
-from flask import Blueprint, request, jsonify
-from utils.db import users_col
-from services.leetcode_client import LeetCodeClient
-from routes.ingest_user import archive_solved_problems
+from flask import Blueprint, request, jsonify, g
+from utils.db import users_col, jobs_col
+from utils.crypto import encrypt_credential
+from middleware.auth import require_auth
+from services.jobs import enqueue
+from services.user_cache import invalidate_user
+from services.ingestion import INGEST_JOB, FULL_SYNC
+from bson import ObjectId
+from bson.errors import InvalidId
 
 user_bp = Blueprint("user", __name__)
 
+def serialize_job(job):
+    return {
+        "id": str(job["_id"]),
+        "kind": job["kind"],
+        "status": job["status"],
+        "attempts": job["attempts"],
+        "progress": job.get("progress"),
+        "error": job.get("error"),
+        "created_at": job.get("created_at"),
+        "started_at": job.get("started_at"),
+        "finished_at": job.get("finished_at"),
+    }
+
 @user_bp.route("/api/user/init", methods=["POST"])
+@require_auth
 def init_user():
-    data = request.get_json()
-    username = data["username"]
-    lc_user = data["leetcode_username"]
-
-    users_col.update_one(
-        {"_id": username},
-        {"$set": {
-            "leetcode_username": lc_user,
-            "ingestion_status": "ingesting",
-            "last_ingested_at": None,
-            "created_at": time.time()
-        }},
-        upsert=True
-    )
+    """Store LeetCode credentials (optional) and queue a solved-problem ingestion."""
+    data = request.get_json(silent=True) or {}
+    user_id = ObjectId(g.user_id)
+
+    updates = {"updated_at": time.time()}
+    if data.get("leetcode_username"):
+        updates["leetcode_username"] = data["leetcode_username"].strip()
+    if data.get("session"):
+        updates["leetcode_session_encrypted"] = encrypt_credential(data["session"].strip())
+    if data.get("csrftoken"):
+        updates["leetcode_csrf_encrypted"] = encrypt_credential(data["csrftoken"].strip())
 
-    client = LeetCodeClient(
-        session=data["session"],
-        csrf=data["csrftoken"]
+    result = users_col.update_one({"_id": user_id}, {"$set": updates})
+    if not result.matched_count:
+        return jsonify({"error": "User not found"}), 404
+    invalidate_user(user_id)
+
+    job = enqueue(
+        INGEST_JOB,
+        {
+            "mode": FULL_SYNC if data.get("full") else None,
+            "batch_size": data.get("batch_size"),
+        },
+        user_id=user_id,
     )
 
-    # Store client temporarily
-    from flask import current_app
-    current_app.config["LC_CLIENT"] = client
+    return jsonify({"status": "queued", "job": serialize_job(job)}), 202
 
+@user_bp.route("/api/user/jobs/<job_id>", methods=["GET"])
+@require_auth
+def job_status(job_id):
+    """Progress of one of the current user's jobs."""
     try:
-        archive_solved_problems(username)
-
-        users_col.update_one(
-            {"_id": username},
-            {"$set": {
-                "ingestion_status": "ready",
-                "last_ingested_at": time.time()
-            }}
-        )
-    except Exception:
-        users_col.update_one(
-            {"_id": username},
-            {"$set": {"ingestion_status": "error"}}
-        )
-        return jsonify({"status": "error"}), 500
-
-    return jsonify({"status": "ok"})
+        job = jobs_col.find_one({"_id": ObjectId(job_id), "user_id": ObjectId(g.user_id)})
+    except InvalidId:
+        job = None
+
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+
+    return jsonify(serialize_job(job))
@@ -0,0 +1,84 @@
+"""
+bcrypt calibration: hash throughput per core and across the pool for each cost factor.
+
+For every cost factor this times hashes on one core, then the same work
+spread over N worker processes, and reports the latency of a single login
+and how many logins per second one web process can absorb. Use it to pick
+BCRYPT_ROUNDS (aim for ~250ms per hash) and BCRYPT_WORKERS.
+
+Usage:
+    python scripts/bench_bcrypt.py [--costs 10 11 12 13] [--workers 4] [--hashes 8]
+"""
+
+import sys
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path so we can import from services
+sys.path.append(str(Path(__file__).parent.parent))
+
+from services.passwords import _hash, START_METHOD
+
+PASSWORD = b"calibration-password"
+
+
+def time_serial(cost, hashes):
+    started = time.perf_counter()
+    for _ in range(hashes):
+        _hash(PASSWORD, cost)
+    return time.perf_counter() - started
+
+
+def time_pool(pool, cost, hashes):
+    started = time.perf_counter()
+    list(pool.map(_hash, [PASSWORD] * hashes, [cost] * hashes))
+    return time.perf_counter() - started
+
+
+def main(costs, workers, hashes):
+    print("=" * 60)
+    print("LeetCode Tracker - bcrypt Calibration")
+    print("=" * 60)
+    print(f"{os.cpu_count()} CPU(s), pool of {workers} worker(s), {hashes} hash(es) per core")
+    print()
+    print(f"{'cost':>4}  {'ms/hash':>8}  {'hash/s/core':>11}  {'hash/s pool':>11}  {'scaling':>7}")
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(START_METHOD)) as pool:
+        # warm the workers so process start-up is not timed
+        list(pool.map(_hash, [PASSWORD] * workers, [4] * workers))
+
+        for cost in costs:
+            serial = time_serial(cost, hashes)
+            per_core = hashes / serial
+            pooled = (hashes * workers) / time_pool(pool, cost, hashes * workers)
+
+            results.append({
+                "cost": cost,
+                "ms_per_hash": 1000 * serial / hashes,
+                "per_core": per_core,
+                "pool": pooled,
+            })
+            print(
+                f"{cost:>4}  {1000 * serial / hashes:>8.1f}  {per_core:>11.2f}  "
+                f"{pooled:>11.2f}  {pooled / per_core:>6.2f}x"
+            )
+
+    print()
+    print("Logins/second per web process ≈ 'hash/s pool'; set BCRYPT_MAX_PENDING to")
+    print("about that number times the latency you are willing to queue for (seconds).")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--costs", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--hashes", type=int, default=8, help="Hashes per core for each cost factor")
+    args = parser.parse_args()
+
+    main(args.costs, args.workers, args.hashes)
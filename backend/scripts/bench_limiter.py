@@ -0,0 +1,94 @@
+"""
+Rate limiter storage benchmark: per-check overhead and cross-process enforcement.
+
+Times limiter.hit() against memory:// and the shared mmap:// storage for the
+fixed-window and sliding-window-counter strategies, then has several
+processes hit one key concurrently to show how many requests each storage
+lets through for a single limit.
+
+Usage:
+    python scripts/bench_limiter.py [--checks 100000] [--processes 4] [--limit 50]
+"""
+
+import sys
+import argparse
+import os
+import tempfile
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+# Add parent directory to path so we can import from utils
+sys.path.append(str(Path(__file__).parent.parent))
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, SlidingWindowCounterRateLimiter
+import utils.limiter_storage  # registers mmap://
+
+STRATEGIES = {
+    "fixed-window": FixedWindowRateLimiter,
+    "sliding-window-counter": SlidingWindowCounterRateLimiter,
+}
+
+
+def time_checks(uri, strategy, checks):
+    """Microseconds per hit() over `checks` hits spread across 1000 keys."""
+    limiter = STRATEGIES[strategy](storage_from_string(uri))
+    item = parse("1000000 per minute")
+
+    started = time.perf_counter()
+    for i in range(checks):
+        limiter.hit(item, "bench", str(i % 1000))
+    return 1e6 * (time.perf_counter() - started) / checks
+
+
+def _hammer(args):
+    uri, strategy, limit, attempts = args
+    limiter = STRATEGIES[strategy](storage_from_string(uri))
+    item = parse(f"{limit} per minute")
+    return sum(limiter.hit(item, "login", "203.0.113.7") for _ in range(attempts))
+
+
+def accepted_across_processes(uri, strategy, processes, limit):
+    """Total hits accepted when `processes` processes each try 2*limit times."""
+    with Pool(processes) as pool:
+        return sum(pool.map(_hammer, [(uri, strategy, limit, 2 * limit)] * processes))
+
+
+def main(checks, processes, limit):
+    print("=" * 60)
+    print("LeetCode Tracker - Rate Limiter Storage Benchmark")
+    print("=" * 60)
+
+    tmp = tempfile.mkdtemp()
+
+    print(f"{'storage':>8}  {'strategy':>24}  {'us/check':>9}  {'accepted':>8}  {'limit':>5}")
+    for name in ("memory", "mmap"):
+        for strategy in STRATEGIES:
+            uri = "memory://" if name == "memory" else f"mmap://{tmp}/{strategy}.bin"
+            per_check = time_checks(uri, strategy, checks)
+
+            # fresh table so the enforcement run starts from zero
+            if name == "mmap":
+                uri = f"mmap://{tmp}/{strategy}-shared.bin"
+            accepted = accepted_across_processes(uri, strategy, processes, limit)
+
+            print(f"{name:>8}  {strategy:>24}  {per_check:>9.2f}  {accepted:>8}  {limit:>5}")
+
+    print()
+    print(f"'accepted' is summed over {processes} processes; a shared storage keeps it at the limit.")
+
+    for f in os.listdir(tmp):
+        os.remove(os.path.join(tmp, f))
+    os.rmdir(tmp)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--checks", type=int, default=100000)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    main(args.checks, args.processes, args.limit)
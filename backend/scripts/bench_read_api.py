@@ -0,0 +1,301 @@
+"""
+Read API benchmark on a synthetic catalog.
+
+Seeds a MongoDB stand-in (mongomock, or a real server with --mongo-uri) with
+scripts/synthetic_catalog.py data, then times the read routes through the
+Flask test client:
+
+    top_companies     GET  /api/companies/top
+    company_problems  GET  /api/companies/<company>
+    smart_plan        POST /api/companies/<company>/smart_plan
+    search            GET  /api/problems/search?topic=&difficulty=
+    review_today      GET  /api/review/today
+    summary           GET  /api/summary
+
+Requests rotate through the active users; companies and topics are picked
+by popularity. Each route gets a warmup pass (one request per active user
+by default, which fills the per-process caches) before it is measured, so
+the numbers are steady-state; --warmup 0 measures first requests too,
+e.g. the one-off solved_count backfill of --legacy-share users. Results
+are written as JSON; pass an earlier result file as --baseline to print
+the change per route.
+
+mongomock is a test dependency only (pip install mongomock). Its absolute
+numbers are much slower than a real server and scale with collection size
+rather than indexes, so compare runs on the same backend. With --mongo-uri
+the data goes to a separate database (--db-name), which is dropped first.
+
+Usage:
+    python scripts/bench_read_api.py [--requests 200] [--active-users 100]
+        [--legacy-share 0.3] [--routes summary,search] [--output bench.json] [--baseline old.json]
+        [--mongo-uri mongodb://localhost:27017]
+"""
+
+import sys
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add parent directory to path so we can import from utils
+sys.path.append(str(Path(__file__).parent.parent))
+
+ROUTES = ["top_companies", "company_problems", "smart_plan", "search", "review_today", "summary"]
+PERCENTILES = (50, 90, 95, 99)
+
+
+def configure_environment(mongo_uri, db_name):
+    """Settings for the app import: a separate database and no rate limits."""
+    os.environ["DB_NAME"] = db_name
+    os.environ["RATELIMIT_STORAGE_URI"] = "memory://"
+    os.environ.setdefault("JWT_SECRET_KEY", "bench-jwt-secret-for-synthetic-data-only")
+    os.environ.setdefault("JWT_REFRESH_SECRET_KEY", "bench-jwt-refresh-secret-for-synthetic-data-only")
+
+    if mongo_uri:
+        os.environ["MONGO_URI"] = mongo_uri
+        return "mongodb"
+
+    try:
+        import mongomock
+    except ImportError:
+        sys.exit("mongomock is not installed (pip install mongomock), or pass --mongo-uri")
+
+    import utils.db
+    utils.db.MongoClient = mongomock.MongoClient
+    return "mongomock"
+
+
+def build_requests(route, count, users, companies, company_weights, topics, topic_weights, rng):
+    """[(user index, method, path, json body)] for one route, reproducible from rng."""
+    requests = []
+    for i in range(count):
+        user = i % len(users)
+        if route == "top_companies":
+            requests.append((user, "GET", "/api/companies/top", None))
+        elif route == "company_problems":
+            company = rng.choices(companies, company_weights)[0]
+            requests.append((user, "GET", f"/api/companies/{company}", None))
+        elif route == "smart_plan":
+            company = rng.choices(companies, company_weights)[0]
+            body = {"num": 10, "difficulties": ["Easy", "Medium", "Hard"]}
+            requests.append((user, "POST", f"/api/companies/{company}/smart_plan", body))
+        elif route == "search":
+            topic = rng.choices(topics, topic_weights)[0]
+            difficulty = rng.choice(["", "easy", "medium", "hard"])
+            requests.append((user, "GET", f"/api/problems/search?topic={topic}&difficulty={difficulty}", None))
+        elif route == "review_today":
+            requests.append((user, "GET", "/api/review/today", None))
+        elif route == "summary":
+            requests.append((user, "GET", "/api/summary", None))
+    return requests
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-p * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def run_route(client, headers, requests):
+    latencies = []
+    statuses = {}
+
+    started = time.perf_counter()
+    for user, method, path, body in requests:
+        t0 = time.perf_counter()
+        response = client.open(path, method=method, headers=headers[user], json=body)
+        response.get_data()
+        latencies.append(time.perf_counter() - t0)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+    elapsed = time.perf_counter() - started
+
+    latencies_ms = sorted(1000 * s for s in latencies)
+    return {
+        "requests": len(requests),
+        "errors": sum(n for status, n in statuses.items() if status >= 400),
+        "statuses": {str(status): n for status, n in sorted(statuses.items())},
+        "seconds": round(elapsed, 4),
+        "throughput_rps": round(len(requests) / elapsed, 2) if elapsed else None,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies_ms), 3) if latencies_ms else None,
+            **{f"p{p}": round(percentile(latencies_ms, p), 3) for p in PERCENTILES if latencies_ms},
+            "max": round(latencies_ms[-1], 3) if latencies_ms else None,
+        },
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    """Print throughput and p50/p95 change per route against a baseline result."""
+    print()
+    print(f"Compared to {baseline.get('git_commit') or 'baseline'} ({baseline.get('created_at')}):")
+    if baseline.get("config") != results["config"] or baseline.get("environment") != results["environment"]:
+        print("(warning: the baseline was run with a different configuration or environment)")
+    print(f"{'route':>18}  {'rps':>8}  {'p50':>8}  {'p95':>8}")
+    for route, current in results["routes"].items():
+        before = baseline.get("routes", {}).get(route)
+        if not before:
+            continue
+
+        def change(now, then):
+            if not now or not then:
+                return "n/a"
+            return f"{100 * (now - then) / then:+.1f}%"
+
+        print(
+            f"{route:>18}  "
+            f"{change(current['throughput_rps'], before['throughput_rps']):>8}  "
+            f"{change(current['latency_ms']['p50'], before['latency_ms']['p50']):>8}  "
+            f"{change(current['latency_ms']['p95'], before['latency_ms']['p95']):>8}"
+        )
+
+
+def main(args):
+    backend = configure_environment(args.mongo_uri, args.db_name)
+
+    from scripts.synthetic_catalog import seed, company_names, TOPICS
+    from routes.auth import create_access_token
+    from services.catalog import get_catalog_stats
+    from app import app, limiter
+
+    limiter.enabled = False
+
+    routes = args.routes.split(",") if args.routes else ROUTES
+    unknown = [r for r in routes if r not in ROUTES]
+    if unknown:
+        sys.exit(f"Unknown route(s) {', '.join(unknown)}; choose from {', '.join(ROUTES)}")
+
+    print("=" * 60)
+    print("LeetCode Tracker - Read API Benchmark")
+    print("=" * 60)
+
+    if args.mongo_uri:
+        from utils.db import get_client
+        get_client().drop_database(args.db_name)
+
+    started = time.perf_counter()
+    users = seed(
+        num_problems=args.problems,
+        num_companies=args.companies,
+        num_users=args.users,
+        active_users=args.active_users,
+        legacy_share=args.legacy_share,
+        seed=args.seed,
+    )
+    seed_seconds = time.perf_counter() - started
+    legacy = sum(1 for u in users if "solved_store" not in u)
+    print(f"Seeded {args.problems} problems, {args.companies} companies, {args.users} users "
+          f"({len(users)} active, {legacy} of them legacy) on {backend} in {seed_seconds:.1f}s")
+
+    if args.mongo_uri:
+        # Importing the app does not build indexes; a real server needs them
+        # (after seeding, so the legacy collections get theirs too)
+        from utils.db import create_indexes
+        create_indexes()
+
+    headers = [
+        {"Authorization": f"Bearer {create_access_token(str(u['_id']), u['email'])}"}
+        for u in users
+    ]
+
+    # Pick companies and topics the way users do: popular ones more often
+    stats = get_catalog_stats()
+    companies = company_names(args.companies)
+    company_weights = [1.0 / rank for rank in range(1, len(companies) + 1)]
+    topics = [t for t in TOPICS if t in stats["by_topic"]]
+    topic_weights = [stats["topic_weights"].get(t, 0) + 1 for t in topics]
+
+    rng = random.Random(args.seed)
+    warmup = len(users) if args.warmup is None else args.warmup
+
+    results = {
+        "benchmark": "read_api",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "environment": {
+            "backend": backend,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "config": {
+            "problems": args.problems,
+            "companies": args.companies,
+            "users": args.users,
+            "active_users": len(users),
+            "legacy_share": args.legacy_share,
+            "requests": args.requests,
+            "warmup": warmup,
+            "seed": args.seed,
+        },
+        "seed_seconds": round(seed_seconds, 2),
+        "routes": {},
+    }
+
+    client = app.test_client()
+    print(f"{'route':>18}  {'rps':>8}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}  {'errors':>6}")
+    for route in routes:
+        plan = build_requests(
+            route, warmup + args.requests, users,
+            companies, company_weights, topics, topic_weights, rng,
+        )
+        run_route(client, headers, plan[:warmup])
+        result = run_route(client, headers, plan[warmup:])
+        results["routes"][route] = result
+
+        latency = result["latency_ms"]
+        print(f"{route:>18}  {result['throughput_rps']:>8.1f}  {latency['p50']:>8.2f}  "
+              f"{latency['p95']:>8.2f}  {latency['p99']:>8.2f}  {result['errors']:>6}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    else:
+        print()
+        print(json.dumps(results, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(results, json.load(f))
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--problems", type=int, default=3500)
+    parser.add_argument("--companies", type=int, default=400)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--active-users", type=int, default=100,
+                        help="users with materialized solved rows that requests are made for")
+    parser.add_argument("--legacy-share", type=float, default=0.0,
+                        help="fraction of users seeded as pre-user_solved accounts "
+                             "(legacy collection, no solved_count)")
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per route")
+    parser.add_argument("--warmup", type=int, default=None,
+                        help="unmeasured requests per route (default: one per active user)")
+    parser.add_argument("--routes", help=f"comma-separated subset of {','.join(ROUTES)}")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON result here instead of stdout")
+    parser.add_argument("--baseline", help="earlier JSON result to compare against")
+    parser.add_argument("--mongo-uri", help="benchmark against this server instead of mongomock")
+    parser.add_argument("--db-name", default="leetcode_tracker_bench")
+    args = parser.parse_args()
+
+    main(args)
@@ -0,0 +1,40 @@
+"""
+Create the indexes declared in utils/indexes.py.
+
+The web process reconciles indexes in a background thread on boot unless
+INDEX_ON_STARTUP=off; run this once per deploy instead when workers are
+scaled out.
+
+Usage:
+    python scripts/create_indexes.py [--prune]
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path so we can import from utils
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.indexes import ensure_indexes
+
+
+def main(prune=False):
+    report = ensure_indexes(prune=prune)
+
+    for name in report["created"]:
+        print(f"  + {name}")
+    for name in report["extra"]:
+        action = "dropped" if name in report["dropped"] else "not declared, kept"
+        print(f"  ? {name} ({action})")
+
+    print(f"✓ {len(report['created'])} created, {len(report['existing'])} already present")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--prune", action="store_true", help="Drop indexes that are not declared in utils/indexes.py")
+    args = parser.parse_args()
+
+    main(args.prune)
@@ -0,0 +1,183 @@
+"""
+Index advisor: explain() every hot query shape and flag bad plans.
+
+Each shape below mirrors a query issued by a route or service. The advisor
+runs it with explain() against real sample values (a real user, company and
+topic) and reports collection scans (COLLSCAN), in-memory sorts (SORT) and
+whether projections that should be covered by an index actually are.
+Missing indexes declared in utils/indexes.py are created first.
+
+Usage:
+    python scripts/index_advisor.py [--no-create] [--prune] [--strict]
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path so we can import from utils
+sys.path.append(str(Path(__file__).parent.parent))
+
+from bson import ObjectId
+from utils.db import db, problems_master, users_col, user_solved, jobs_col, LEGACY_SOLVED_PREFIX
+from utils.indexes import ensure_indexes
+
+
+def sample_values():
+    """Real values to plug into the query shapes, falling back to placeholders."""
+    user = users_col.find_one({}, {"_id": 1, "username": 1}) or {}
+    problem = problems_master.find_one(
+        {"companies.0": {"$exists": True}, "topics.0": {"$exists": True}},
+        {"_id": 1, "companies": 1, "topics": 1},
+    ) or {}
+    legacy = next(
+        (n for n in db.list_collection_names() if n.startswith(LEGACY_SOLVED_PREFIX)),
+        None,
+    )
+
+    return {
+        "user_id": user.get("_id", ObjectId()),
+        "company": (problem.get("companies") or ["Google"])[0],
+        "topic": (problem.get("topics") or ["array"])[0],
+        "slugs": [problem.get("_id", "two-sum")],
+        "legacy": legacy,
+    }
+
+
+def query_shapes(v):
+    """
+    (name, collection, filter, projection, sort, expect) for every hot query.
+    expect: "covered" if the projection should come from the index alone,
+    "scan" for deliberate full passes (catalog rebuilds), else None.
+    """
+    shapes = [
+        ("companies.company_problems", problems_master,
+         {"companies": v["company"]},
+         {"_id": 1, "title": 1, "difficulty": 1, "topics": 1, "num_occur": 1}, None, None),
+        ("companies.smart_plan", problems_master,
+         {"_id": {"$in": v["slugs"]}},
+         {"_id": 1, "title": 1, "difficulty": 1, "topics": 1, "acRate": 1}, None, None),
+        ("problems.search", problems_master,
+         {"topics": v["topic"], "difficulty": "Medium"},
+         {"_id": 1, "id": 1, "title": 1, "difficulty": 1, "topics": 1}, None, None),
+        ("problems.review_today", user_solved,
+         {"user_id": v["user_id"]},
+         {"_id": 0, "slug": 1, "title": 1, "archived_at": 1}, [("archived_at", -1)], "covered"),
+        ("revpro.list_problems", problems_master,
+         {"difficulty": "Medium"},
+         {"_id": 1, "title": 1, "num_occur": 1}, [("num_occur", -1), ("_id", -1)], None),
+        ("revpro.list_problems[acRate]", problems_master,
+         {},
+         {"_id": 1, "acRate": 1}, [("acRate", 1), ("_id", 1)], None),
+        ("solved_store.load_solved_slugs", user_solved,
+         {"user_id": v["user_id"]},
+         {"_id": 0, "slug": 1}, None, "covered"),
+        ("readiness.question_ids", problems_master,
+         {"frontendQuestionId": {"$exists": True}},
+         {"_id": 1, "frontendQuestionId": 1}, None, "scan"),
+        ("jobs.claim", jobs_col,
+         {"status": "queued", "run_after": {"$lte": 0}},
+         None, [("run_after", 1)], None),
+        ("jobs.enqueue", jobs_col,
+         {"kind": "ingest_user", "user_id": v["user_id"], "active": True},
+         None, None, None),
+        ("company_index.build", problems_master,
+         {}, {"_id": 1, "companies": 1, "num_occur": 1}, None, "scan"),
+        ("sampling.build", problems_master,
+         {"companies.0": {"$exists": True}},
+         {"_id": 1, "companies": 1, "difficulty": 1, "num_occur": 1}, None, "scan"),
+    ]
+
+    if v["legacy"]:
+        shapes.append(
+            ("solved_store.recent_solved[legacy]", db[v["legacy"]],
+             {}, {"_id": 0, "slug": 1, "title": 1, "archived_at": 1}, [("archived_at", -1)], None)
+        )
+
+    return shapes
+
+
+def plan_stages(plan):
+    """Every stage name in a winning plan tree."""
+    if "queryPlan" in plan:  # slot-based engine wraps the classic plan
+        plan = plan["queryPlan"]
+
+    stages = [plan.get("stage")]
+    if "inputStage" in plan:
+        stages += plan_stages(plan["inputStage"])
+    for child in plan.get("inputStages", []):
+        stages += plan_stages(child)
+    return stages
+
+
+def explain_shape(col, query, projection, sort):
+    cursor = col.find(query, projection)
+    if sort:
+        cursor = cursor.sort(sort)
+    return cursor.limit(50).explain()
+
+
+def advise(shapes):
+    """Explain every shape and return (name, stages, problems) rows."""
+    rows = []
+    for name, col, query, projection, sort, expect in shapes:
+        try:
+            plan = explain_shape(col, query, projection, sort)["queryPlanner"]["winningPlan"]
+        except Exception as e:
+            rows.append((name, [], [f"explain failed: {e}"]))
+            continue
+
+        stages = plan_stages(plan)
+        problems = []
+
+        if "COLLSCAN" in stages and expect != "scan":
+            problems.append("COLLSCAN")
+        if "SORT" in stages:
+            problems.append("in-memory SORT")
+        if expect == "covered" and "FETCH" in stages:
+            problems.append("not covered (FETCH)")
+
+        rows.append((name, stages, problems))
+    return rows
+
+
+def main(create=True, prune=False):
+    print("=" * 60)
+    print("LeetCode Tracker - Index Advisor")
+    print("=" * 60)
+
+    if create or prune:
+        report = ensure_indexes(prune=prune)
+        print(f"Created {len(report['created'])} index(es), {len(report['existing'])} already present")
+        for name in report["created"]:
+            print(f"  + {name}")
+        for name in report["extra"]:
+            action = "dropped" if name in report["dropped"] else "not declared"
+            print(f"  ? {name} ({action})")
+        print()
+
+    rows = advise(query_shapes(sample_values()))
+    flagged = 0
+    for name, stages, problems in rows:
+        mark = "⚠" if problems else "✓"
+        plan = " <- ".join(s for s in stages if s)
+        print(f"{mark} {name:40} {plan}")
+        for problem in problems:
+            print(f"    {problem}")
+        flagged += bool(problems)
+
+    print()
+    print(f"{flagged}/{len(rows)} query shape(s) flagged")
+    return flagged
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--no-create", action="store_true", help="Only explain; do not create missing indexes")
+    parser.add_argument("--prune", action="store_true", help="Drop indexes that are not declared in utils/indexes.py")
+    parser.add_argument("--strict", action="store_true", help="Exit non-zero if any query shape is flagged")
+    args = parser.parse_args()
+
+    flagged = main(create=not args.no_create, prune=args.prune)
+    if args.strict and flagged:
+        sys.exit(1)
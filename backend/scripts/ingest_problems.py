@@ -1,8 +1,14 @@
 # backend/scripts/ingest_problems.py
 
+import hashlib
+import json
 from datetime import datetime
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 from utils.db import db
 from services.leetcode_client import make_leetcode_request
+from services.catalog import publish_catalog_version, rebuild_catalog_stats
+from services.company_index import build_company_index
 
 problems_col = db["problems_master"]
 
@@ -34,61 +40,137 @@ query problemsetQuestionList($limit: Int!, $skip: Int!) {
 """
 
 BATCH_SIZE = 100
+WRITE_BATCH_SIZE = 500
 
-def ingest_all_problems():
+# Filled by CSV enrichment, never by the LeetCode sync
+ENRICHMENT_DEFAULTS = {
+    "companies": [],
+    "by_company": {},
+    "num_occur": 0,
+}
+
+
+def build_doc(q):
+    return {
+        "_id": q["titleSlug"],   # PRIMARY KEY
+        "frontendQuestionId": int(q["frontendQuestionId"]),
+        "title": q["title"],
+        "difficulty": q["difficulty"],
+        "acRate": round(q["acRate"], 2),
+        "paidOnly": q["paidOnly"],
+        "hasSolution": q["hasSolution"],
+        "hasVideoSolution": q["hasVideoSolution"],
+
+        # FAST FILTERING
+        "topics": [t["slug"] for t in q["topicTags"]],
+
+        # UI / analytics
+        "topic_meta": q["topicTags"],
+    }
+
+
+def content_hash(doc):
+    """Stable hash of the LeetCode-sourced fields of a problem doc."""
+    payload = json.dumps(doc, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def flush_writes(ops, stats):
+    if not ops:
+        return
+
+    try:
+        problems_col.bulk_write(ops, ordered=False)
+        stats["changed"] += len(ops)
+    except BulkWriteError as e:
+        failed = len(e.details.get("writeErrors", []))
+        stats["changed"] += len(ops) - failed
+        stats["failed"] += failed
+        print(f"Bulk write error: {failed} document(s) failed")
+
+    ops.clear()
+
+
+def ingest_all_problems(write_batch_size=WRITE_BATCH_SIZE):
     skip = 0
     total = None
-    inserted = 0
+    stats = {"fetched": 0, "changed": 0, "unchanged": 0, "failed": 0}
 
     print("Starting LeetCode problem ingestion...")
 
+    # Hashes of what is already stored, so unchanged problems are never rewritten
+    known = {
+        d["_id"]: d.get("content_hash")
+        for d in problems_col.find({}, {"_id": 1, "content_hash": 1})
+    }
+
+    ops = []
+
     while total is None or skip < total:
-        data = make_leetcode_request(
-            PROBLEMSET_QUERY,
-            {"limit": BATCH_SIZE, "skip": skip}
-        )
+        try:
+            data = make_leetcode_request(
+                PROBLEMSET_QUERY,
+                {"limit": BATCH_SIZE, "skip": skip}
+            )
+        except Exception as e:
+            print(f"Fetch failed at skip={skip}: {e}")
+            break
 
         plist = data["problemsetQuestionList"]
         total = plist["total"]
         questions = plist["questions"]
 
         for q in questions:
-            doc = {
-                "_id": q["titleSlug"],   # PRIMARY KEY
-                "frontendQuestionId": int(q["frontendQuestionId"]),
-                "title": q["title"],
-                "difficulty": q["difficulty"],
-                "acRate": round(q["acRate"], 2),
-                "paidOnly": q["paidOnly"],
-                "hasSolution": q["hasSolution"],
-                "hasVideoSolution": q["hasVideoSolution"],
-
-                # FAST FILTERING
-                "topics": [t["slug"] for t in q["topicTags"]],
-
-                # UI / analytics
-                "topic_meta": q["topicTags"],
-
-                # CSV enrichment fields (empty for now)
-                "companies": [],
-                "by_company": {},
-                "num_occur": 0,
-
-                "last_updated": datetime.utcnow()
-            }
-
-            problems_col.update_one(
+            stats["fetched"] += 1
+
+            try:
+                doc = build_doc(q)
+            except (KeyError, TypeError, ValueError):
+                stats["failed"] += 1
+                continue
+
+            digest = content_hash(doc)
+            if known.get(doc["_id"]) == digest:
+                stats["unchanged"] += 1
+                continue
+
+            ops.append(UpdateOne(
                 {"_id": doc["_id"]},
-                {"$set": doc},
+                {
+                    "$set": {
+                        **doc,
+                        "content_hash": digest,
+                        "last_updated": datetime.utcnow(),
+                    },
+                    "$setOnInsert": ENRICHMENT_DEFAULTS,
+                },
                 upsert=True
-            )
+            ))
 
-            inserted += 1
+            if len(ops) >= write_batch_size:
+                flush_writes(ops, stats)
 
         skip += BATCH_SIZE
-        print(f"Synced {min(skip, total)} / {total}")
+        print(f"Fetched {min(skip, total)} / {total}")
+
+    flush_writes(ops, stats)
+
+    print(
+        f"Done. fetched={stats['fetched']} changed={stats['changed']} "
+        f"unchanged={stats['unchanged']} failed={stats['failed']}"
+    )
+
+    # problems_master changed: persist derived catalog data, then publish the version
+    if stats["changed"]:
+        publish_catalog_version(rebuild_derived)
+
+    return stats
+
 
-    print(f"Done. Total problems synced: {inserted}")
+def rebuild_derived(version):
+    """Persist the company index and catalog stats for `version` (see publish_catalog_version)."""
+    build_company_index(version)
+    rebuild_catalog_stats(version)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,163 @@
+"""
+Migration script: move per-user archive_solved_{username} collections into
+the shared user_solved collection.
+
+Each legacy collection is streamed in batches and written with unordered
+bulk upserts keyed by (user_id, slug). Rows already present in user_solved
+win, so the script can be re-run safely while ingestion keeps writing.
+Once a user's collection has been copied, the user is flagged with
+solved_store="shared" and routes stop reading the legacy collection.
+Users that never had a legacy collection are flagged as well, so they stop
+paying for a read of an empty one on every request.
+
+Usage:
+    python scripts/migrate_user_solved.py [--user USERNAME] [--batch-size 1000] [--drop-legacy]
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import from utils
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pymongo import UpdateOne
+from utils.db import db, users_col, user_solved, user_solved_col, LEGACY_SOLVED_PREFIX, create_indexes
+from utils.slugs import extract_slug
+from services.solved_store import SHARED_STORE, bump_solved_version
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def legacy_usernames():
+    """Usernames that still have an archive_solved_{username} collection."""
+    return sorted(
+        name[len(LEGACY_SOLVED_PREFIX):]
+        for name in db.list_collection_names()
+        if name.startswith(LEGACY_SOLVED_PREFIX)
+    )
+
+
+def _flush(ops, stats):
+    if not ops:
+        return
+    result = user_solved.bulk_write(ops, ordered=False)
+    stats["inserted"] += result.upserted_count
+    stats["existing"] += result.matched_count
+    ops.clear()
+
+
+def migrate_user(username, batch_size=DEFAULT_BATCH_SIZE, drop_legacy=False):
+    """Copy one legacy collection into user_solved. Returns per-user stats."""
+    stats = {"read": 0, "inserted": 0, "existing": 0, "skipped": 0}
+
+    user = users_col.find_one({"username": username})
+    if not user:
+        print(f"⚠ No user account for '{username}', skipping")
+        return None
+
+    legacy_col = user_solved_col(username)
+    now = time.time()
+    ops = []
+
+    for doc in legacy_col.find({}, batch_size=batch_size):
+        stats["read"] += 1
+
+        slug = extract_slug(doc)
+        if not slug:
+            stats["skipped"] += 1
+            continue
+
+        ops.append(UpdateOne(
+            {"user_id": user["_id"], "slug": slug},
+            {"$setOnInsert": {
+                "title": doc.get("title", slug),
+                "archived_at": doc.get("archived_at") or doc.get("updated_at") or now,
+                "updated_at": doc.get("updated_at") or now,
+            }},
+            upsert=True,
+        ))
+
+        if len(ops) >= batch_size:
+            _flush(ops, stats)
+
+    _flush(ops, stats)
+
+    users_col.update_one(
+        {"_id": user["_id"]},
+        {"$set": {
+            "solved_store": SHARED_STORE,
+            "solved_migrated_at": time.time(),
+            "solved_count": user_solved.count_documents({"user_id": user["_id"]}),
+        }}
+    )
+    bump_solved_version(user["_id"])
+
+    if drop_legacy:
+        legacy_col.drop()
+
+    print(
+        f"✓ {username}: read {stats['read']}, inserted {stats['inserted']}, "
+        f"already present {stats['existing']}, skipped {stats['skipped']}"
+    )
+    return stats
+
+
+def mark_users_without_legacy(legacy):
+    """Flag users without a legacy collection as migrated. Returns how many were flagged."""
+    flagged = 0
+    for user in users_col.find({"solved_store": {"$ne": SHARED_STORE}}, {"username": 1}):
+        if user.get("username") in legacy:
+            continue
+
+        users_col.update_one(
+            {"_id": user["_id"], "solved_store": {"$ne": SHARED_STORE}},
+            {"$set": {
+                "solved_store": SHARED_STORE,
+                "solved_migrated_at": time.time(),
+                "solved_count": user_solved.count_documents({"user_id": user["_id"]}),
+            }}
+        )
+        bump_solved_version(user["_id"])
+        flagged += 1
+
+    return flagged
+
+
+def migrate(usernames=None, batch_size=DEFAULT_BATCH_SIZE, drop_legacy=False):
+    print("=" * 60)
+    print("LeetCode Tracker - user_solved Migration")
+    print("=" * 60)
+
+    # The unique (user_id, slug) index must exist before bulk upserts
+    create_indexes()
+
+    if not usernames:
+        usernames = legacy_usernames()
+        flagged = mark_users_without_legacy(set(usernames))
+        print(f"✓ Flagged {flagged} user(s) without a legacy collection as migrated")
+
+    print(f"{len(usernames)} legacy collection(s) to migrate")
+    print()
+
+    migrated = 0
+    for username in usernames:
+        if migrate_user(username, batch_size, drop_legacy) is not None:
+            migrated += 1
+
+    print()
+    print(f"✓ Migrated {migrated}/{len(usernames)} user(s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user", action="append", help="Only migrate this username (repeatable)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--drop-legacy", action="store_true", help="Drop each legacy collection once copied")
+    args = parser.parse_args()
+
+    try:
+        migrate(args.user, args.batch_size, args.drop_legacy)
+    except KeyboardInterrupt:
+        print("\n\nMigration cancelled by user.")
@@ -0,0 +1,83 @@
+"""
+Re-encrypt stored LeetCode credentials with the primary encryption key.
+
+Set ENCRYPTION_KEYS=new_key,old_key, run this script, then remove the old
+key. Values already encrypted with the new key are rewritten too (Fernet
+tokens carry a timestamp), which is harmless.
+
+Each update only applies if the user's credentials are still the ones that
+were read, so credentials stored concurrently (POST /api/user/init, which
+encrypts with the primary key already) are never overwritten with the
+re-encrypted old ones; those users are reported as changed.
+
+Usage:
+    python scripts/rotate_encryption_key.py [--batch-size 500]
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path so we can import from utils
+sys.path.append(str(Path(__file__).parent.parent))
+
+from cryptography.fernet import InvalidToken
+from pymongo import UpdateOne
+from utils.db import users_col
+from utils.crypto import rotate_credential, SESSION_FIELD, CSRF_FIELD
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def flush(ops, stats):
+    if not ops:
+        return
+    result = users_col.bulk_write(ops, ordered=False)
+    stats["rotated"] += result.matched_count
+    stats["changed"] += len(ops) - result.matched_count
+    ops.clear()
+
+
+def rotate(batch_size=DEFAULT_BATCH_SIZE):
+    print("=" * 60)
+    print("LeetCode Tracker - Credential Key Rotation")
+    print("=" * 60)
+
+    stats = {"rotated": 0, "changed": 0, "failed": 0}
+    ops = []
+
+    cursor = users_col.find(
+        {"$or": [{SESSION_FIELD: {"$nin": [None, ""]}}, {CSRF_FIELD: {"$nin": [None, ""]}}]},
+        {SESSION_FIELD: 1, CSRF_FIELD: 1},
+        batch_size=batch_size,
+    )
+    for user in cursor:
+        try:
+            fields = {f: rotate_credential(user.get(f)) for f in (SESSION_FIELD, CSRF_FIELD)}
+        except InvalidToken:
+            print(f"⚠ {user['_id']}: credentials not readable with any configured key")
+            stats["failed"] += 1
+            continue
+
+        # Only if the credentials were not replaced since they were read
+        current = {f: user.get(f) for f in (SESSION_FIELD, CSRF_FIELD)}
+        ops.append(UpdateOne({"_id": user["_id"], **current}, {"$set": fields}))
+
+        if len(ops) >= batch_size:
+            flush(ops, stats)
+
+    flush(ops, stats)
+
+    print(
+        f"✓ Rotated {stats['rotated']} user(s), {stats['failed']} failed, "
+        f"{stats['changed']} skipped (credentials changed during rotation)"
+    )
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    rotate(args.batch_size)
@@ -0,0 +1,30 @@
+"""
+Run background job workers outside the web process.
+
+Usage:
+    python scripts/run_workers.py [--workers 4]
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+# Add parent directory to path so we can import from utils
+sys.path.append(str(Path(__file__).parent.parent))
+
+from services.jobs import WorkerPool
+import services.ingestion  # registers the ingest_user handler
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run background job workers")
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    pool = WorkerPool(args.workers).start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("\nStopping workers...")
+        pool.stop(timeout=30)
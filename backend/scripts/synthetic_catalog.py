@@ -0,0 +1,233 @@
+"""
+Synthetic catalog and users for benchmarks.
+
+Problems go through scripts/ingest_problems.build_doc, so they have exactly
+the fields the LeetCode sync writes, plus the CSV enrichment fields
+(companies, by_company, num_occur). Company popularity follows a Zipf law
+and per-company occurrence counts are Pareto distributed, so num_occur is
+heavily skewed the way the real CSV data is: a few hundred problems carry
+most of the weight and most problems are asked by one or two companies.
+
+Every user gets a migrated user document with solved_count drawn
+log-uniformly from SOLVES_RANGE. Only the first `active_users` users get
+their solved rows materialized (weighted towards popular problems); those
+are the users benchmark requests are made for, and the other user
+documents only make the users collection realistically large.
+
+A `legacy_share` of the users look like accounts from before user_solved
+existed: no solved_store flag and no solved_count, their solves in an
+archive_solved_{username} collection, and only the most recent tenth of
+them also in user_solved. Reads for them take the dual-read and
+missing-counter paths.
+
+Everything is derived from `seed`, so two runs with the same arguments
+produce the same data.
+"""
+
+import heapq
+import math
+import random
+import time
+from bson import ObjectId
+from scripts.ingest_problems import build_doc, content_hash, rebuild_derived
+from services.catalog import publish_catalog_version
+from services.solved_store import SHARED_STORE, is_migrated
+from utils.db import problems_master, users_col, user_solved, user_solved_col
+
+TOPICS = [
+    "array", "string", "hash-table", "dynamic-programming", "math", "sorting",
+    "greedy", "depth-first-search", "binary-search", "database", "matrix",
+    "tree", "breadth-first-search", "bit-manipulation", "two-pointers",
+    "prefix-sum", "heap-priority-queue", "simulation", "binary-tree", "graph",
+    "counting", "stack", "sliding-window", "design", "enumeration",
+    "backtracking", "union-find", "linked-list", "number-theory",
+    "ordered-set", "monotonic-stack", "segment-tree", "trie", "combinatorics",
+    "bitmask", "divide-and-conquer", "queue", "recursion", "geometry",
+    "binary-indexed-tree", "memoization", "hash-function", "binary-search-tree",
+    "shortest-path", "string-matching", "topological-sort", "rolling-hash",
+    "game-theory", "interactive", "data-stream", "monotonic-queue",
+    "brainteaser", "doubly-linked-list", "randomized", "merge-sort",
+    "counting-sort", "iterator", "concurrency", "probability-and-statistics",
+    "quickselect", "suffix-array", "line-sweep", "minimum-spanning-tree",
+    "bucket-sort", "shell", "reservoir-sampling", "strongly-connected-component",
+    "eulerian-circuit", "radix-sort", "rejection-sampling", "biconnected-component",
+]
+
+DIFFICULTIES = ["Easy", "Medium", "Hard"]
+DIFFICULTY_WEIGHTS = [0.26, 0.52, 0.22]
+AC_RATE_MEAN = {"Easy": 62.0, "Medium": 48.0, "Hard": 38.0}
+
+# Share of problems that appear in the company CSVs at all
+COMPANY_COVERAGE = 0.75
+MAX_COMPANIES_PER_PROBLEM = 60
+SOLVES_RANGE = (50, 2000)
+# Share of a legacy user's solves archived again since user_solved exists
+LEGACY_RECENT_SHARE = 0.1
+WRITE_BATCH_SIZE = 1000
+
+
+def _zipf_weights(n, s=1.1):
+    return [1.0 / (rank ** s) for rank in range(1, n + 1)]
+
+
+def _weighted_sample(rng, items, weights, k):
+    """k distinct items, each drawn with probability proportional to its weight."""
+    keys = ((rng.random() ** (1.0 / w), item) for item, w in zip(items, weights))
+    return [item for _, item in heapq.nlargest(k, keys)]
+
+
+def company_names(num_companies):
+    """Company names, most popular first."""
+    return [f"company-{i:03d}" for i in range(1, num_companies + 1)]
+
+
+def generate_problems(num_problems, num_companies, rng):
+    """Problem docs in the problems_master schema, with skewed company enrichment."""
+    companies = company_names(num_companies)
+    company_weights = _zipf_weights(num_companies)
+    topic_weights = _zipf_weights(len(TOPICS), s=0.9)
+
+    docs = []
+    for i in range(1, num_problems + 1):
+        difficulty = rng.choices(DIFFICULTIES, DIFFICULTY_WEIGHTS)[0]
+        topics = _weighted_sample(rng, TOPICS, topic_weights, rng.randint(1, 5))
+
+        doc = build_doc({
+            "titleSlug": f"synthetic-problem-{i}",
+            "frontendQuestionId": str(i),
+            "title": f"Synthetic Problem {i}",
+            "difficulty": difficulty,
+            "acRate": min(95.0, max(5.0, rng.gauss(AC_RATE_MEAN[difficulty], 12.0))),
+            "paidOnly": rng.random() < 0.15,
+            "hasSolution": rng.random() < 0.6,
+            "hasVideoSolution": rng.random() < 0.2,
+            "topicTags": [{"name": t.replace("-", " ").title(), "slug": t} for t in topics],
+        })
+        doc["content_hash"] = content_hash(doc)
+
+        by_company = {}
+        if rng.random() < COMPANY_COVERAGE:
+            count = min(int(rng.paretovariate(1.2)), MAX_COMPANIES_PER_PROBLEM)
+            for company in _weighted_sample(rng, companies, company_weights, count):
+                by_company[company] = int(rng.paretovariate(1.5))
+
+        doc["companies"] = list(by_company)
+        doc["by_company"] = by_company
+        doc["num_occur"] = sum(by_company.values())
+        docs.append(doc)
+
+    # Every company is asked about at least one problem
+    used = {c for d in docs for c in d["companies"]}
+    for company in companies:
+        if company not in used:
+            doc = rng.choice(docs)
+            doc["companies"].append(company)
+            doc["by_company"][company] = 1
+            doc["num_occur"] += 1
+
+    return docs
+
+
+def generate_users(num_users, rng, now):
+    """Migrated user documents with a log-uniform solved_count."""
+    low, high = SOLVES_RANGE
+    users = []
+    for i in range(num_users):
+        created_at = now - rng.uniform(30, 720) * 86400
+        users.append({
+            "_id": ObjectId(),
+            "email": f"bench-user-{i}@example.com",
+            "password_hash": None,
+            "username": f"bench-user-{i}",
+            "leetcode_username": f"bench-user-{i}",
+            "leetcode_session_encrypted": None,
+            "leetcode_csrf_encrypted": None,
+            "ingestion_status": "ready",
+            "last_ingested_at": now - rng.uniform(0, 7) * 86400,
+            "solved_store": SHARED_STORE,
+            "solved_count": int(round(math.exp(rng.uniform(math.log(low), math.log(high))))),
+            "solved_version": 1,
+            "created_at": created_at,
+            "updated_at": now,
+        })
+    return users
+
+
+def generate_solved(user, count, problems, weights, rng, now):
+    """`count` user_solved rows for one user, biased towards frequently asked problems."""
+    count = min(count, len(problems))
+    rows = []
+    for doc in _weighted_sample(rng, problems, weights, count):
+        archived_at = rng.uniform(user["created_at"], now)
+        rows.append({
+            "user_id": user["_id"],
+            "slug": doc["_id"],
+            "title": doc["title"],
+            "archived_at": archived_at,
+            "updated_at": archived_at,
+        })
+    return rows
+
+
+def legacy_rows(rows):
+    """user_solved rows in the archive_solved_{username} layout."""
+    return [{
+        "slug": r["slug"],
+        "title": r["title"],
+        "link": f"https://leetcode.com/problems/{r['slug']}/",
+        "archived_at": r["archived_at"],
+        "updated_at": r["updated_at"],
+    } for r in rows]
+
+
+def _insert(collection, docs):
+    for i in range(0, len(docs), WRITE_BATCH_SIZE):
+        collection.insert_many(docs[i:i + WRITE_BATCH_SIZE], ordered=False)
+
+
+def seed(num_problems=3500, num_companies=400, num_users=10000, active_users=100,
+         legacy_share=0.0, seed=42):
+    """
+    Replace problems_master, users and user_solved with synthetic data and
+    rebuild the derived catalog data. Returns the active user documents.
+    """
+    rng = random.Random(seed)
+    now = time.time()
+
+    problems_master.delete_many({})
+    users_col.delete_many({})
+    user_solved.delete_many({})
+
+    problems = generate_problems(num_problems, num_companies, rng)
+    _insert(problems_master, problems)
+
+    users = generate_users(num_users, rng, now)
+    solves = {}
+    for user in users:
+        solves[user["_id"]] = user["solved_count"]
+        if rng.random() < legacy_share:
+            del user["solved_store"]
+            del user["solved_count"]
+    _insert(users_col, users)
+
+    active = users[:active_users]
+    weights = [d["num_occur"] + 1 for d in problems]
+    for user in active:
+        rows = generate_solved(user, solves[user["_id"]], problems, weights, rng, now)
+
+        if is_migrated(user):
+            _insert(user_solved, rows)
+            user["solved_count"] = len(rows)
+            users_col.update_one({"_id": user["_id"]}, {"$set": {"solved_count": user["solved_count"]}})
+            continue
+
+        legacy = user_solved_col(user["username"])
+        legacy.drop()
+        _insert(legacy, legacy_rows(rows))
+
+        rows.sort(key=lambda r: r["archived_at"])
+        _insert(user_solved, rows[len(rows) - int(len(rows) * LEGACY_RECENT_SHARE):])
+
+    publish_catalog_version(rebuild_derived)
+
+    return active
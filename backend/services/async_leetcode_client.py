@@ -0,0 +1,259 @@
+import asyncio
+import os
+import time
+import httpx
+from dotenv import load_dotenv
+from services.queries import (
+    USER_SUBMISSION_LIST_QUERY, USER_AC_SUBMISSIONS_QUERY, GET_PROBLEMS_QUERY,
+    QUESTION_TITLE_QUERY, FULL_SOLVED_LIST_QUERY,
+)
+
+load_dotenv()
+
+# In-flight requests and sustained requests/second against leetcode.com
+DEFAULT_CONCURRENCY = int(os.getenv("LEETCODE_CONCURRENCY", "4"))
+DEFAULT_RATE = float(os.getenv("LEETCODE_RATE", "4"))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 1.5
+
+
+class TokenBucket:
+    """Token-bucket rate limiter: `rate` tokens per second, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncLeetCodeClient:
+    """
+    asyncio counterpart of LeetCodeClient, used by the ingestion jobs.
+
+    Pages and per-slug lookups run concurrently, bounded by a semaphore
+    (`concurrency` requests in flight) and a token bucket (`rate` requests
+    per second) instead of fixed sleeps between calls. The client belongs
+    to the event loop it is first used on.
+    """
+
+    def __init__(self, session=None, csrf=None, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE):
+        self.url = "https://leetcode.com/graphql/"
+
+        session = session or os.getenv("LEETCODE_SESSION")
+        csrf = csrf or os.getenv("LEETCODE_CSRF")
+
+        self.cookies = {"LEETCODE_SESSION": session or "", "csrftoken": csrf or ""}
+        self.headers = {
+            "Content-Type": "application/json",
+            "Referer": "https://leetcode.com",
+            "Origin": "https://leetcode.com",
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            ),
+            "x-csrftoken": csrf or ""
+        }
+
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.bucket = TokenBucket(rate)
+        self.http = httpx.AsyncClient(
+            cookies=self.cookies,
+            headers=self.headers,
+            timeout=60,
+            limits=httpx.Limits(max_connections=concurrency),
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        await self.http.aclose()
+
+    async def fetch(self, query, variables):
+        for attempt in range(MAX_RETRIES + 1):
+            async with self.semaphore:
+                await self.bucket.acquire()
+                r = await self.http.post(self.url, json={"query": query, "variables": variables})
+
+            if r.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                r.raise_for_status()
+                return r.json()
+
+            retry_after = r.headers.get("Retry-After")
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else BACKOFF_FACTOR * (2 ** attempt)
+            await asyncio.sleep(delay)
+
+    async def _solved_page(self, skip, limit):
+        variables = {
+            "categorySlug": "",
+            "skip": skip,
+            "limit": limit,
+            "filters": {"status": "AC"}
+        }
+        data = await self.fetch(FULL_SOLVED_LIST_QUERY, variables)
+
+        if not data or "data" not in data or data["data"].get("problemsetQuestionList") is None:
+            raise ValueError(f"API Error or Empty Response: {data}")
+
+        return data["data"]["problemsetQuestionList"]
+
+    async def fetch_all_accepted_slugs(self):
+        """
+        Fetches ALL solved slugs using the AC filter, remaining pages
+        concurrently. Raises if any page fails, so a partial list is never
+        archived as the user's complete solved set.
+        """
+        limit = 100
+        print("[LC] Starting deep scan for all solved problems...")
+
+        first = await self._solved_page(0, limit)
+        all_solved_slugs = [q["titleSlug"] for q in first["questions"] or []]
+        total = first.get("totalNum") or 0
+
+        pages = await asyncio.gather(
+            *(self._solved_page(skip, limit) for skip in range(limit, total, limit)),
+            return_exceptions=True
+        )
+
+        failed = [page for page in pages if isinstance(page, Exception)]
+        if failed:
+            raise ValueError(
+                f"{len(failed)} of {len(pages) + 1} solved pages failed: {failed[0]}"
+            ) from failed[0]
+
+        for page in pages:
+            all_solved_slugs.extend(q["titleSlug"] for q in page["questions"] or [])
+
+        print(f"[LC] Retrieved {len(all_solved_slugs)} slugs...")
+        return all_solved_slugs
+
+    async def fetch_accepted_since(self, watermark, leetcode_username=None, page_size=20, max_pages=50):
+        """
+        Accepted submissions newer than `watermark` (unix seconds) as
+        [{"slug", "title", "timestamp"}], one entry per slug with its latest
+        accepted timestamp. Returns None when the window since the watermark
+        cannot be fully covered, in which case callers fall back to a deep scan.
+
+        History pages are walked one at a time (each decides whether the next
+        is needed); the token bucket paces them instead of a fixed sleep.
+        """
+        found = {}
+
+        def keep(s):
+            ts = int(s["timestamp"])
+            prev = found.get(s["titleSlug"])
+            if prev is None or ts > prev["timestamp"]:
+                found[s["titleSlug"]] = {"slug": s["titleSlug"], "title": s["title"], "timestamp": ts}
+
+        try:
+            # Public recent-AC list: enough when fewer than one page of new solves
+            if leetcode_username:
+                data = await self.fetch(USER_AC_SUBMISSIONS_QUERY, {"username": leetcode_username, "limit": page_size})
+                recent = data["data"]["recentAcSubmissionList"] or []
+                if len(recent) < page_size or int(recent[-1]["timestamp"]) <= watermark:
+                    for s in recent:
+                        if int(s["timestamp"]) > watermark:
+                            keep(s)
+                    return list(found.values())
+
+            # Otherwise walk the authenticated submission history back to the watermark
+            for page in range(max_pages):
+                data = await self.fetch(USER_SUBMISSION_LIST_QUERY, {"offset": page * page_size, "limit": page_size})
+                submission_list = data["data"]["submissionList"]
+                if submission_list is None:
+                    print("[LC] Submission history unavailable (not authenticated?)")
+                    return None
+
+                for s in submission_list["submissions"]:
+                    if int(s["timestamp"]) <= watermark:
+                        return list(found.values())
+                    if s["statusDisplay"] == "Accepted":
+                        keep(s)
+
+                if not submission_list["hasNext"]:
+                    return list(found.values())
+
+        except Exception as e:
+            print(f"[LC] Error during incremental fetch: {e}")
+            return None
+
+        print(f"[LC] Watermark not reached after {max_pages} pages")
+        return None
+
+    async def _title(self, slug):
+        try:
+            data = await self.fetch(QUESTION_TITLE_QUERY, {"titleSlug": slug})
+            q = data["data"]["question"]
+            if q:
+                return {"title": q["title"], "slug": q["titleSlug"]}
+        except Exception:
+            pass
+        return None
+
+    async def fetch_titles_directly(self, slugs):
+        """Converts slugs into clean titles, one concurrent lookup per slug."""
+        if not slugs:
+            return []
+
+        print(f"[LC] Hydrating titles for {len(slugs)} slugs...")
+        results = await asyncio.gather(*(self._title(slug) for slug in slugs))
+        return [r for r in results if r]
+
+    async def _title_batch(self, batch):
+        variables = {
+            "categorySlug": "",
+            "skip": 0,
+            "limit": len(batch),
+            "filters": {"search": ",".join(batch)}
+        }
+
+        try:
+            data = await self.fetch(GET_PROBLEMS_QUERY, variables)
+            questions = data["data"]["problemsetQuestionList"]["questions"]
+        except Exception as e:
+            print(f"[LC] Batch fetch error: {e}")
+            return []
+
+        wanted = set(batch)
+        return [
+            {
+                "title": q["title"],
+                "slug": q["titleSlug"],
+                "difficulty": q.get("difficulty"),
+                "topics": [t["slug"] for t in q.get("topicTags") or []]
+            }
+            for q in questions
+            if q["titleSlug"] in wanted
+        ]
+
+    async def fetch_titles_batch(self, slugs, batch_size=100):
+        """Fetches titles for a list of slugs in concurrent batches of `batch_size`."""
+        slugs_list = list(slugs)
+        print(f"[LC] Batch hydrating titles for {len(slugs_list)} slugs...")
+
+        batches = await asyncio.gather(*(
+            self._title_batch(slugs_list[i:i + batch_size])
+            for i in range(0, len(slugs_list), batch_size)
+        ))
+        return [r for batch in batches for r in batch]
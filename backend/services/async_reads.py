@@ -0,0 +1,134 @@
+# backend/services/async_reads.py
+"""
+Non-blocking versions of the reads behind the dashboard routes.
+
+These go through motor and share the per-process caches of their sync
+counterparts (user records, solved sets, catalog version), so the sync and
+async routes in one process see the same data. Rebuilding catalog-derived
+data (stats, readiness matrix, plan sampler, a user's topic coverage) is
+rare and CPU- or aggregation-heavy, so it runs the sync builder in a worker
+thread; every other path stays on the event loop.
+"""
+
+import asyncio
+from bson import ObjectId
+from utils import async_db
+from utils.slugs import extract_slug
+from services.catalog import (
+    VERSION_DOC_ID, cached_catalog_version, remember_catalog_version,
+    peek_catalog_stats, get_catalog_stats,
+)
+from services.readiness import peek_readiness_engine, get_readiness_engine
+from services.sampling import peek_sampler, get_sampler
+from services.user_cache import USER_FIELDS, peek_user, remember_user
+from services.solved_cache import solved_cache
+from services.solved_store import is_migrated, count_solved as sync_count_solved
+from services.topic_coverage import rebuild_coverage, coverage_rows
+
+
+# ---------- Catalog ----------
+async def catalog_version() -> int:
+    version = cached_catalog_version()
+    if version is None:
+        doc = await async_db.catalog_meta.find_one({"_id": VERSION_DOC_ID}, {"version": 1})
+        version = remember_catalog_version(doc.get("version", 0) if doc else 0)
+    return version
+
+
+async def catalog_stats() -> dict:
+    await catalog_version()
+    return peek_catalog_stats() or await asyncio.to_thread(get_catalog_stats)
+
+
+async def readiness_engine():
+    await catalog_version()
+    return peek_readiness_engine() or await asyncio.to_thread(get_readiness_engine)
+
+
+async def sampler():
+    await catalog_version()
+    return peek_sampler() or await asyncio.to_thread(get_sampler)
+
+
+# ---------- Users ----------
+async def get_user(user_id):
+    """Cached user record for `user_id`, or None if it does not exist."""
+    user = peek_user(user_id)
+    if user is not None:
+        return user
+
+    user = await async_db.users_col.find_one({"_id": ObjectId(str(user_id))}, USER_FIELDS)
+    if user is not None:
+        remember_user(user)
+    return user
+
+
+# ---------- Solved problems ----------
+async def load_solved_slugs(user) -> set:
+    cursor = async_db.user_solved.find({"user_id": user["_id"]}, {"_id": 0, "slug": 1})
+    solved = {d["slug"] async for d in cursor}
+
+    if not is_migrated(user):
+        legacy = async_db.user_solved_col(user["username"]).find(
+            {}, {"slug": 1, "titleSlug": 1, "link": 1}
+        )
+        async for d in legacy:
+            slug = extract_slug(d)
+            if slug:
+                solved.add(slug)
+
+    return solved
+
+
+async def get_solved_set(user) -> frozenset:
+    solved, epoch = solved_cache.lookup(user)
+    if solved is None:
+        try:
+            solved = frozenset(await load_solved_slugs(user))
+        except BaseException:
+            solved_cache.cancel(user)
+            raise
+        solved_cache.offer(user, solved, epoch)
+    return solved
+
+
+async def count_solved(user) -> int:
+    if "solved_count" in user:
+        return user["solved_count"]
+
+    # Users without the counter yet: count once (and backfill) in a thread
+    return await asyncio.to_thread(sync_count_solved, user)
+
+
+async def recent_solved(user, limit: int) -> list:
+    projection = {"_id": 0, "slug": 1, "title": 1, "archived_at": 1}
+
+    docs = await (
+        async_db.user_solved.find({"user_id": user["_id"]}, projection)
+        .sort("archived_at", -1)
+        .to_list(limit)
+    )
+
+    if not is_migrated(user):
+        seen = {d["slug"] for d in docs}
+        legacy = await (
+            async_db.user_solved_col(user["username"])
+            .find({}, projection)
+            .sort("archived_at", -1)
+            .to_list(limit)
+        )
+        docs.extend(d for d in legacy if d.get("slug") and d["slug"] not in seen)
+        docs.sort(key=lambda d: d.get("archived_at") or 0, reverse=True)
+
+    return docs[:limit]
+
+
+async def get_coverage(user) -> list:
+    stats = await catalog_stats()
+
+    doc = await async_db.user_coverage_col.find_one({"_id": user["_id"]})
+    if not doc or doc.get("catalog_version") != stats["catalog_version"]:
+        solved = await get_solved_set(user)
+        doc = await asyncio.to_thread(rebuild_coverage, user, solved)
+
+    return coverage_rows(doc, stats)
@@ -0,0 +1,165 @@
+# backend/services/catalog.py
+"""
+Catalog versioning.
+
+Anything derived from problems_master (company index, readiness matrix,
+catalog stats, ...) is tagged with the catalog version it was built from.
+Writers to problems_master call publish_catalog_version() once they are
+done: it persists the derived data for the next version and only then
+makes that version current, so readers never see a version whose company
+index or stats still have to be built. Readers reload their in-process
+data when the version moves.
+"""
+
+import threading
+import time
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from utils.db import catalog_meta, problems_master
+
+VERSION_DOC_ID = "version"
+STATS_DOC_ID = "stats"
+
+# How long a process trusts its last version read before asking MongoDB again
+VERSION_CHECK_INTERVAL = 30  # seconds
+
+_version_cache = {"version": None, "checked_at": 0.0}
+
+_stats_lock = threading.Lock()
+_stats_cache = {"version": None, "stats": None}
+
+
+def cached_catalog_version(max_age: float = VERSION_CHECK_INTERVAL):
+    """The version this process last read, or None if that was max_age seconds ago or more."""
+    if (
+        _version_cache["version"] is not None
+        and time.time() - _version_cache["checked_at"] < max_age
+    ):
+        return _version_cache["version"]
+    return None
+
+
+def remember_catalog_version(version: int) -> int:
+    """Record a version just read from (or written to) catalog_meta."""
+    _version_cache["version"] = version
+    _version_cache["checked_at"] = time.time()
+    return version
+
+
+def get_catalog_version(max_age: float = VERSION_CHECK_INTERVAL) -> int:
+    """Return the current catalog version, re-reading it at most every max_age seconds."""
+    version = cached_catalog_version(max_age)
+    if version is not None:
+        return version
+
+    doc = catalog_meta.find_one({"_id": VERSION_DOC_ID}, {"version": 1})
+    return remember_catalog_version(doc.get("version", 0) if doc else 0)
+
+
+def bump_catalog_version() -> int:
+    """Mark problems_master as changed. Returns the new catalog version."""
+    doc = catalog_meta.find_one_and_update(
+        {"_id": VERSION_DOC_ID},
+        {"$inc": {"version": 1}, "$set": {"updated_at": time.time()}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+
+    return remember_catalog_version(doc["version"])
+
+
+def publish_catalog_version(rebuild) -> int:
+    """
+    Call `rebuild(version)` to persist derived data for the next catalog
+    version, then make that version current. Retries with a fresh version
+    if another writer published in between. Returns the new version.
+    """
+    while True:
+        doc = catalog_meta.find_one({"_id": VERSION_DOC_ID}, {"version": 1})
+        current = doc.get("version", 0) if doc else 0
+        version = current + 1
+
+        rebuild(version)
+
+        if doc is None:
+            try:
+                catalog_meta.insert_one({"_id": VERSION_DOC_ID, "version": version, "updated_at": time.time()})
+            except DuplicateKeyError:
+                continue
+            return remember_catalog_version(version)
+
+        result = catalog_meta.update_one(
+            {"_id": VERSION_DOC_ID, "version": current},
+            {"$set": {"version": version, "updated_at": time.time()}},
+        )
+        if result.matched_count:
+            return remember_catalog_version(version)
+
+
+def rebuild_catalog_stats(version: int = None) -> dict:
+    """Aggregate global catalog stats in one pass and store them in catalog_meta."""
+    if version is None:
+        version = get_catalog_version(max_age=0)
+
+    facets = next(problems_master.aggregate([
+        {"$facet": {
+            "total": [{"$count": "n"}],
+            "companies": [
+                {"$unwind": "$companies"},
+                {"$group": {"_id": "$companies"}},
+                {"$count": "n"},
+            ],
+            "by_difficulty": [
+                {"$group": {"_id": "$difficulty", "n": {"$sum": 1}}},
+            ],
+            "by_topic": [
+                {"$unwind": "$topics"},
+                {"$group": {
+                    "_id": "$topics",
+                    "n": {"$sum": 1},
+                    "weight": {"$sum": {"$ifNull": ["$num_occur", 0]}},
+                }},
+            ],
+        }}
+    ]))
+
+    stats = {
+        "_id": STATS_DOC_ID,
+        "catalog_version": version,
+        "total_problems": facets["total"][0]["n"] if facets["total"] else 0,
+        "companies": facets["companies"][0]["n"] if facets["companies"] else 0,
+        "by_difficulty": {d["_id"]: d["n"] for d in facets["by_difficulty"] if d["_id"]},
+        "by_topic": {t["_id"]: t["n"] for t in facets["by_topic"] if t["_id"]},
+        "topic_weights": {t["_id"]: t["weight"] for t in facets["by_topic"] if t["_id"]},
+        "built_at": time.time(),
+    }
+    catalog_meta.replace_one({"_id": STATS_DOC_ID}, stats, upsert=True)
+
+    print(f"[CATALOG] Stats v{version}: {stats['total_problems']} problems, {stats['companies']} companies")
+    return stats
+
+
+def peek_catalog_stats():
+    """Stats already loaded for the current version, or None (no stats I/O)."""
+    version = get_catalog_version()
+    return _stats_cache["stats"] if _stats_cache["version"] == version else None
+
+
+def get_catalog_stats() -> dict:
+    """Catalog stats for the current version: one lookup, rebuilt only if stale."""
+    version = get_catalog_version()
+    if _stats_cache["version"] == version:
+        return _stats_cache["stats"]
+
+    with _stats_lock:
+        if _stats_cache["version"] == version:
+            return _stats_cache["stats"]
+
+        # Stats for a version still being published are newer, not stale
+        stats = catalog_meta.find_one({"_id": STATS_DOC_ID})
+        if not stats or stats.get("catalog_version", 0) < version:
+            stats = rebuild_catalog_stats(version)
+
+        _stats_cache["version"] = version
+        _stats_cache["stats"] = stats
+        return stats
@@ -0,0 +1,110 @@
+# backend/services/company_index.py
+"""
+Catalog-level company index.
+
+For every company we keep the slugs of its TOP_N most frequent problems,
+sorted by num_occur. The index is built from one scan of problems_master
+by the catalog writer (see publish_catalog_version), persisted in the
+company_index collection and cached in-process, keyed by the catalog
+version. Request handlers only intersect a user's solved set against these
+prebuilt lists, and never write the index.
+"""
+
+import threading
+import time
+from pymongo import ReplaceOne
+from utils.db import problems_master, company_index_col
+from services.catalog import get_catalog_version
+
+TOP_N = 120
+
+_lock = threading.Lock()
+_cache = {"version": None, "entries": None}
+
+
+def compute_company_index(version: int, top_n: int = TOP_N) -> list:
+    """Scan problems_master into per-company top-N documents for `version`."""
+    company_map = {}
+
+    cursor = problems_master.find({}, {"_id": 1, "companies": 1, "num_occur": 1})
+    for p in cursor:
+        slug = p.get("_id")
+        if not slug:
+            continue
+
+        freq = p.get("num_occur", 1)
+        for c in p.get("companies", []):
+            company_map.setdefault(c, []).append((freq, slug))
+
+    docs = []
+    for company, problems in company_map.items():
+        problems.sort(key=lambda x: x[0], reverse=True)
+        top = problems[:top_n]
+
+        docs.append({
+            "_id": company,
+            "top_slugs": [slug for _, slug in top],
+            "top_freqs": [freq for freq, _ in top],
+            "total": len(problems),
+            "catalog_version": version,
+            "built_at": time.time(),
+        })
+
+    return docs
+
+
+def build_company_index(version: int, top_n: int = TOP_N) -> dict:
+    """Persist the per-company top-N lists for `version` in one unordered bulk write."""
+    docs = compute_company_index(version, top_n)
+
+    if docs:
+        company_index_col.bulk_write(
+            [ReplaceOne({"_id": d["_id"]}, d, upsert=True) for d in docs],
+            ordered=False,
+        )
+    # Companies that no longer have any problems
+    company_index_col.delete_many({"_id": {"$nin": [d["_id"] for d in docs]}})
+
+    print(f"[INDEX] Built company index v{version}: {len(docs)} companies")
+    return _to_entries(docs)
+
+
+def _to_entries(docs) -> dict:
+    return {
+        d["_id"]: {
+            "top_slugs": d["top_slugs"],
+            "top_freqs": d.get("top_freqs", []),
+            "top_set": frozenset(d["top_slugs"]),
+            "total": d["total"],
+        }
+        for d in docs
+    }
+
+
+def get_company_index() -> dict:
+    """
+    Return {company: {"top_slugs", "top_freqs", "top_set", "total"}} for the
+    current catalog version, reloading it only when the version changed.
+    A persisted index at least as new as the current version is used as is
+    (a newer one is being published). Without one, e.g. on a database the
+    catalog writer has not published to yet, the index is computed in
+    process and not persisted.
+    """
+    version = get_catalog_version()
+    if _cache["version"] == version:
+        return _cache["entries"]
+
+    with _lock:
+        if _cache["version"] == version:
+            return _cache["entries"]
+
+        docs = list(company_index_col.find())
+        if docs and min(d.get("catalog_version", 0) for d in docs) >= version:
+            entries = _to_entries(docs)
+        else:
+            print(f"[INDEX] No persisted company index for v{version}; computing it in process")
+            entries = _to_entries(compute_company_index(version))
+
+        _cache["version"] = version
+        _cache["entries"] = entries
+        return entries
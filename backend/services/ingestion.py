@@ -0,0 +1,152 @@
+# backend/services/ingestion.py
+"""
+Archiving a user's solved problems from LeetCode, inline or as a background job.
+
+The first sync is a deep scan of the user's whole AC problem list. Every
+sync stores a watermark (users.solved_watermark, unix seconds); later syncs
+only fetch accepted submissions newer than it and fall back to the deep
+scan when the window since the watermark cannot be covered.
+
+LeetCode calls go through the AsyncLeetCodeClient; ingest_user() runs a
+sync on its own event loop, so job worker threads and the inline route
+call it like any other function. MongoDB writes stay on pymongo.
+"""
+
+import asyncio
+import time
+from bson import ObjectId
+from utils.db import users_col
+from utils.crypto import decrypt_credential, SESSION_FIELD, CSRF_FIELD
+from services.jobs import register_handler
+from services.async_leetcode_client import AsyncLeetCodeClient
+from services.solved_store import SolvedArchiveWriter
+from services.title_hydration import hydrate_titles
+from services.user_cache import invalidate_user
+
+INGEST_JOB = "ingest_user"
+
+FULL_SYNC = "full"
+INCREMENTAL_SYNC = "incremental"
+
+# Submission timestamps come from LeetCode's clock; overlap a little on deep scans
+WATERMARK_SKEW = 300  # seconds
+
+
+async def archive_user_solved(user, client, batch_size=None, progress=None):
+    """
+    Fetch the user's accepted slugs, hydrate titles and archive them.
+    `progress(stage, done, total)` is called as the ingestion advances.
+    Returns a summary dict.
+    """
+    progress = progress or (lambda stage, done=0, total=None: None)
+
+    # 1. Get slugs
+    progress("fetching_slugs")
+    slugs = await client.fetch_all_accepted_slugs()
+    if not slugs:
+        raise ValueError("No solved problems found.")
+
+    # 2. Get titles (catalog first, LeetCode only for misses)
+    progress("hydrating_titles", 0, len(slugs))
+    problem_details = await hydrate_titles(slugs, client)
+
+    # 3. Save to MongoDB in unordered bulk batches
+    writer = SolvedArchiveWriter(user, batch_size=batch_size)
+    for i, p in enumerate(problem_details, 1):
+        writer.add(p["slug"], p["title"])
+        if i % writer.batch_size == 0:
+            progress("archiving", i, len(problem_details))
+    written = writer.close()
+    progress("archiving", len(problem_details), len(problem_details))
+
+    return {
+        "total_solved_found": len(slugs),
+        "titles_archived": len(problem_details),
+        **written
+    }
+
+
+def archive_new_submissions(user, submissions, batch_size=None, progress=None):
+    """Archive [{slug, title, timestamp}] with archived_at set to the solve time."""
+    progress = progress or (lambda stage, done=0, total=None: None)
+    progress("archiving", 0, len(submissions))
+
+    writer = SolvedArchiveWriter(user, batch_size=batch_size)
+    for s in submissions:
+        writer.add(s["slug"], s["title"], solved_at=s["timestamp"])
+    written = writer.close()
+
+    progress("archiving", len(submissions), len(submissions))
+    return {
+        "total_solved_found": len(submissions),
+        "titles_archived": len(submissions),
+        **written
+    }
+
+
+async def sync_user_solved(user, client, mode=None, batch_size=None, progress=None):
+    """
+    Incremental sync when the user has a watermark (unless mode="full"),
+    deep scan otherwise. Advances the watermark and returns a summary.
+    """
+    progress = progress or (lambda stage, done=0, total=None: None)
+    started_at = time.time()
+    watermark = user.get("solved_watermark")
+    summary = None
+
+    if mode != FULL_SYNC and watermark is not None:
+        progress("fetching_submissions")
+        submissions = await client.fetch_accepted_since(
+            watermark, leetcode_username=user.get("leetcode_username")
+        )
+
+        if submissions is not None:
+            summary = archive_new_submissions(user, submissions, batch_size, progress)
+            summary["mode"] = INCREMENTAL_SYNC
+            new_watermark = max([watermark] + [s["timestamp"] for s in submissions])
+        else:
+            print(f"[SYNC] Gap after watermark for {user['username']}, running full scan")
+
+    if summary is None:
+        summary = await archive_user_solved(user, client, batch_size, progress)
+        summary["mode"] = FULL_SYNC
+        new_watermark = int(started_at) - WATERMARK_SKEW
+
+    users_col.update_one(
+        {"_id": user["_id"]},
+        {"$set": {"solved_watermark": new_watermark, "last_sync_mode": summary["mode"]}}
+    )
+    invalidate_user(user["_id"])
+    return summary
+
+
+def client_for_user(user):
+    """AsyncLeetCodeClient using the user's stored credentials (or the global ones)."""
+    return AsyncLeetCodeClient(
+        session=decrypt_credential(user.get(SESSION_FIELD)),
+        csrf=decrypt_credential(user.get(CSRF_FIELD)),
+    )
+
+
+async def _ingest(user, mode, batch_size, progress):
+    async with client_for_user(user) as client:
+        return await sync_user_solved(user, client, mode, batch_size, progress)
+
+
+def ingest_user(user, mode=None, batch_size=None, progress=None):
+    """Run sync_user_solved with the user's credentials on a fresh event loop."""
+    return asyncio.run(_ingest(user, mode, batch_size, progress))
+
+
+@register_handler(INGEST_JOB)
+def run_ingest_job(job, ctx):
+    user = users_col.find_one({"_id": ObjectId(job["user_id"])})
+    if not user:
+        raise ValueError("User not found")
+
+    return ingest_user(
+        user,
+        mode=job["payload"].get("mode"),
+        batch_size=job["payload"].get("batch_size"),
+        progress=ctx.progress,
+    )
@@ -0,0 +1,316 @@
+# backend/services/jobs.py
+"""
+MongoDB-backed background jobs.
+
+A job is a document in the jobs collection:
+
+    {kind, payload, user_id, status, attempts, max_attempts, run_after,
+     locked_by, locked_at, progress: {stage, done, total}, error,
+     created_at, started_at, finished_at, active}
+
+Workers claim queued jobs atomically with find_one_and_update, heartbeat
+while they run (so a crashed worker's job is picked up again once its lease
+expires, until it runs out of attempts) and retry failures with exponential
+backoff. Updates from a worker that lost its lease match nothing and are
+ignored. Jobs that belong to a user drive that user's ingestion_status;
+`active` is set while such a job is queued or running, and a unique partial
+index on (kind, user_id, active) keeps concurrent enqueues to one job.
+"""
+
+import os
+import socket
+import threading
+import time
+import traceback
+import uuid
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from utils.db import jobs_col, users_col
+from services.user_cache import invalidate_user
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# users.ingestion_status for each job state
+USER_STATUS = {
+    QUEUED: "queued",
+    RUNNING: "ingesting",
+    SUCCEEDED: "ready",
+    FAILED: "error",
+}
+
+DEFAULT_MAX_ATTEMPTS = 3
+BACKOFF_BASE = 30     # seconds before the first retry, doubled per attempt
+LEASE_SECONDS = 300   # a running job without heartbeat for this long is reclaimed
+POLL_INTERVAL = 2.0
+
+_handlers = {}
+
+
+def register_handler(kind):
+    """Decorator registering `fn(job, ctx)` as the handler for jobs of `kind`."""
+    def wrap(fn):
+        _handlers[kind] = fn
+        return fn
+    return wrap
+
+
+def _set_user_status(job, status):
+    if not job.get("user_id"):
+        return
+
+    fields = {"ingestion_status": USER_STATUS[status], "ingestion_job_id": job["_id"]}
+    if status == SUCCEEDED:
+        fields["last_ingested_at"] = time.time()
+
+    users_col.update_one({"_id": job["user_id"]}, {"$set": fields})
+    invalidate_user(job["user_id"])
+
+
+def _active_job(kind, user_id):
+    return jobs_col.find_one({"kind": kind, "user_id": user_id, "active": True})
+
+
+def enqueue(kind, payload=None, user_id=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """
+    Queue a job and return it. If the user already has a queued or running
+    job of the same kind, that job is returned instead of a duplicate.
+    """
+    if user_id is not None:
+        existing = _active_job(kind, user_id)
+        if existing:
+            return existing
+
+    now = time.time()
+    job = {
+        "kind": kind,
+        "payload": payload or {},
+        "user_id": user_id,
+        "status": QUEUED,
+        "attempts": 0,
+        "max_attempts": max_attempts,
+        "run_after": now,
+        "locked_by": None,
+        "locked_at": None,
+        "progress": {"stage": QUEUED, "done": 0, "total": None},
+        "error": None,
+        "created_at": now,
+        "started_at": None,
+        "finished_at": None,
+    }
+    if user_id is not None:
+        job["active"] = True
+
+    try:
+        job["_id"] = jobs_col.insert_one(job).inserted_id
+    except DuplicateKeyError:
+        # A concurrent enqueue for the same user won; return its job (or, if
+        # that one already finished, try again)
+        return _active_job(kind, user_id) or enqueue(kind, payload, user_id, max_attempts)
+
+    _set_user_status(job, QUEUED)
+    return job
+
+
+def reap_expired(now=None):
+    """
+    Fail running jobs whose lease expired with no attempts left, e.g. jobs
+    that keep crashing their worker. Returns how many were failed.
+    """
+    now = now or time.time()
+    reaped = 0
+
+    expired = jobs_col.find({
+        "status": RUNNING,
+        "locked_at": {"$lt": now - LEASE_SECONDS},
+        "$expr": {"$gte": ["$attempts", "$max_attempts"]},
+    })
+    for job in expired:
+        result = jobs_col.update_one(
+            {"_id": job["_id"], "status": RUNNING, "locked_at": job["locked_at"]},
+            {
+                "$set": {
+                    "status": FAILED,
+                    "error": f"Worker lost the job on all {job['attempts']} attempts",
+                    "locked_by": None,
+                    "locked_at": None,
+                    "finished_at": now,
+                    "progress.stage": FAILED,
+                },
+                "$unset": {"active": ""},
+            },
+        )
+        if result.matched_count:
+            _set_user_status(job, FAILED)
+            reaped += 1
+
+    return reaped
+
+
+def claim(worker_id):
+    """Atomically take the next runnable job (or a job whose lease expired with attempts left)."""
+    now = time.time()
+    reap_expired(now)
+
+    job = jobs_col.find_one_and_update(
+        {"$or": [
+            {"status": QUEUED, "run_after": {"$lte": now}},
+            {
+                "status": RUNNING,
+                "locked_at": {"$lt": now - LEASE_SECONDS},
+                "$expr": {"$lt": ["$attempts", "$max_attempts"]},
+            },
+        ]},
+        {
+            "$set": {
+                "status": RUNNING,
+                "locked_by": worker_id,
+                "locked_at": now,
+                "started_at": now,
+            },
+            "$inc": {"attempts": 1},
+        },
+        sort=[("run_after", 1)],
+        return_document=ReturnDocument.AFTER,
+    )
+
+    if job:
+        _set_user_status(job, RUNNING)
+    return job
+
+
+class JobContext:
+    """Handed to job handlers for progress reporting; every update is also a heartbeat."""
+
+    def __init__(self, job, worker_id):
+        self.job = job
+        self.worker_id = worker_id
+
+    def progress(self, stage, done=0, total=None):
+        jobs_col.update_one(
+            {"_id": self.job["_id"], "locked_by": self.worker_id},
+            {"$set": {
+                "progress": {"stage": stage, "done": done, "total": total},
+                "locked_at": time.time(),
+            }},
+        )
+
+
+def complete(job, worker_id, result=None) -> bool:
+    """Mark the job succeeded. False (and no change) if worker_id no longer holds it."""
+    updated = jobs_col.update_one(
+        {"_id": job["_id"], "locked_by": worker_id},
+        {
+            "$set": {
+                "status": SUCCEEDED,
+                "result": result,
+                "error": None,
+                "locked_by": None,
+                "locked_at": None,
+                "finished_at": time.time(),
+                "progress.stage": SUCCEEDED,
+            },
+            "$unset": {"active": ""},
+        },
+    )
+    if not updated.matched_count:
+        print(f"[JOBS] {job['_id']} finished after {worker_id} lost its lease; result dropped")
+        return False
+
+    _set_user_status(job, SUCCEEDED)
+    return True
+
+
+def fail(job, worker_id, error) -> bool:
+    """
+    Record a failed attempt: requeue with backoff, or give up after
+    max_attempts. False (and no change) if worker_id no longer holds the job.
+    """
+    now = time.time()
+
+    update = {}
+    if job["attempts"] < job["max_attempts"]:
+        status = QUEUED
+        fields = {"run_after": now + BACKOFF_BASE * (2 ** (job["attempts"] - 1))}
+    else:
+        status = FAILED
+        fields = {"finished_at": now}
+        update["$unset"] = {"active": ""}
+
+    fields.update({
+        "status": status,
+        "error": error,
+        "locked_by": None,
+        "locked_at": None,
+        "progress.stage": status,
+    })
+    update["$set"] = fields
+    updated = jobs_col.update_one({"_id": job["_id"], "locked_by": worker_id}, update)
+    if not updated.matched_count:
+        print(f"[JOBS] {job['_id']} failed after {worker_id} lost its lease; error dropped")
+        return False
+
+    _set_user_status(job, status)
+    return True
+
+
+def run_job(job, worker_id):
+    handler = _handlers.get(job["kind"])
+    if handler is None:
+        fail(job, worker_id, f"No handler for job kind '{job['kind']}'")
+        return
+
+    try:
+        result = handler(job, JobContext(job, worker_id))
+    except Exception as e:
+        print(f"[JOBS] {job['kind']} {job['_id']} failed (attempt {job['attempts']}): {e}")
+        traceback.print_exc()
+        fail(job, worker_id, str(e))
+        return
+
+    complete(job, worker_id, result)
+
+
+class WorkerPool:
+    """Threads that poll the jobs collection and run claimed jobs."""
+
+    def __init__(self, num_workers=1, poll_interval=POLL_INTERVAL):
+        self.num_workers = num_workers
+        self.poll_interval = poll_interval
+        self.prefix = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._stop = threading.Event()
+        self._threads = []
+
+    def _loop(self, worker_id):
+        while not self._stop.is_set():
+            try:
+                job = claim(worker_id)
+            except Exception as e:
+                print(f"[JOBS] Claim failed: {e}")
+                job = None
+
+            if job is None:
+                self._stop.wait(self.poll_interval)
+                continue
+
+            run_job(job, worker_id)
+
+    def start(self):
+        for i in range(self.num_workers):
+            t = threading.Thread(
+                target=self._loop,
+                args=(f"{self.prefix}-{i}",),
+                name=f"job-worker-{i}",
+                daemon=True,
+            )
+            t.start()
+            self._threads.append(t)
+        print(f"[JOBS] Started {self.num_workers} worker(s)")
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout)
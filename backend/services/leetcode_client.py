@@ -4,18 +4,22 @@ import time
 from dotenv import load_dotenv
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from services.queries import USER_SUBMISSION_LIST_QUERY, GET_PROBLEMS_QUERY, QUESTION_TITLE_QUERY, FULL_SOLVED_LIST_QUERY
+from services.queries import USER_SUBMISSION_LIST_QUERY, USER_AC_SUBMISSIONS_QUERY, GET_PROBLEMS_QUERY, QUESTION_TITLE_QUERY, FULL_SOLVED_LIST_QUERY
 
 load_dotenv()
 
 class LeetCodeClient:
-    def __init__(self):
+    def __init__(self, session=None, csrf=None):
         self.session = requests.Session()
         self.url = "https://leetcode.com/graphql/"
 
+        # Per-user credentials, falling back to the global ones
+        session = session or os.getenv("LEETCODE_SESSION")
+        csrf = csrf or os.getenv("LEETCODE_CSRF")
+
         # Cookies
-        self.session.cookies.set("LEETCODE_SESSION", os.getenv("LEETCODE_SESSION"), domain=".leetcode.com")
-        self.session.cookies.set("csrftoken", os.getenv("LEETCODE_CSRF"), domain=".leetcode.com")
+        self.session.cookies.set("LEETCODE_SESSION", session, domain=".leetcode.com")
+        self.session.cookies.set("csrftoken", csrf, domain=".leetcode.com")
 
         # Headers
         self.headers = {
@@ -27,7 +31,7 @@ class LeetCodeClient:
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
                 "Chrome/120.0.0.0 Safari/537.36"
             ),
-            "x-csrftoken": os.getenv("LEETCODE_CSRF")
+            "x-csrftoken": csrf
         }
 
         # Retry + backoff
@@ -95,6 +99,58 @@ class LeetCodeClient:
             
         return all_solved_slugs # ALWAYS returns a list, never None
 
+    def fetch_accepted_since(self, watermark, leetcode_username=None, page_size=20, max_pages=50):
+        """
+        Accepted submissions newer than `watermark` (unix seconds) as
+        [{"slug", "title", "timestamp"}], one entry per slug with its latest
+        accepted timestamp. Returns None when the window since the watermark
+        cannot be fully covered, in which case callers fall back to a deep scan.
+        """
+        found = {}
+
+        def keep(s):
+            ts = int(s["timestamp"])
+            prev = found.get(s["titleSlug"])
+            if prev is None or ts > prev["timestamp"]:
+                found[s["titleSlug"]] = {"slug": s["titleSlug"], "title": s["title"], "timestamp": ts}
+
+        try:
+            # Public recent-AC list: enough when fewer than one page of new solves
+            if leetcode_username:
+                data = self.fetch(USER_AC_SUBMISSIONS_QUERY, {"username": leetcode_username, "limit": page_size})
+                recent = data["data"]["recentAcSubmissionList"] or []
+                if len(recent) < page_size or int(recent[-1]["timestamp"]) <= watermark:
+                    for s in recent:
+                        if int(s["timestamp"]) > watermark:
+                            keep(s)
+                    return list(found.values())
+
+            # Otherwise walk the authenticated submission history back to the watermark
+            for page in range(max_pages):
+                data = self.fetch(USER_SUBMISSION_LIST_QUERY, {"offset": page * page_size, "limit": page_size})
+                submission_list = data["data"]["submissionList"]
+                if submission_list is None:
+                    print("[LC] Submission history unavailable (not authenticated?)")
+                    return None
+
+                for s in submission_list["submissions"]:
+                    if int(s["timestamp"]) <= watermark:
+                        return list(found.values())
+                    if s["statusDisplay"] == "Accepted":
+                        keep(s)
+
+                if not submission_list["hasNext"]:
+                    return list(found.values())
+
+                time.sleep(0.5)
+
+        except Exception as e:
+            print(f"[LC] Error during incremental fetch: {e}")
+            return None
+
+        print(f"[LC] Watermark not reached after {max_pages} pages")
+        return None
+
     def fetch_titles_directly(self, slugs):
         """Converts slugs into clean titles."""
         results = []
@@ -141,7 +197,9 @@ class LeetCodeClient:
                     if q["titleSlug"] in batch:
                         results.append({
                             "title": q["title"],
-                            "slug": q["titleSlug"]
+                            "slug": q["titleSlug"],
+                            "difficulty": q.get("difficulty"),
+                            "topics": [t["slug"] for t in q.get("topicTags") or []]
                         })
                 
                 print(f"[LC] Progress: {len(results)}/{len(slugs_list)} titles fetched...")
@@ -150,4 +208,14 @@ class LeetCodeClient:
             except Exception as e:
                 print(f"[LC] Batch fetch error: {e}")
                 
-        return results
\ No newline at end of file
+        return results
+
+
+_default_client = None
+
+def make_leetcode_request(query, variables):
+    """Run one GraphQL query with the global credentials and return its `data` payload."""
+    global _default_client
+    if _default_client is None:
+        _default_client = LeetCodeClient()
+    return _default_client.fetch(query, variables)["data"]
@@ -0,0 +1,129 @@
+# backend/services/passwords.py
+"""
+bcrypt hashing and verification on a bounded process pool.
+
+A cost-12 bcrypt call is ~250ms of CPU. Run inline, it blocks the request
+thread (and, through the GIL, slows every other request in the process).
+Here it runs in a small pool of worker processes instead. At most
+BCRYPT_MAX_PENDING calls may be queued or running per web process; past
+that, hash_password/verify_password raise PasswordPoolBusy immediately so
+the route can answer 503 instead of piling up a backlog.
+
+Workers are started with the forkserver method (spawn where that is not
+available), never by forking the web process: it already runs job, limiter
+and index threads, and a forked child can inherit a lock one of them held.
+app.start_background() warms the pool so the first login does not pay for
+starting the workers.
+
+BCRYPT_WORKERS=0 runs bcrypt inline (scripts, tests). Use
+scripts/bench_bcrypt.py to pick the worker count and cost factor.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import wait
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+import bcrypt
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+BCRYPT_WORKERS = int(os.getenv("BCRYPT_WORKERS", str(min(os.cpu_count() or 1, 4))))
+BCRYPT_MAX_PENDING = int(os.getenv("BCRYPT_MAX_PENDING", str(max(BCRYPT_WORKERS, 1) * 4)))
+BCRYPT_TIMEOUT = float(os.getenv("BCRYPT_TIMEOUT", "5"))  # seconds
+
+
+# Safe start method for worker processes of a multithreaded parent
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class PasswordPoolBusy(Exception):
+    """The hashing pool is saturated (or timed out); retry later."""
+
+
+def _hash(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+
+def _check(password: bytes, password_hash: bytes) -> bool:
+    return bcrypt.checkpw(password, password_hash)
+
+
+class PasswordPool:
+    def __init__(self, workers=BCRYPT_WORKERS, max_pending=BCRYPT_MAX_PENDING, timeout=BCRYPT_TIMEOUT):
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max(max_pending, 1))
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+
+    def _get_executor(self):
+        # Created lazily and per process, so pre-forking servers each get their own
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(START_METHOD),
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def _reset(self):
+        with self._lock:
+            self._executor = None
+
+    def run(self, fn, *args):
+        if self.workers <= 0:
+            return fn(*args)
+
+        if not self._slots.acquire(blocking=False):
+            raise PasswordPoolBusy("Password hashing pool is saturated")
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool for the next call
+            self._slots.release()
+            self._reset()
+            raise PasswordPoolBusy("Password hashing pool restarted")
+        except BaseException:
+            self._slots.release()
+            raise
+
+        # The slot is held until the worker finishes, even if we stop waiting
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            raise PasswordPoolBusy("Password hashing timed out")
+        except BrokenProcessPool:
+            self._reset()
+            raise PasswordPoolBusy("Password hashing pool restarted")
+
+    def warm(self):
+        """Start every worker process now instead of on the first calls."""
+        if self.workers <= 0:
+            return
+        executor = self._get_executor()
+        wait([executor.submit(_hash, b"", 4) for _ in range(self.workers)])
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_pool = PasswordPool()
+
+
+def hash_password(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    """Hash a password using bcrypt."""
+    return password_pool.run(_hash, password.encode(), rounds).decode()
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Verify a password against its hash."""
+    return password_pool.run(_check, password.encode(), password_hash.encode())
@@ -0,0 +1,232 @@
+# backend/services/read_views.py
+"""
+The request-independent parts of the dashboard read routes.
+
+The Flask views (routes/) and the Quart views (async_routes/) differ only in
+how they read: pymongo and the sync services there, motor and
+services/async_reads.py here. Queries, projections, input validation and
+the shape of every response live in this module, so a fix to any of them
+applies to both apps.
+"""
+
+import time
+from utils.errors import APIError
+from utils.slugs import extract_slug
+from services.sampling import DIFFICULTIES
+
+# Topics with fewer problems than this are not reported as weakest
+MIN_TOPIC_SIZE = 20
+# Size of /api/review/today and how often it refreshes
+REVIEW_LIMIT = 15
+REVIEW_INTERVAL = 24 * 3600
+# Companies returned by /api/companies/top
+TOP_COMPANIES = 12
+# Largest smart plan a request may ask for
+MAX_PLAN_SIZE = 100
+
+
+def problem_link(slug) -> str:
+    return f"https://leetcode.com/problems/{slug}/"
+
+
+# ---------- SUMMARY ----------
+def summary_payload(stats, total_solved) -> dict:
+    return {
+        "totalSolved": total_solved,
+        "totalProblems": stats["total_problems"],
+        "companies": stats["companies"]
+    }
+
+
+def has_topic_stats(stats) -> bool:
+    return bool(stats.get("by_topic"))
+
+
+EMPTY_INSIGHTS = {
+    "most_requested_topic": "N/A",
+    "weakest_topic": "N/A",
+    "daily_review_count": 0,
+    "next_review": "—"
+}
+
+
+def insights_payload(user, stats, coverage, total_solved) -> dict:
+    most_common = max(stats["by_topic"].items(), key=lambda t: t[1])[0]
+
+    # Weakest among topics big enough to matter
+    candidates = [c for c in coverage if c["total"] >= MIN_TOPIC_SIZE] or coverage
+    weakest = candidates[0]["topic"] if candidates else "N/A"
+
+    next_review = "—"
+    if user.get("last_ingested_at"):
+        remaining = user["last_ingested_at"] + REVIEW_INTERVAL - time.time()
+        next_review = f"{int(remaining // 3600)}h" if remaining > 3600 else "now"
+
+    return {
+        "most_requested_topic": most_common,
+        "weakest_topic": weakest,
+        "daily_review_count": min(REVIEW_LIMIT, total_solved),
+        "next_review": next_review,
+        "topic_coverage": coverage
+    }
+
+
+# ---------- COMPANIES ----------
+def top_companies_payload(engine, solved, weighted) -> list:
+    result = engine.score(solved, weighted=weighted)
+
+    # Sort companies by readiness and problem count
+    result.sort(
+        key=lambda x: (x["readiness"], x["commonProblems"]),
+        reverse=True
+    )
+
+    return result[:TOP_COMPANIES]
+
+
+COMPANY_PROBLEM_PROJECTION = {
+    "_id": 1,
+    "slug": 1,
+    "title": 1,
+    "difficulty": 1,
+    "topics": 1,
+    "num_occur": 1,
+}
+
+
+def company_query(company) -> dict:
+    return {"companies": company}
+
+
+def company_problem_row(p, solved):
+    """Response row for one company problem, or None for a doc without a slug."""
+    slug = extract_slug(p)
+    if not slug:
+        return None
+
+    return {
+        "slug": slug,
+        "title": p["title"],
+        "difficulty": p["difficulty"],
+        "topics": p.get("topics", []),
+        "num_occur": p.get("num_occur", 0),
+        "is_solved": slug in solved,
+        "link": problem_link(slug),
+    }
+
+
+# ---------- SMART PLAN ----------
+def plan_options(data):
+    """Validated (num, include_solved, difficulties, seed) from a smart plan request body."""
+    if not isinstance(data, dict):
+        raise APIError("Request body must be a JSON object", 400)
+
+    num = data.get("num", 10)
+    if isinstance(num, bool) or not isinstance(num, int) or not 1 <= num <= MAX_PLAN_SIZE:
+        raise APIError(f"num must be an integer between 1 and {MAX_PLAN_SIZE}", 400)
+
+    difficulties = data.get("difficulties", list(DIFFICULTIES))
+    if not isinstance(difficulties, list):
+        raise APIError("difficulties must be a list", 400)
+    difficulties = [d for d in DIFFICULTIES if d in difficulties]
+
+    seed = data.get("seed")
+    if seed is not None and (isinstance(seed, bool) or not isinstance(seed, (int, str))):
+        raise APIError("seed must be an integer or a string", 400)
+
+    return num, bool(data.get("include_solved", False)), difficulties, seed
+
+
+PLAN_PROJECTION = {
+    "_id": 1,          # 🔥 slug lives here
+    "title": 1,
+    "difficulty": 1,
+    "topics": 1,
+    "acRate": 1,
+}
+
+
+def plan_rows(slugs, docs, solved) -> list:
+    """Response rows for the sampled `slugs`, in sampled order, from {slug: doc}."""
+    final = []
+    for slug in slugs:
+        p = docs.get(slug)
+        if p is None:
+            continue
+
+        final.append({
+            "slug": slug,
+            "title": p["title"],
+            "difficulty": p["difficulty"],
+            "acRate": p.get("acRate", None),
+            "topics": p.get("topics", []),
+            "is_solved": slug in solved,
+            "link": problem_link(slug),
+        })
+
+    return final
+
+
+# ---------- SEARCH ----------
+SEARCH_PROJECTION = {
+    "_id": 1,
+    "id": 1,
+    "title": 1,
+    "difficulty": 1,
+    "topics": 1
+}
+
+
+def search_query(topic, difficulty) -> dict:
+    query = {}
+    if topic:
+        query["topics"] = topic.lower()
+    if difficulty:
+        query["difficulty"] = difficulty.capitalize()
+    return query
+
+
+def search_row(p, solved) -> dict:
+    # slug is the _id unless the doc carries an explicit id
+    slug = p.pop("id", None) or p["_id"]
+    del p["_id"]
+    p["id"] = slug
+    p["is_solved"] = slug in solved
+    p["link"] = problem_link(slug)
+    return p
+
+
+# ---------- REVIEW ----------
+REVIEW_PROJECTION = {
+    "_id": 1,
+    "title": 1,
+    "difficulty": 1,
+    "acRate": 1,
+    "topics": 1,
+    "paidOnly": 1,
+    "hasSolution": 1,
+    "hasVideoSolution": 1,
+}
+
+
+def review_rows(solved, master_docs) -> list:
+    """Review rows for recently solved problems, filled in from {slug: master doc}."""
+    results = []
+    for s in solved:
+        slug = s["slug"]
+        m = master_docs.get(slug)
+
+        results.append({
+            "slug": slug,
+            "title": m["title"] if m else s.get("title", slug),
+            "difficulty": m["difficulty"] if m else "—",
+            "acRate": m.get("acRate") if m else None,
+            "topics": m.get("topics", []) if m else [],
+            "paidOnly": m.get("paidOnly", False) if m else False,
+            "hasSolution": m.get("hasSolution", False) if m else False,
+            "hasVideoSolution": m.get("hasVideoSolution", False) if m else False,
+            "link": problem_link(slug),
+            "indexed": bool(m),
+        })
+
+    return results
@@ -0,0 +1,176 @@
+# backend/services/readiness.py
+"""
+Vectorized readiness engine.
+
+The catalog is held as a problem x company bit matrix restricted to each
+company's top-N problems (see services/company_index.py). Rows are ordered by
+frontendQuestionId, columns by company. A user's solved set becomes a packed
+bit vector, and readiness for every company comes out of one batched
+AND + popcount over the matrix instead of a Python loop per company.
+
+Frequency weighting uses a padded (company x top-N) table of row indices and
+num_occur weights, so weighted scores are one gather + row sum.
+"""
+
+import threading
+import numpy as np
+from utils.db import problems_master
+from services.catalog import get_catalog_version
+from services.company_index import get_company_index, TOP_N
+
+# popcount for every byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint16)
+
+_lock = threading.Lock()
+_cache = {"version": None, "engine": None}
+
+
+def readiness_bucket(raw_score: float) -> int:
+    """
+    raw_score = weighted_solved / weighted_total
+    Returns a motivating but realistic readiness percentage
+    """
+
+    if raw_score >= 0.85:
+        return 92
+    if raw_score >= 0.70:
+        return 80
+    if raw_score >= 0.55:
+        return 68
+    if raw_score >= 0.40:
+        return 55
+    if raw_score >= 0.25:
+        return 42
+    if raw_score >= 0.15:
+        return 30
+    if raw_score > 0:
+        return 22
+    return 15
+
+
+def linear_readiness(solved_count: int, target: int = TOP_N) -> int:
+    """Share of the top `target` problems solved, clamped to [15, 92]."""
+    readiness = int((solved_count / target) * 100)
+    return max(15, min(readiness, 92))
+
+
+class ReadinessEngine:
+    """Readiness scores for every company from one batched bitset intersection."""
+
+    def __init__(self, version, index, question_ids):
+        self.version = version
+        self.companies = sorted(index)
+        self.totals = np.array(
+            [index[c]["total"] for c in self.companies], dtype=np.int32
+        )
+
+        # Rows keyed by frontendQuestionId; slugs without one go at the end
+        member_slugs = {s for entry in index.values() for s in entry["top_slugs"]}
+        ordered = sorted(
+            member_slugs,
+            key=lambda s: (question_ids.get(s) is None, question_ids.get(s) or 0, s),
+        )
+        self.row_of = {slug: i for i, slug in enumerate(ordered)}
+        self.n_rows = len(ordered)
+
+        n_cols = len(self.companies)
+        width = max((len(index[c]["top_slugs"]) for c in self.companies), default=0)
+
+        membership = np.zeros((self.n_rows, n_cols), dtype=bool)
+        self.top_rows = np.zeros((n_cols, width), dtype=np.int32)
+        self.top_weights = np.zeros((n_cols, width), dtype=np.float32)
+
+        for col, company in enumerate(self.companies):
+            entry = index[company]
+            rows = [self.row_of[s] for s in entry["top_slugs"]]
+            freqs = entry["top_freqs"] or [1] * len(rows)
+
+            membership[rows, col] = True
+            self.top_rows[col, :len(rows)] = rows
+            self.top_weights[col, :len(rows)] = freqs
+
+        # (ceil(rows / 8), companies) packed bit matrix
+        self.bits = np.packbits(membership, axis=0)
+        self.weight_totals = self.top_weights.sum(axis=1)
+
+    def solved_vector(self, solved) -> np.ndarray:
+        """Boolean row vector of the solved slugs that appear in any top list."""
+        vec = np.zeros(self.n_rows, dtype=bool)
+        rows = [self.row_of[s] for s in solved if s in self.row_of]
+        if rows:
+            vec[rows] = True
+        return vec
+
+    def solved_counts(self, vec: np.ndarray) -> np.ndarray:
+        """Solved top-N problems per company (AND + popcount over packed bits)."""
+        packed = np.packbits(vec)
+        return _POPCOUNT[self.bits & packed[:, None]].sum(axis=0, dtype=np.int64)
+
+    def weighted_ratios(self, vec: np.ndarray) -> np.ndarray:
+        """num_occur-weighted share of each company's top-N problems that is solved."""
+        if self.n_rows == 0:
+            return np.zeros(len(self.companies), dtype=np.float32)
+        solved_weight = (vec[self.top_rows] * self.top_weights).sum(axis=1)
+        return np.divide(
+            solved_weight,
+            self.weight_totals,
+            out=np.zeros_like(solved_weight),
+            where=self.weight_totals > 0,
+        )
+
+    def score(self, solved, weighted: bool = False, curve=readiness_bucket) -> list:
+        """
+        Readiness for every company.
+        weighted=False: linear share of the top-N solved (the dashboard default).
+        weighted=True: num_occur-weighted ratio mapped through `curve`.
+        """
+        vec = self.solved_vector(solved)
+        counts = self.solved_counts(vec)
+        ratios = self.weighted_ratios(vec) if weighted else None
+
+        result = []
+        for col, company in enumerate(self.companies):
+            if weighted:
+                readiness = curve(float(ratios[col]))
+            else:
+                readiness = linear_readiness(int(counts[col]))
+
+            result.append({
+                "name": company,
+                "commonProblems": int(self.totals[col]),
+                "solvedTop": int(counts[col]),
+                "readiness": readiness,
+            })
+
+        return result
+
+
+def _load_question_ids() -> dict:
+    return {
+        p["_id"]: p["frontendQuestionId"]
+        for p in problems_master.find(
+            {"frontendQuestionId": {"$exists": True}},
+            {"_id": 1, "frontendQuestionId": 1},
+        )
+    }
+
+
+def peek_readiness_engine():
+    """The engine if it is already built for the current catalog version, else None."""
+    return _cache["engine"] if _cache["version"] == get_catalog_version() else None
+
+
+def get_readiness_engine() -> ReadinessEngine:
+    """Engine for the current catalog version, rebuilt only when the catalog changes."""
+    version = get_catalog_version()
+    if _cache["version"] == version:
+        return _cache["engine"]
+
+    with _lock:
+        if _cache["version"] == version:
+            return _cache["engine"]
+
+        engine = ReadinessEngine(version, get_company_index(), _load_question_ids())
+        _cache["version"] = version
+        _cache["engine"] = engine
+        return engine
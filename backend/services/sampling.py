@@ -0,0 +1,177 @@
+# backend/services/sampling.py
+"""
+Frequency-weighted sampling of a company's problems for smart plans.
+
+Per catalog version we keep, for every company, parallel arrays of slugs,
+difficulties and weights (num_occur + 1, so unseen problems keep a small
+chance). For each requested difficulty mix an alias table is built once
+(Vose's method) and then reused: drawing a problem is O(1), and solved or
+already-picked problems are rejected and redrawn. When most candidates are
+excluded the sampler switches to one weighted pass over the remaining
+candidates (Efraimidis-Spirakis keys) instead of rejecting forever.
+"""
+
+import heapq
+import random
+import threading
+from utils.db import problems_master
+from services.catalog import get_catalog_version
+
+DIFFICULTIES = ("Easy", "Medium", "Hard")
+
+_lock = threading.Lock()
+_cache = {"version": None, "sampler": None}
+
+
+class AliasTable:
+    """O(1) draws from a fixed discrete distribution (Vose's alias method)."""
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+
+        self.n = n
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def draw(self, rng) -> int:
+        i = rng.randrange(self.n)
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+class CompanyCandidates:
+    """
+    Candidate arrays for one company, with alias tables per difficulty mix.
+    Mixes are subsets of DIFFICULTIES, so there are at most 8 tables.
+    """
+
+    _tables_lock = threading.Lock()
+
+    def __init__(self):
+        self.slugs = []
+        self.difficulties = []
+        self.weights = []
+        self._tables = {}
+
+    def add(self, slug, difficulty, weight):
+        self.slugs.append(slug)
+        self.difficulties.append(difficulty)
+        self.weights.append(weight)
+
+    def table(self, difficulties):
+        """(indices, AliasTable) restricted to `difficulties` (a frozenset of DIFFICULTIES)."""
+        entry = self._tables.get(difficulties)
+        if entry is not None:
+            return entry
+
+        with self._tables_lock:
+            entry = self._tables.get(difficulties)
+            if entry is None:
+                indices = [i for i, d in enumerate(self.difficulties) if d in difficulties]
+                table = AliasTable([self.weights[i] for i in indices]) if indices else None
+                entry = (indices, table)
+                self._tables[difficulties] = entry
+        return entry
+
+
+class PlanSampler:
+    def __init__(self, version, companies):
+        self.version = version
+        self.companies = companies
+
+    def sample(self, company, num, difficulties, exclude=None, seed=None) -> list:
+        """
+        Up to `num` distinct slugs from `company` with the given difficulties,
+        drawn without replacement proportionally to frequency, skipping slugs
+        in `exclude`. The same seed gives the same plan for the same catalog.
+        """
+        candidates = self.companies.get(company)
+        if candidates is None or num <= 0:
+            return []
+
+        # Only known difficulties make a table key, whatever the caller passes
+        mix = frozenset(d for d in DIFFICULTIES if d in difficulties)
+        indices, table = candidates.table(mix)
+        if table is None:
+            return []
+        num = min(num, len(indices))
+
+        rng = random.Random(seed)
+        exclude = exclude or frozenset()
+        chosen = []
+        seen = set()
+
+        # Rejection sampling from the alias table; cheap while most candidates are eligible
+        attempts = 4 * num + 32
+        while len(chosen) < num and attempts > 0:
+            attempts -= 1
+            i = indices[table.draw(rng)]
+            slug = candidates.slugs[i]
+            if slug in seen or slug in exclude:
+                continue
+            seen.add(slug)
+            chosen.append(slug)
+
+        if len(chosen) < num:
+            # Dense exclusions: one weighted pass (key = u ** (1 / w)) over what is left
+            remaining = [
+                i for i in indices
+                if candidates.slugs[i] not in seen and candidates.slugs[i] not in exclude
+            ]
+            keyed = (
+                (rng.random() ** (1.0 / candidates.weights[i]), i) for i in remaining
+            )
+            for _, i in heapq.nlargest(num - len(chosen), keyed):
+                chosen.append(candidates.slugs[i])
+
+        return chosen
+
+
+def build_sampler(version) -> PlanSampler:
+    companies = {}
+    cursor = problems_master.find(
+        {"companies.0": {"$exists": True}},
+        {"_id": 1, "companies": 1, "difficulty": 1, "num_occur": 1},
+    )
+    for p in cursor:
+        weight = max(p.get("num_occur") or 0, 0) + 1
+        for c in p["companies"]:
+            companies.setdefault(c, CompanyCandidates()).add(p["_id"], p.get("difficulty"), weight)
+
+    return PlanSampler(version, companies)
+
+
+def peek_sampler():
+    """The sampler if it is already built for the current catalog version, else None."""
+    return _cache["sampler"] if _cache["version"] == get_catalog_version() else None
+
+
+def get_sampler() -> PlanSampler:
+    """Sampler for the current catalog version, rebuilt only when the catalog changes."""
+    version = get_catalog_version()
+    if _cache["version"] == version:
+        return _cache["sampler"]
+
+    with _lock:
+        if _cache["version"] == version:
+            return _cache["sampler"]
+
+        sampler = build_sampler(version)
+        _cache["version"] = version
+        _cache["sampler"] = sampler
+        return sampler
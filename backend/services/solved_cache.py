@@ -0,0 +1,132 @@
+# backend/services/solved_cache.py
+"""
+Per-process cache of users' solved slug sets.
+
+Entries are tagged with the user's solved_version, which the archive writer
+bumps whenever it changes user_solved, so a request carrying a newer user
+record never sees an older set. The cache is bounded by the total number of
+cached slugs and evicts least recently used users first. A load that races
+with invalidate() is not stored, so invalidation cannot be undone by a
+reader that started before it. Invalidations are only counted for users with
+a load in flight, so that bookkeeping goes away with the last load.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from services.solved_store import load_solved_slugs
+
+SOLVED_CACHE_MAX_SLUGS = int(os.getenv("SOLVED_CACHE_MAX_SLUGS", "500000"))
+
+
+class SolvedSetCache:
+    def __init__(self, max_slugs=SOLVED_CACHE_MAX_SLUGS):
+        self.max_slugs = max_slugs
+        self._entries = OrderedDict()   # user_id -> (solved_version, frozenset)
+        self._fills = {}                # user_id -> [loads in flight, invalidations since the first]
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user) -> frozenset:
+        """The user's solved slugs, loaded on a miss or when solved_version moved."""
+        solved, epoch = self.lookup(user)
+        if solved is None:
+            try:
+                solved = frozenset(load_solved_slugs(user))
+            except BaseException:
+                self.cancel(user)
+                raise
+            self.offer(user, solved, epoch)
+        return solved
+
+    def lookup(self, user):
+        """
+        (solved, None) on a hit; (None, epoch) on a miss. Loaders that do
+        their own I/O pass the epoch back to offer() with what they loaded,
+        or call cancel() if the load failed.
+        """
+        key = str(user["_id"])
+        version = user.get("solved_version", 0)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1], None
+
+            self.misses += 1
+            fill = self._fills.setdefault(key, [0, 0])
+            fill[0] += 1
+            return None, fill[1]
+
+    def offer(self, user, solved, epoch):
+        """Store a loaded set unless the user was invalidated since lookup()."""
+        key = str(user["_id"])
+        with self._lock:
+            fill = self._finish_fill(key)
+            if fill is not None and fill[1] == epoch:
+                self._store(key, user.get("solved_version", 0), solved)
+
+    def cancel(self, user):
+        """End a load started by lookup() without storing anything."""
+        with self._lock:
+            self._finish_fill(str(user["_id"]))
+
+    def _finish_fill(self, key):
+        fill = self._fills.get(key)
+        if fill is not None:
+            fill[0] -= 1
+            if fill[0] <= 0:
+                del self._fills[key]
+        return fill
+
+    def _store(self, key, version, solved):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old[1])
+
+        if len(solved) > self.max_slugs:
+            return
+
+        self._entries[key] = (version, solved)
+        self._size += len(solved)
+
+        while self._size > self.max_slugs:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def invalidate(self, user_id):
+        key = str(user_id)
+        with self._lock:
+            fill = self._fills.get(key)
+            if fill is not None:
+                fill[1] += 1
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old[1])
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "users": len(self._entries),
+                "loading": len(self._fills),
+                "slugs": self._size,
+                "max_slugs": self.max_slugs,
+            }
+
+
+solved_cache = SolvedSetCache()
+
+
+def get_solved_set(user) -> frozenset:
+    """Solved slugs for `user` (a g.user record) through the shared cache."""
+    return solved_cache.get(user)
+
+
+def invalidate_solved(user_id):
+    solved_cache.invalidate(user_id)
@@ -0,0 +1,192 @@
+# backend/services/solved_store.py
+"""
+Read/write access to a user's solved problems.
+
+Solved problems live in the shared user_solved collection, keyed by
+(user_id, slug). Users created before that collection existed still have an
+archive_solved_{username} collection. Until scripts/migrate_user_solved.py
+has moved a user over (user["solved_store"] == "shared"), reads merge both
+sources so every route keeps working while the migration runs.
+"""
+
+import os
+import time
+from pymongo import UpdateOne
+from utils.db import users_col, user_solved, user_solved_col
+from utils.slugs import extract_slug
+from services.user_cache import invalidate_user
+from services.topic_coverage import record_new_solves, drop_coverage
+
+SHARED_STORE = "shared"
+
+# Upserts per bulk_write round trip when archiving solved problems
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+
+
+def is_migrated(user) -> bool:
+    """True once the user's legacy collection has been merged into user_solved."""
+    return user.get("solved_store") == SHARED_STORE
+
+
+def load_solved_slugs(user) -> set:
+    """All solved slugs for the user."""
+    solved = {
+        d["slug"]
+        for d in user_solved.find({"user_id": user["_id"]}, {"_id": 0, "slug": 1})
+    }
+
+    if not is_migrated(user):
+        legacy = user_solved_col(user["username"]).find(
+            {}, {"slug": 1, "titleSlug": 1, "link": 1}
+        )
+        for d in legacy:
+            slug = extract_slug(d)
+            if slug:
+                solved.add(slug)
+
+    return solved
+
+
+def count_solved(user) -> int:
+    """
+    Number of distinct solved problems for the user. Uses the solved_count
+    counter kept by SolvedArchiveWriter; users without one get it
+    backfilled once, so the full count never runs per request.
+    """
+    if "solved_count" in user:
+        return user["solved_count"]
+
+    return refresh_solved_count(user)
+
+
+def refresh_solved_count(user) -> int:
+    """Recount the user's solved problems and store the result as solved_count."""
+    if is_migrated(user):
+        count = user_solved.count_documents({"user_id": user["_id"]})
+    else:
+        # Legacy rows may overlap user_solved; count distinct slugs
+        count = len(load_solved_slugs(user))
+
+    users_col.update_one({"_id": user["_id"]}, {"$set": {"solved_count": count}})
+    invalidate_user(user["_id"])
+    return count
+
+
+def recent_solved(user, limit: int) -> list:
+    """The user's `limit` most recently archived problems as {slug, title, archived_at}."""
+    projection = {"_id": 0, "slug": 1, "title": 1, "archived_at": 1}
+
+    docs = list(
+        user_solved.find({"user_id": user["_id"]}, projection)
+        .sort("archived_at", -1)
+        .limit(limit)
+    )
+
+    if not is_migrated(user):
+        seen = {d["slug"] for d in docs}
+        legacy = (
+            user_solved_col(user["username"])
+            .find({}, projection)
+            .sort("archived_at", -1)
+            .limit(limit)
+        )
+        docs.extend(d for d in legacy if d.get("slug") and d["slug"] not in seen)
+        docs.sort(key=lambda d: d.get("archived_at") or 0, reverse=True)
+
+    return docs[:limit]
+
+
+def bump_solved_version(user_id, inserted: int = 0) -> None:
+    """
+    Mark the user's solved set as changed so cached copies are reloaded,
+    and add `inserted` to the solved_count counter if the user has one.
+    """
+    # Imported here: services.solved_cache imports this module
+    from services.solved_cache import invalidate_solved
+
+    users_col.update_one({"_id": user_id}, {"$inc": {"solved_version": 1}})
+    if inserted:
+        users_col.update_one(
+            {"_id": user_id, "solved_count": {"$exists": True}},
+            {"$inc": {"solved_count": inserted}}
+        )
+    invalidate_user(user_id)
+    invalidate_solved(user_id)
+
+
+class SolvedArchiveWriter:
+    """
+    Buffers solved-problem upserts for one user and flushes them to
+    user_solved as unordered bulk writes of `batch_size` operations.
+
+    Only the title is $set on existing rows, so re-archiving an unchanged
+    problem is reported as unchanged rather than modified. When the solve
+    time is known, archived_at moves forward to it ($max), so review
+    ordering follows the latest accepted submission.
+    """
+
+    def __init__(self, user, batch_size: int = None):
+        self.user = user
+        self.user_id = user["_id"]
+        self.migrated = is_migrated(user)
+        self.batch_size = batch_size or ARCHIVE_BATCH_SIZE
+        self._ops = []
+        self._slugs = []
+        self.new_slugs = []
+        self.inserted = 0
+        self.modified = 0
+        self.unchanged = 0
+
+    def add(self, slug: str, title: str, solved_at: float = None) -> None:
+        now = time.time()
+        update = {"$set": {"title": title}, "$setOnInsert": {"updated_at": now}}
+        if solved_at is None:
+            update["$setOnInsert"]["archived_at"] = now
+        else:
+            update["$max"] = {"archived_at": solved_at}
+
+        self._ops.append(UpdateOne(
+            {"user_id": self.user_id, "slug": slug}, update, upsert=True
+        ))
+        self._slugs.append(slug)
+
+        if len(self._ops) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._ops:
+            return
+
+        result = user_solved.bulk_write(self._ops, ordered=False)
+        self.inserted += result.upserted_count
+        self.modified += result.modified_count
+        self.unchanged += result.matched_count - result.modified_count
+        self.new_slugs.extend(self._slugs[i] for i in result.upserted_ids)
+        self._ops = []
+        self._slugs = []
+
+    def close(self) -> dict:
+        """Flush what is left, bump solved_version if anything changed and return the write summary."""
+        self.flush()
+
+        # An insert is only a new distinct solve when there are no legacy
+        # rows to overlap and the counter exists; otherwise recount once here
+        counted = self.migrated and "solved_count" in self.user
+        if self.inserted or self.modified:
+            bump_solved_version(self.user_id, self.inserted if counted else 0)
+        if self.inserted and not counted:
+            refresh_solved_count(self.user)
+
+        # Legacy rows may already cover a "new" slug; rebuild instead of double
+        # counting. Coverage is only incremental for migrated users (see topic_coverage)
+        if self.new_slugs and self.migrated:
+            record_new_solves(self.user_id, self.new_slugs)
+        elif self.new_slugs:
+            drop_coverage(self.user_id)
+
+        return {
+            "inserted": self.inserted,
+            "modified": self.modified,
+            "unchanged": self.unchanged,
+        }
+
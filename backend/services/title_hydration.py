@@ -0,0 +1,71 @@
+# backend/services/title_hydration.py
+"""
+Resolve problem titles for a list of slugs.
+
+problems_master already holds the title of nearly every problem, so titles
+come from one $in lookup against the catalog. Only the slugs missing from
+the catalog go to LeetCode (concurrent batches on the AsyncLeetCodeClient),
+and what comes back is written to problems_master so the next user does
+not pay for it again.
+
+The stubs carry no company data, so nothing derived from the catalog
+(company index, readiness, sampler) changes. Writing them therefore does
+not bump the catalog version, which would make every process rebuild that
+data on its next request. Catalog stats pick the stubs up at the next real
+catalog ingestion.
+"""
+
+import time
+from pymongo import UpdateOne
+from utils.db import problems_master
+
+
+def _write_back(fetched):
+    """Insert catalog stubs for problems fetched from LeetCode. Returns how many were new."""
+    now = time.time()
+    ops = [
+        UpdateOne(
+            {"_id": p["slug"]},
+            {"$setOnInsert": {
+                "title": p["title"],
+                "difficulty": p["difficulty"],
+                "topics": p.get("topics", []),
+                "companies": [],
+                "by_company": {},
+                "num_occur": 0,
+                "hydrated_at": now,
+            }},
+            upsert=True,
+        )
+        for p in fetched
+        if p.get("difficulty")
+    ]
+    if not ops:
+        return 0
+
+    return problems_master.bulk_write(ops, ordered=False).upserted_count
+
+
+async def hydrate_titles(slugs, client) -> list:
+    """
+    Return [{"slug", "title"}] for `slugs`, in order.
+    Slugs LeetCode cannot resolve keep their slug as title.
+    """
+    slugs = list(dict.fromkeys(slugs))
+
+    titles = {
+        p["_id"]: p["title"]
+        for p in problems_master.find(
+            {"_id": {"$in": slugs}, "title": {"$exists": True}},
+            {"_id": 1, "title": 1},
+        )
+    }
+
+    misses = [s for s in slugs if s not in titles]
+    if misses:
+        print(f"[HYDRATE] {len(slugs) - len(misses)} titles from catalog, fetching {len(misses)}")
+        fetched = await client.fetch_titles_batch(misses)
+        titles.update({p["slug"]: p["title"] for p in fetched})
+        _write_back(fetched)
+
+    return [{"slug": s, "title": titles.get(s, s)} for s in slugs]
@@ -0,0 +1,115 @@
+# backend/services/topic_coverage.py
+"""
+Per-user topic coverage.
+
+user_topic_coverage holds one document per user:
+
+    {_id: user_id, catalog_version,
+     topics: {topic_slug: {"solved": n, "weight": sum of num_occur}}}
+
+The archive writer increments it as new solves are inserted, so insights
+read stored numbers. That is only done for users on the shared user_solved
+store: for users that still have a legacy archive_solved_* collection an
+"inserted" row may already be counted from the legacy side, so the writer
+drops their document instead and the next read rebuilds it. Coverage is
+therefore only incremental once a user is migrated (all users registered
+since user_solved exists are). A document is rebuilt from the user's solved set when
+it is missing or was built against an older catalog version; catalog-side
+totals come from the catalog stats document.
+"""
+
+import time
+from utils.db import problems_master, user_coverage_col
+from services.catalog import get_catalog_version, get_catalog_stats
+
+
+def _topic_counts(slugs) -> dict:
+    """{topic: {"solved", "weight"}} for the given solved slugs."""
+    topics = {}
+    if not slugs:
+        return topics
+
+    cursor = problems_master.find(
+        {"_id": {"$in": list(slugs)}},
+        {"_id": 0, "topics": 1, "num_occur": 1},
+    )
+    for p in cursor:
+        weight = p.get("num_occur", 0)
+        for t in p.get("topics", []):
+            entry = topics.setdefault(t, {"solved": 0, "weight": 0})
+            entry["solved"] += 1
+            entry["weight"] += weight
+
+    return topics
+
+
+def rebuild_coverage(user, solved) -> dict:
+    """Recompute the user's coverage document from their full solved set."""
+    doc = {
+        "_id": user["_id"],
+        "catalog_version": get_catalog_version(),
+        "topics": _topic_counts(solved),
+        "updated_at": time.time(),
+    }
+    user_coverage_col.replace_one({"_id": user["_id"]}, doc, upsert=True)
+    return doc
+
+
+def record_new_solves(user_id, slugs) -> None:
+    """Add newly archived solves to an existing coverage document."""
+    inc = {}
+    for topic, counts in _topic_counts(slugs).items():
+        inc[f"topics.{topic}.solved"] = counts["solved"]
+        inc[f"topics.{topic}.weight"] = counts["weight"]
+
+    if inc:
+        user_coverage_col.update_one(
+            {"_id": user_id},
+            {"$inc": inc, "$set": {"updated_at": time.time()}},
+        )
+
+
+def drop_coverage(user_id) -> None:
+    """Forget the stored coverage; it is rebuilt on the next read."""
+    user_coverage_col.delete_one({"_id": user_id})
+
+
+def get_coverage(user, solved_loader) -> list:
+    """
+    Coverage per catalog topic, sorted weakest first:
+    [{"topic", "solved", "total", "ratio"}], where ratio is num_occur-weighted
+    when the catalog has frequency data and count-based otherwise.
+    """
+    stats = get_catalog_stats()
+
+    doc = user_coverage_col.find_one({"_id": user["_id"]})
+    if not doc or doc.get("catalog_version") != stats["catalog_version"]:
+        doc = rebuild_coverage(user, solved_loader(user))
+
+    return coverage_rows(doc, stats)
+
+
+def coverage_rows(doc, stats) -> list:
+    """Coverage rows (see get_coverage) from a stored coverage document."""
+    user_topics = doc.get("topics", {})
+    topic_weights = stats.get("topic_weights", {})
+
+    coverage = []
+    for topic, total in stats.get("by_topic", {}).items():
+        mine = user_topics.get(topic, {"solved": 0, "weight": 0})
+        total_weight = topic_weights.get(topic, 0)
+
+        if total_weight:
+            ratio = mine["weight"] / total_weight
+        else:
+            ratio = mine["solved"] / total if total else 0.0
+
+        coverage.append({
+            "topic": topic,
+            "solved": mine["solved"],
+            "total": total,
+            "ratio": round(ratio, 4),
+        })
+
+    coverage.sort(key=lambda c: (c["ratio"], -c["total"]))
+    return coverage
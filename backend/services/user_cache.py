@@ -0,0 +1,61 @@
+# backend/services/user_cache.py
+"""
+Per-process cache of user records for authenticated requests.
+
+Records are bounded by USER_CACHE_SIZE (LRU) and USER_CACHE_TTL seconds.
+Code that changes a user document calls invalidate_user() so the next
+request in this process reloads it; other processes pick the change up
+within the TTL.
+"""
+
+import os
+from bson import ObjectId
+from utils.db import users_col
+from utils.cache import TTLCache
+
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+
+# Everything request handlers need; never the password hash or credentials
+USER_FIELDS = {
+    "email": 1,
+    "username": 1,
+    "leetcode_username": 1,
+    "ingestion_status": 1,
+    "ingestion_job_id": 1,
+    "last_ingested_at": 1,
+    "solved_store": 1,
+    "solved_version": 1,
+    "solved_count": 1,
+    "solved_watermark": 1,
+    "created_at": 1,
+}
+
+_cache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
+
+def peek_user(user_id):
+    """The cached record for `user_id`, or None on a miss."""
+    return _cache.get(str(user_id))
+
+
+def remember_user(user):
+    """Cache a user record loaded with USER_FIELDS."""
+    _cache.set(str(user["_id"]), user)
+
+
+def get_user(user_id):
+    """Cached user record for `user_id` (str or ObjectId), or None if it does not exist."""
+    user = peek_user(user_id)
+    if user is not None:
+        return user
+
+    user = users_col.find_one({"_id": ObjectId(str(user_id))}, USER_FIELDS)
+    if user is not None:
+        remember_user(user)
+    return user
+
+
+def invalidate_user(user_id):
+    """Drop the cached record after the user document changed."""
+    _cache.pop(str(user_id))
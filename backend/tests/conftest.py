@@ -0,0 +1,67 @@
+"""
+Shared fixtures: every test runs against an empty mongomock database.
+
+utils.db creates its client lazily, so swapping MongoClient before anything
+touches a collection is enough; no test needs a MongoDB server.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import mongomock
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("DB_NAME", "leetcode_tracker_test")
+os.environ.setdefault("RATELIMIT_STORAGE_URI", "memory://")
+os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret-for-the-test-suite-only")
+os.environ.setdefault("JWT_REFRESH_SECRET_KEY", "test-jwt-refresh-secret-for-the-test-suite-only")
+
+import utils.db  # noqa: E402
+
+utils.db.MongoClient = mongomock.MongoClient
+
+
+@pytest.fixture(autouse=True)
+def db():
+    """The test database, emptied and with the per-process caches cleared."""
+    from services import catalog, sampling, solved_cache, user_cache
+
+    database = utils.db.get_client()[utils.db.DB_NAME]
+    for name in database.list_collection_names():
+        database[name].delete_many({})
+
+    catalog._version_cache.update(version=None, checked_at=0.0)
+    catalog._stats_cache.update(version=None, stats=None)
+    sampling._cache.update(version=None, sampler=None)
+    user_cache._cache.clear()
+    solved_cache.solved_cache = solved_cache.SolvedSetCache()
+
+    yield database
+
+
+@pytest.fixture
+def make_user(db):
+    """
+    Insert a user document and return it. migrated=False gives a user from
+    before user_solved: no solved_store flag and no solved_count.
+    """
+    from bson import ObjectId
+    from services.solved_store import SHARED_STORE
+
+    def make(username="alice", migrated=True, **fields):
+        user = {
+            "_id": ObjectId(),
+            "email": f"{username}@example.com",
+            "username": username,
+            "solved_version": 0,
+        }
+        if migrated:
+            user.update(solved_store=SHARED_STORE, solved_count=0)
+        user.update(fields)
+        utils.db.users_col.insert_one(user)
+        return user
+
+    return make
@@ -0,0 +1,55 @@
+from utils.db import problems_master, company_index_col, catalog_meta
+from services.catalog import bump_catalog_version, get_catalog_version, publish_catalog_version
+from services.company_index import build_company_index, get_company_index
+
+
+def seed_problems():
+    problems_master.insert_many([
+        {"_id": "two-sum", "companies": ["acme", "initech"], "num_occur": 9},
+        {"_id": "lru-cache", "companies": ["acme"], "num_occur": 4},
+        {"_id": "word-ladder", "companies": ["initech"], "num_occur": 1},
+    ])
+
+
+def test_published_index_is_served_as_persisted():
+    seed_problems()
+    version = publish_catalog_version(build_company_index)
+
+    assert get_catalog_version(max_age=0) == version
+    assert company_index_col.count_documents({"catalog_version": version}) == 2
+
+    index = get_company_index()
+    assert index["acme"]["top_slugs"] == ["two-sum", "lru-cache"]
+    assert index["initech"]["total"] == 2
+
+
+def test_requests_never_write_the_index():
+    seed_problems()
+    bump_catalog_version()
+
+    assert get_company_index()["acme"]["top_slugs"] == ["two-sum", "lru-cache"]
+    assert company_index_col.count_documents({}) == 0
+
+
+def test_rebuild_drops_companies_without_problems():
+    seed_problems()
+    build_company_index(1)
+    problems_master.update_many({}, {"$pull": {"companies": "initech"}})
+
+    build_company_index(2)
+    assert [d["_id"] for d in company_index_col.find()] == ["acme"]
+
+
+def test_publish_retries_when_another_writer_wins():
+    seed_problems()
+    built = []
+
+    def rebuild(version):
+        built.append(version)
+        if len(built) == 1:
+            bump_catalog_version()   # a concurrent publish lands first
+
+    version = publish_catalog_version(rebuild)
+    assert built == [1, 2]
+    assert version == 2
+    assert catalog_meta.find_one({"_id": "version"})["version"] == 2
@@ -0,0 +1,84 @@
+import asyncio
+import json
+import httpx
+import pytest
+from utils.db import problems_master, users_col, user_solved
+from services.async_leetcode_client import AsyncLeetCodeClient
+from services.ingestion import sync_user_solved, FULL_SYNC, INCREMENTAL_SYNC
+
+TOTAL = 250
+
+
+def solved_pages(fail_skip=None):
+    """MockTransport handler serving TOTAL solved slugs in pages, optionally failing one page."""
+    def handler(request):
+        variables = json.loads(request.content)["variables"]
+        skip, limit = variables["skip"], variables["limit"]
+        if skip == fail_skip:
+            return httpx.Response(400, json={"errors": ["bad page"]})
+        questions = [{"titleSlug": f"problem-{i}"} for i in range(skip, min(skip + limit, TOTAL))]
+        return httpx.Response(200, json={"data": {"problemsetQuestionList": {
+            "totalNum": TOTAL, "questions": questions,
+        }}})
+    return handler
+
+
+async def scan(handler):
+    async with AsyncLeetCodeClient(rate=1000) as client:
+        await client.http.aclose()
+        client.http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return await client.fetch_all_accepted_slugs()
+
+
+def test_deep_scan_collects_every_page():
+    slugs = asyncio.run(scan(solved_pages()))
+    assert sorted(slugs) == sorted(f"problem-{i}" for i in range(TOTAL))
+
+
+def test_deep_scan_raises_when_a_page_fails():
+    with pytest.raises(ValueError, match="1 of 3 solved pages failed"):
+        asyncio.run(scan(solved_pages(fail_skip=100)))
+
+
+class FakeClient:
+    """Async client stand-in returning fixed LeetCode data."""
+
+    def __init__(self, slugs=(), submissions=None):
+        self.slugs = list(slugs)
+        self.submissions = submissions
+        self.title_lookups = []
+
+    async def fetch_all_accepted_slugs(self):
+        return self.slugs
+
+    async def fetch_accepted_since(self, watermark, leetcode_username=None):
+        return self.submissions
+
+    async def fetch_titles_batch(self, slugs):
+        self.title_lookups.extend(slugs)
+        return [{"slug": s, "title": s.title(), "difficulty": "Easy"} for s in slugs]
+
+
+def test_full_sync_hydrates_misses_from_leetcode(make_user):
+    user = make_user()
+    problems_master.insert_one({"_id": "two-sum", "title": "Two Sum"})
+    client = FakeClient(["two-sum", "new-problem"])
+
+    summary = asyncio.run(sync_user_solved(user, client))
+
+    assert summary["mode"] == FULL_SYNC
+    assert summary["inserted"] == 2
+    assert client.title_lookups == ["new-problem"]
+    assert user_solved.find_one({"slug": "two-sum"})["title"] == "Two Sum"
+    assert users_col.find_one({"_id": user["_id"]})["solved_watermark"] is not None
+
+
+def test_incremental_sync_archives_new_submissions(make_user):
+    user = make_user(solved_watermark=100)
+    client = FakeClient(submissions=[{"slug": "two-sum", "title": "Two Sum", "timestamp": 150}])
+
+    summary = asyncio.run(sync_user_solved(user, client))
+
+    assert summary["mode"] == INCREMENTAL_SYNC
+    assert user_solved.find_one({"slug": "two-sum"})["archived_at"] == 150
+    assert users_col.find_one({"_id": user["_id"]})["solved_watermark"] == 150
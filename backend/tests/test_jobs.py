@@ -0,0 +1,123 @@
+import time
+import pytest
+from utils.db import jobs_col, users_col
+from utils.indexes import ensure_indexes
+from services import jobs
+
+
+def expire_lease(job):
+    jobs_col.update_one({"_id": job["_id"]}, {"$set": {"locked_at": time.time() - jobs.LEASE_SECONDS - 1}})
+
+
+def test_claim_is_exclusive(make_user):
+    user = make_user()
+    job = jobs.enqueue("ingest", user_id=user["_id"])
+    assert jobs.enqueue("ingest", user_id=user["_id"])["_id"] == job["_id"]
+
+    claimed = jobs.claim("worker-a")
+    assert claimed["_id"] == job["_id"]
+    assert claimed["status"] == jobs.RUNNING
+    assert claimed["attempts"] == 1
+    assert users_col.find_one({"_id": user["_id"]})["ingestion_status"] == "ingesting"
+
+    assert jobs.claim("worker-b") is None
+
+
+def test_expired_lease_is_reclaimed():
+    job = jobs.enqueue("ingest")
+    jobs.claim("worker-a")
+
+    # worker-a stops heartbeating
+    expire_lease(job)
+
+    reclaimed = jobs.claim("worker-b")
+    assert reclaimed["_id"] == job["_id"]
+    assert reclaimed["locked_by"] == "worker-b"
+    assert reclaimed["attempts"] == 2
+
+    # The old owner can no longer finish or heartbeat the job
+    assert not jobs.complete(reclaimed, "worker-a")
+    jobs.JobContext(reclaimed, "worker-a").progress("stale", 1, 2)
+    stored = jobs_col.find_one({"_id": job["_id"]})
+    assert stored["status"] == jobs.RUNNING
+    assert stored["progress"]["stage"] == jobs.QUEUED
+
+    assert jobs.complete(reclaimed, "worker-b")
+    assert jobs_col.find_one({"_id": job["_id"]})["status"] == jobs.SUCCEEDED
+
+
+def test_live_lease_is_not_reclaimed():
+    jobs.enqueue("ingest")
+    claimed = jobs.claim("worker-a")
+    jobs.JobContext(claimed, "worker-a").progress("fetching", 1, 10)
+    assert jobs.claim("worker-b") is None
+
+
+def test_failure_backs_off_then_gives_up():
+    job = jobs.enqueue("ingest", max_attempts=2)
+
+    jobs.fail(jobs.claim("worker-a"), "worker-a", "boom")
+    stored = jobs_col.find_one({"_id": job["_id"]})
+    assert stored["status"] == jobs.QUEUED
+    assert stored["run_after"] > time.time()
+    assert jobs.claim("worker-a") is None
+
+    jobs_col.update_one({"_id": job["_id"]}, {"$set": {"run_after": 0}})
+    jobs.fail(jobs.claim("worker-a"), "worker-a", "boom again")
+    stored = jobs_col.find_one({"_id": job["_id"]})
+    assert stored["status"] == jobs.FAILED
+    assert stored["error"] == "boom again"
+
+
+def test_job_that_keeps_losing_its_worker_fails(make_user):
+    user = make_user()
+    job = jobs.enqueue("ingest", user_id=user["_id"], max_attempts=2)
+
+    jobs.claim("worker-a")
+    expire_lease(job)
+    assert jobs.claim("worker-b")["attempts"] == 2
+    expire_lease(job)
+
+    assert jobs.claim("worker-c") is None
+    stored = jobs_col.find_one({"_id": job["_id"]})
+    assert stored["status"] == jobs.FAILED
+    assert "active" not in stored
+    assert users_col.find_one({"_id": user["_id"]})["ingestion_status"] == "error"
+
+    # The user can queue a new sync afterwards
+    assert jobs.enqueue("ingest", user_id=user["_id"])["_id"] != job["_id"]
+
+
+@pytest.mark.parametrize("finish", [
+    lambda job, worker: jobs.complete(job, worker),
+    lambda job, worker: jobs.fail(job, worker, "boom"),
+])
+def test_lost_lease_does_not_touch_user_status(make_user, finish):
+    user = make_user()
+    job = jobs.enqueue("ingest", user_id=user["_id"])
+    stale = jobs.claim("worker-a")
+    expire_lease(job)
+    jobs.claim("worker-b")
+
+    assert not finish(stale, "worker-a")
+    assert users_col.find_one({"_id": user["_id"]})["ingestion_status"] == "ingesting"
+
+
+def test_concurrent_enqueue_returns_the_winning_job(make_user, monkeypatch):
+    ensure_indexes()
+    user = make_user()
+    winner = jobs.enqueue("ingest", user_id=user["_id"])
+
+    # The loser's duplicate check ran before the winner's insert
+    real_lookup = jobs._active_job
+    calls = []
+
+    def lookup(kind, user_id):
+        calls.append(kind)
+        return None if len(calls) == 1 else real_lookup(kind, user_id)
+
+    monkeypatch.setattr(jobs, "_active_job", lookup)
+
+    assert jobs.enqueue("ingest", user_id=user["_id"])["_id"] == winner["_id"]
+    assert len(calls) == 2
+    assert jobs_col.count_documents({"user_id": user["_id"]}) == 1
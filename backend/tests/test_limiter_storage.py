@@ -0,0 +1,43 @@
+import multiprocessing
+import pytest
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, SlidingWindowCounterRateLimiter
+import utils.limiter_storage  # noqa: F401  registers mmap://
+
+PROCESSES = 4
+LIMIT = 25
+
+# Inherited by the forked pool workers; limiters hold locks and do not pickle
+_limiter = None
+
+
+def hammer(_):
+    limiter = _limiter
+    item = parse(f"{LIMIT} per minute")
+    return sum(limiter.hit(item, "login", "203.0.113.7") for _ in range(2 * LIMIT))
+
+
+@pytest.mark.parametrize("strategy", [FixedWindowRateLimiter, SlidingWindowCounterRateLimiter])
+def test_limit_holds_across_forked_processes(tmp_path, strategy):
+    # Opened before forking, the way gunicorn workers inherit the app's storage
+    global _limiter
+    _limiter = strategy(storage_from_string(f"mmap://{tmp_path}/limits?slots=1024"))
+
+    with multiprocessing.get_context("fork").Pool(PROCESSES) as pool:
+        accepted = pool.map(hammer, range(PROCESSES))
+
+    assert sum(accepted) == LIMIT
+
+
+def test_counters_are_shared_between_storages(tmp_path):
+    uri = f"mmap://{tmp_path}/limits?slots=1024"
+    first = storage_from_string(uri)
+    second = storage_from_string(uri)
+
+    assert first.incr("key", 60) == 1
+    assert second.incr("key", 60) == 2
+    assert first.get("key") == 2
+
+    second.clear("key")
+    assert first.get("key") == 0
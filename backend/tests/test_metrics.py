@@ -0,0 +1,29 @@
+import pytest
+from routes import metrics
+from app import app
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def test_metrics_are_local_only_without_a_token(client, monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_TOKEN", None)
+
+    assert client.get("/metrics").status_code == 200
+    assert client.get("/metrics", environ_base={"REMOTE_ADDR": "203.0.113.7"}).status_code == 403
+
+
+@pytest.mark.parametrize("header, status", [
+    ("Bearer scrape-token", 200),
+    ("Bearer wrong", 401),
+    ("Bearer tökén", 401),
+    ("", 401),
+])
+def test_metrics_token(client, monkeypatch, header, status):
+    monkeypatch.setattr(metrics, "METRICS_TOKEN", "scrape-token")
+
+    response = client.get("/metrics", headers={"Authorization": header},
+                          environ_base={"REMOTE_ADDR": "203.0.113.7"})
+    assert response.status_code == status
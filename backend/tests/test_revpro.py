@@ -0,0 +1,77 @@
+import pytest
+from routes.revpro import encode_cursor
+from utils.db import problems_master
+from routes.auth import create_access_token
+from app import app
+
+
+@pytest.fixture
+def client(make_user):
+    user = make_user()
+    token = create_access_token(str(user["_id"]), user["email"])
+    client = app.test_client()
+    client.environ_base["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+    return client
+
+
+@pytest.fixture
+def problems():
+    docs = [
+        {
+            "_id": f"problem-{i:02d}",
+            "title": f"Problem {i % 4}",       # ties on the sort field
+            "difficulty": "Easy",
+            "acRate": None if i % 5 == 0 else float(i % 3),
+            "topics": [],
+            "companies": [],
+        }
+        for i in range(11)
+    ]
+    problems_master.insert_many(docs)
+    return docs
+
+
+def pages(client, **params):
+    """Slugs of every page, following next_cursor until the last page."""
+    seen = []
+    cursor = None
+    while True:
+        query = {**params, "solved": "all", "limit": 3}
+        if cursor:
+            query["cursor"] = cursor
+        body = client.get("/api/problems", query_string=query).get_json()
+        seen.append([p["slug"] for p in body["data"]])
+        cursor = body["meta"]["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+@pytest.mark.parametrize("sort, order", [
+    ("title", "asc"), ("title", "desc"), ("acRate", "asc"), ("acRate", "desc"),
+])
+def test_cursor_pages_cover_every_problem_once(client, problems, sort, order):
+    result = pages(client, sort=sort, order=order)
+
+    assert [len(page) for page in result] == [3, 3, 3, 2]
+    slugs = [slug for page in result for slug in page]
+
+    # (field, _id) order with nulls lowest, like MongoDB
+    expected = sorted(
+        problems,
+        key=lambda p: (p[sort] is not None, p[sort] or 0, p["_id"]),
+        reverse=order == "desc",
+    )
+    assert slugs == [p["_id"] for p in expected]
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    encode_cursor({"$gt": ""}, "problem-01"),
+    encode_cursor("Problem 1", {"$ne": None}),
+    encode_cursor(True, "problem-01"),
+    "WzEsMiwzXQ",          # [1,2,3]
+    "eyJhIjoxfQ",          # {"a":1}
+])
+def test_invalid_cursor_is_rejected(client, problems, cursor):
+    response = client.get("/api/problems", query_string={"solved": "all", "cursor": cursor})
+    assert response.status_code == 400
@@ -0,0 +1,49 @@
+import pytest
+from cryptography.fernet import Fernet
+from utils.db import users_col
+from utils.crypto import decrypt_credential, encrypt_credential, reset_cipher, SESSION_FIELD, CSRF_FIELD
+from scripts import rotate_encryption_key
+
+OLD_KEY = Fernet.generate_key().decode()
+NEW_KEY = Fernet.generate_key().decode()
+
+
+@pytest.fixture
+def keys(monkeypatch):
+    def use(*keys):
+        monkeypatch.setenv("ENCRYPTION_KEYS", ",".join(keys))
+        reset_cipher()
+    yield use
+    reset_cipher()
+
+
+def test_rotation_reencrypts_with_the_primary_key(make_user, keys):
+    keys(OLD_KEY)
+    user = make_user(**{SESSION_FIELD: encrypt_credential("session"), CSRF_FIELD: encrypt_credential("csrf")})
+
+    keys(NEW_KEY, OLD_KEY)
+    assert rotate_encryption_key.rotate() == {"rotated": 1, "changed": 0, "failed": 0}
+
+    keys(NEW_KEY)
+    stored = users_col.find_one({"_id": user["_id"]})
+    assert decrypt_credential(stored[SESSION_FIELD]) == "session"
+    assert decrypt_credential(stored[CSRF_FIELD]) == "csrf"
+
+
+def test_rotation_skips_credentials_replaced_meanwhile(make_user, keys, monkeypatch):
+    keys(OLD_KEY)
+    user = make_user(**{SESSION_FIELD: encrypt_credential("old-session"), CSRF_FIELD: ""})
+    keys(NEW_KEY, OLD_KEY)
+
+    # /api/user/init stores new credentials between the read and the write
+    real_rotate = rotate_encryption_key.rotate_credential
+
+    def rotate_and_race(value):
+        users_col.update_one({"_id": user["_id"]}, {"$set": {SESSION_FIELD: encrypt_credential("new-session")}})
+        return real_rotate(value)
+
+    monkeypatch.setattr(rotate_encryption_key, "rotate_credential", rotate_and_race)
+    assert rotate_encryption_key.rotate() == {"rotated": 0, "changed": 1, "failed": 0}
+
+    stored = users_col.find_one({"_id": user["_id"]})
+    assert decrypt_credential(stored[SESSION_FIELD]) == "new-session"
@@ -0,0 +1,42 @@
+from utils.db import problems_master
+from services.catalog import bump_catalog_version
+from services.sampling import build_sampler, get_sampler
+
+
+def seed_company(n=60):
+    problems_master.insert_many([
+        {
+            "_id": f"problem-{i}",
+            "difficulty": ("Easy", "Medium", "Hard")[i % 3],
+            "companies": ["acme"],
+            "num_occur": i % 7,
+        }
+        for i in range(n)
+    ])
+    return bump_catalog_version()
+
+
+def test_same_seed_gives_same_plan():
+    version = seed_company()
+    sampler = get_sampler()
+
+    plan = sampler.sample("acme", 10, ["Easy", "Medium", "Hard"], seed=1234)
+    assert len(plan) == len(set(plan)) == 10
+    assert sampler.sample("acme", 10, ["Easy", "Medium", "Hard"], seed=1234) == plan
+    # ...and for a sampler rebuilt from the same catalog
+    assert build_sampler(version).sample("acme", 10, ["Hard", "Easy", "Medium"], seed=1234) == plan
+
+
+def test_plan_respects_difficulties_and_exclusions():
+    seed_company()
+    sampler = get_sampler()
+    easy = {f"problem-{i}" for i in range(0, 60, 3)}
+    exclude = set(sorted(easy)[:15])
+
+    plan = sampler.sample("acme", 10, ["Easy", "Unknown"], exclude=exclude, seed=5)
+    assert sorted(plan) == sorted(easy - exclude)
+
+
+def test_unknown_company_gives_empty_plan():
+    seed_company()
+    assert get_sampler().sample("initech", 10, ["Easy"], seed=1) == []
@@ -0,0 +1,67 @@
+from utils.db import users_col, user_solved, user_solved_col
+from services.solved_store import SolvedArchiveWriter, count_solved, load_solved_slugs
+
+
+def archive(user, *rows, batch_size=None):
+    writer = SolvedArchiveWriter(user, batch_size=batch_size)
+    for row in rows:
+        writer.add(*row)
+    return writer.close()
+
+
+def test_writer_counts_inserted_modified_and_unchanged(make_user):
+    user = make_user()
+    assert archive(user, ("two-sum", "Two Sum"), ("add-two-numbers", "Add Two Numbers")) == {
+        "inserted": 2, "modified": 0, "unchanged": 0,
+    }
+
+    summary = archive(
+        user,
+        ("two-sum", "Two Sum"),                  # same title
+        ("add-two-numbers", "Add 2 Numbers"),    # renamed
+        ("valid-parentheses", "Valid Parentheses"),
+        batch_size=2,
+    )
+    assert summary == {"inserted": 1, "modified": 1, "unchanged": 1}
+    assert user_solved.count_documents({"user_id": user["_id"]}) == 3
+
+
+def test_writer_bumps_counter_and_version(make_user):
+    user = make_user()
+    archive(user, ("two-sum", "Two Sum"), ("add-two-numbers", "Add Two Numbers"))
+
+    stored = users_col.find_one({"_id": user["_id"]})
+    assert stored["solved_count"] == 2
+    assert stored["solved_version"] == 1
+
+    # Re-archiving without changes leaves both alone
+    archive(stored, ("two-sum", "Two Sum"))
+    stored = users_col.find_one({"_id": user["_id"]})
+    assert stored["solved_count"] == 2
+    assert stored["solved_version"] == 1
+
+
+def test_writer_moves_archived_at_forward_only(make_user):
+    user = make_user()
+    archive(user, ("two-sum", "Two Sum", 200.0))
+    archive(user, ("two-sum", "Two Sum", 100.0))
+    assert user_solved.find_one({"slug": "two-sum"})["archived_at"] == 200.0
+
+    archive(user, ("two-sum", "Two Sum", 300.0))
+    assert user_solved.find_one({"slug": "two-sum"})["archived_at"] == 300.0
+
+
+def test_legacy_user_is_recounted_without_double_counting(make_user):
+    user = make_user("bob", migrated=False)
+    user_solved_col("bob").insert_many([
+        {"slug": "two-sum", "title": "Two Sum"},
+        {"link": "https://leetcode.com/problems/valid-parentheses/", "title": "Valid Parentheses"},
+    ])
+
+    assert count_solved(user) == 2
+
+    # two-sum is a new user_solved row but not a new distinct solve
+    archive(user, ("two-sum", "Two Sum"), ("merge-intervals", "Merge Intervals"))
+    user = users_col.find_one({"_id": user["_id"]})
+    assert user["solved_count"] == 3
+    assert load_solved_slugs(user) == {"two-sum", "valid-parentheses", "merge-intervals"}
@@ -0,0 +1,21 @@
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorCollection
+from utils import async_db
+
+
+def test_importing_the_asgi_app_creates_no_motor_client():
+    import asgi  # noqa: F401
+
+    assert async_db._client is None
+
+
+def test_motor_client_is_created_on_first_use():
+    async def resolve():
+        return async_db.problems_master._resolve()
+
+    try:
+        assert isinstance(asyncio.run(resolve()), AsyncIOMotorCollection)
+        assert async_db._client is not None
+    finally:
+        async_db.close_client()
+    assert async_db._client is None
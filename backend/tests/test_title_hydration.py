@@ -0,0 +1,36 @@
+import asyncio
+from utils.db import problems_master
+from services.catalog import bump_catalog_version, get_catalog_version
+from services.title_hydration import hydrate_titles
+
+
+class TitleClient:
+    def __init__(self, known):
+        self.known = known
+
+    async def fetch_titles_batch(self, slugs):
+        return [
+            {"slug": s, "title": self.known[s], "difficulty": "Medium", "topics": ["array"]}
+            for s in slugs if s in self.known
+        ]
+
+
+def test_titles_come_from_catalog_then_leetcode():
+    problems_master.insert_one({"_id": "two-sum", "title": "Two Sum"})
+    client = TitleClient({"new-problem": "New Problem"})
+
+    titles = asyncio.run(hydrate_titles(["two-sum", "new-problem", "gone", "two-sum"], client))
+
+    assert titles == [
+        {"slug": "two-sum", "title": "Two Sum"},
+        {"slug": "new-problem", "title": "New Problem"},
+        {"slug": "gone", "title": "gone"},
+    ]
+    stub = problems_master.find_one({"_id": "new-problem"})
+    assert stub["companies"] == [] and stub["num_occur"] == 0
+
+
+def test_stub_write_back_keeps_catalog_version():
+    version = bump_catalog_version()
+    asyncio.run(hydrate_titles(["new-problem"], TitleClient({"new-problem": "New Problem"})))
+    assert get_catalog_version(max_age=0) == version
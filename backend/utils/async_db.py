@@ -0,0 +1,49 @@
+# backend/utils/async_db.py
+"""
+Async (motor) handles on the same database as utils/db.py, used by the
+async read routes served from asgi.py. Writes stay on the sync client.
+
+Like utils/db.py, the client is created on first use rather than at import,
+so importing asgi.py (e.g. in a hypercorn parent process before workers
+start) does not start motor's connection pool.
+"""
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from utils.db import DB_NAME, LEGACY_SOLVED_PREFIX, LazyDatabase
+from utils.mongo_monitoring import mongo_listeners
+import os
+import threading
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """The process-wide motor client, created on first use rather than at import."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # Same command and pool listeners as the sync client, so the async
+                # routes' queries show up in /metrics and the slow query log too
+                _client = AsyncIOMotorClient(os.getenv("MONGO_URI"), event_listeners=mongo_listeners())
+    return _client
+
+def close_client():
+    """Close the motor client if one was created; the next use creates a new one."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+db = LazyDatabase(DB_NAME, get_client)
+
+problems_master = db["problems_master"]
+users_col = db["users"]
+catalog_meta = db["catalog_meta"]
+user_solved = db["user_solved"]
+user_coverage_col = db["user_topic_coverage"]
+
+def user_solved_col(username):
+    """Legacy per-user collection (see utils.db.user_solved_col)."""
+    return db[f"{LEGACY_SOLVED_PREFIX}{username}"]
@@ -1,32 +1,56 @@
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, MultiFernet
 import os
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
-def get_cipher():
-    """Get or generate Fernet cipher for encryption."""
-    key = os.getenv("ENCRYPTION_KEY")
+# Stored credential fields on user documents
+SESSION_FIELD = "leetcode_session_encrypted"
+CSRF_FIELD = "leetcode_csrf_encrypted"
+
+_cipher_lock = threading.Lock()
+_cipher = None
 
-    if not key:
+def _load_keys():
+    """
+    Keys from ENCRYPTION_KEYS (comma-separated, newest first) or ENCRYPTION_KEY.
+    The first key encrypts; every key is tried when decrypting, so a new key
+    can be put in front while values encrypted with older keys stay readable.
+    """
+    raw = os.getenv("ENCRYPTION_KEYS") or os.getenv("ENCRYPTION_KEY") or ""
+    keys = [k.strip() for k in raw.split(",") if k.strip()]
+
+    if not keys:
         logger.warning("ENCRYPTION_KEY not found in environment. Generating a new key.")
         logger.warning("THIS KEY WILL NOT PERSIST ACROSS RESTARTS!")
         logger.warning("Please set ENCRYPTION_KEY in your .env file to persist encrypted data.")
-        key = Fernet.generate_key().decode()
+        keys = [Fernet.generate_key().decode()]
+
+    # Ensure keys are bytes
+    return [k.encode() if isinstance(k, str) else k for k in keys]
 
-    # Ensure key is bytes
-    if isinstance(key, str):
-        key = key.encode()
+def get_cipher():
+    """Get the process-wide cipher, built from the environment on first use."""
+    global _cipher
+    if _cipher is None:
+        with _cipher_lock:
+            if _cipher is None:
+                _cipher = MultiFernet([Fernet(k) for k in _load_keys()])
+    return _cipher
 
-    return Fernet(key)
+def reset_cipher():
+    """Forget the cached cipher so the next call re-reads the keys."""
+    global _cipher
+    with _cipher_lock:
+        _cipher = None
 
 def encrypt_credential(value: str) -> str:
     """Encrypt a credential string."""
     if not value:
         return ""
 
-    cipher = get_cipher()
-    encrypted = cipher.encrypt(value.encode())
+    encrypted = get_cipher().encrypt(value.encode())
     return encrypted.decode()
 
 def decrypt_credential(encrypted: str) -> str:
@@ -34,6 +58,12 @@ def decrypt_credential(encrypted: str) -> str:
     if not encrypted:
         return ""
 
-    cipher = get_cipher()
-    decrypted = cipher.decrypt(encrypted.encode())
+    decrypted = get_cipher().decrypt(encrypted.encode())
     return decrypted.decode()
+
+def rotate_credential(encrypted: str) -> str:
+    """Re-encrypt a stored credential with the current primary key."""
+    if not encrypted:
+        return encrypted
+
+    return get_cipher().rotate(encrypted.encode()).decode()
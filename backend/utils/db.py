@@ -1,29 +1,98 @@
 # backend/utils/db.py
-from pymongo import MongoClient, ASCENDING
+from pymongo import MongoClient
+from utils.mongo_monitoring import mongo_listeners
 import os
+import threading
 
-client = MongoClient(os.getenv("MONGO_URI"))
-db = client["new_lp"]
+DB_NAME = os.getenv("DB_NAME", "new_lp")
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """The process-wide MongoClient, created on first use rather than at import."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = MongoClient(os.getenv("MONGO_URI"), event_listeners=mongo_listeners())
+    return _client
+
+
+class LazyDatabase:
+    """
+    Stands in for the Database; nothing touches MongoDB until it is used.
+    `client_getter` returns the client to resolve against (get_client by default).
+    """
+
+    def __init__(self, name, client_getter=None):
+        self._name = name
+        self._client_getter = client_getter or get_client
+
+    def _resolve(self):
+        return self._client_getter()[self._name]
+
+    def __getitem__(self, name):
+        return LazyCollection(self, name)
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+
+class LazyCollection:
+    """Stands in for a Collection and resolves it through get_client() on first use."""
+
+    def __init__(self, database, name):
+        self._database = database
+        self._name = name
+        self._collection = None
+
+    def _resolve(self):
+        if self._collection is None:
+            self._collection = self._database._resolve()[self._name]
+        return self._collection
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+    def __repr__(self):
+        return f"LazyCollection({self._database._name}.{self._name})"
+
+
+db = LazyDatabase(DB_NAME)
 
 problems_master = db["problems_master"]
 users_col = db["users"]
 
+# Catalog-derived data (rebuilt whenever problems_master changes)
+catalog_meta = db["catalog_meta"]
+company_index_col = db["company_index"]
+
+# Solved problems for every user: {user_id, slug, title, archived_at, updated_at}
+user_solved = db["user_solved"]
+
+# Per-user solved counts by topic (see services/topic_coverage.py)
+user_coverage_col = db["user_topic_coverage"]
+
+# Background jobs (see services/jobs.py)
+jobs_col = db["jobs"]
+
+LEGACY_SOLVED_PREFIX = "archive_solved_"
+
 def user_solved_col(username):
-    return db[f"archive_solved_{username}"]
+    """Legacy per-user collection, read only until the user is migrated to user_solved."""
+    return db[f"{LEGACY_SOLVED_PREFIX}{username}"]
 
 def create_indexes():
-    """Create database indexes for optimal performance."""
-    try:
-        # Users collection indexes
-        users_col.create_index("email", unique=True)
-        users_col.create_index("username", unique=True)
+    """Create database indexes for optimal performance (declared in utils/indexes.py)."""
+    # utils.indexes imports the collections defined above
+    from utils.indexes import ensure_indexes
 
-        # Problems master collection indexes
-        problems_master.create_index("companies")
-        problems_master.create_index("difficulty")
-        problems_master.create_index("topics")
+    try:
+        report = ensure_indexes()
 
-        print("[DB] Indexes created successfully")
+        if report["extra"]:
+            print(f"[DB] Undeclared indexes (drop with scripts/create_indexes.py --prune): {', '.join(report['extra'])}")
+        print(f"[DB] Indexes created successfully ({len(report['created'])} new)")
     except Exception as e:
         print(f"[DB] Error creating indexes: {e}")
-
@@ -0,0 +1,110 @@
+# backend/utils/indexes.py
+"""
+Declared indexes, one entry per hot query shape.
+
+Each collection lists the indexes its queries need, with the query they
+serve next to them. ensure_indexes() creates whatever is missing, reports
+indexes that exist but are no longer declared, and can drop them. MongoDB
+(4.2+) builds indexes holding an exclusive lock only at the start and end of
+the build, so creating one on a large collection still slows writes to it
+while it runs; do it with scripts/create_indexes.py off-peak rather than
+from every worker on boot.
+
+Indexes marked "covered" contain every field the query projects, so MongoDB
+answers it from the index alone without fetching documents. The query shapes
+themselves are checked against these indexes by scripts/index_advisor.py.
+"""
+
+from pymongo import ASCENDING, DESCENDING
+from utils.db import db, LEGACY_SOLVED_PREFIX
+
+INDEXES = {
+    "users": [
+        ([("email", ASCENDING)], {"unique": True}),      # login / signup
+        ([("username", ASCENDING)], {"unique": True}),   # signup, ingestion by username
+    ],
+    "problems_master": [
+        # company pages and smart plans: companies (+ difficulty), by frequency
+        ([("companies", ASCENDING), ("difficulty", ASCENDING), ("num_occur", DESCENDING)], {}),
+        # search: topic (+ difficulty)
+        ([("topics", ASCENDING), ("difficulty", ASCENDING)], {}),
+        # keyset pagination in the problems explorer: (sort field, _id)
+        ([("title", ASCENDING), ("_id", ASCENDING)], {}),
+        ([("acRate", ASCENDING), ("_id", ASCENDING)], {}),
+        ([("num_occur", ASCENDING), ("_id", ASCENDING)], {}),
+        ([("difficulty", ASCENDING), ("_id", ASCENDING)], {}),
+    ],
+    "user_solved": [
+        # upserts and solved-set loads (covered: slug only)
+        ([("user_id", ASCENDING), ("slug", ASCENDING)], {"unique": True}),
+        # review list: newest first (covered: slug, title, archived_at)
+        ([("user_id", ASCENDING), ("archived_at", DESCENDING), ("slug", ASCENDING), ("title", ASCENDING)], {}),
+    ],
+    "jobs": [
+        # claim: queued jobs due to run, oldest first
+        ([("status", ASCENDING), ("run_after", ASCENDING)], {}),
+        # claim: running jobs whose lease expired
+        ([("status", ASCENDING), ("locked_at", ASCENDING)], {}),
+        # enqueue dedupe: at most one queued or running job per (kind, user)
+        ([("kind", ASCENDING), ("user_id", ASCENDING), ("active", ASCENDING)],
+         {"unique": True, "partialFilterExpression": {"active": True}}),
+        # per-user job lookups
+        ([("user_id", ASCENDING), ("created_at", DESCENDING)], {}),
+    ],
+    "company_index": [
+        ([("catalog_version", ASCENDING)], {}),
+    ],
+}
+
+# Applied to every archive_solved_{username} collection still awaiting migration
+LEGACY_SOLVED_INDEXES = [
+    # review list for unmigrated users: newest first
+    ([("archived_at", DESCENDING)], {}),
+]
+
+
+def index_name(keys) -> str:
+    """The name MongoDB gives an index on `keys` by default."""
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+
+def declared_indexes() -> dict:
+    """{collection name: [(keys, options)]}, including legacy solved collections."""
+    declared = dict(INDEXES)
+    for name in db.list_collection_names():
+        if name.startswith(LEGACY_SOLVED_PREFIX):
+            declared[name] = LEGACY_SOLVED_INDEXES
+    return declared
+
+
+def ensure_indexes(prune: bool = False) -> dict:
+    """
+    Create missing declared indexes. Returns {"created", "existing", "extra",
+    "dropped"} as lists of "collection.index" names; `extra` are indexes that
+    exist but are not declared, dropped only when `prune` is set.
+    """
+    report = {"created": [], "existing": [], "extra": [], "dropped": []}
+
+    for col_name, specs in declared_indexes().items():
+        col = db[col_name]
+        existing = set(col.index_information())
+        wanted = set()
+
+        for keys, options in specs:
+            name = index_name(keys)
+            wanted.add(name)
+
+            if name in existing:
+                report["existing"].append(f"{col_name}.{name}")
+                continue
+
+            col.create_index(keys, name=name, **options)
+            report["created"].append(f"{col_name}.{name}")
+
+        for name in sorted(existing - wanted - {"_id_"}):
+            report["extra"].append(f"{col_name}.{name}")
+            if prune:
+                col.drop_index(name)
+                report["dropped"].append(f"{col_name}.{name}")
+
+    return report
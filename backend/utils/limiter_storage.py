@@ -0,0 +1,240 @@
+# backend/utils/limiter_storage.py
+"""
+Rate limit counters shared by every worker process on one host.
+
+"memory://" gives each gunicorn worker its own counters, so a limit of
+5/minute really allows 5 x workers and resets on restart. This storage
+keeps the counters in a small memory-mapped file instead: an open-addressing
+hash table of (key hash, count, expires_at) slots that all processes map.
+Updates take an flock on the file (plus a thread lock, since flock does not
+exclude threads sharing a descriptor), which costs a few microseconds.
+
+Importing this module registers the "mmap" scheme with `limits`:
+
+    storage_uri="mmap:///tmp/leetcode_tracker_limits?slots=65536"
+
+It supports the fixed-window and sliding-window-counter strategies. When the
+probe window for a key is full of live counters, the one expiring soonest is
+recycled, so an overfull table errs towards allowing requests.
+"""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from urllib.parse import urlparse, parse_qs
+from limits.storage import Storage, SlidingWindowCounterSupport
+from limits.storage.base import TimestampedSlidingWindow
+
+MAGIC = b"LTLIMIT1"
+HEADER = struct.Struct("<8sQ")      # magic, number of slots
+SLOT = struct.Struct("<Qqd")        # key hash (0 = empty), count, expires_at
+DEFAULT_SLOTS = 65536
+MAX_PROBE = 32
+
+
+def key_hash(key: str) -> int:
+    h = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+    return h or 1
+
+
+class MmapStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    STORAGE_SCHEME = ["mmap"]
+
+    def __init__(self, uri: str = None, wrap_exceptions: bool = False, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        parsed = urlparse(uri or "mmap:///tmp/leetcode_tracker_limits")
+        query = parse_qs(parsed.query)
+
+        self.path = parsed.path
+        self.requested_slots = int(query.get("slots", [options.get("slots", DEFAULT_SLOTS)])[0])
+        self._lock = threading.Lock()
+        self._pid = None
+        self._open()
+
+    @property
+    def base_exceptions(self):
+        return (OSError, ValueError)
+
+    # ---------- File and locking ----------
+    def _open(self):
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            size = os.fstat(fd).st_size
+            if size >= HEADER.size:
+                magic, slots = HEADER.unpack(os.pread(fd, HEADER.size, 0))
+                if magic != MAGIC:
+                    raise ValueError(f"{self.path} is not a rate limit table")
+            else:
+                slots = self.requested_slots
+                os.ftruncate(fd, HEADER.size + slots * SLOT.size)
+                os.pwrite(fd, HEADER.pack(MAGIC, slots), 0)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+        self.fd = fd
+        self.slots = slots
+        self.map = mmap.mmap(fd, HEADER.size + slots * SLOT.size)
+        self._pid = os.getpid()
+
+    def _locked(self):
+        # A forked worker shares the parent's open file, and flock would not
+        # exclude the two; give each process its own descriptor.
+        if self._pid != os.getpid():
+            self._open()
+        return _FileLock(self._lock, self.fd)
+
+    # ---------- Slots ----------
+    def _offset(self, index):
+        return HEADER.size + index * SLOT.size
+
+    def _find(self, key, now, create):
+        """Offset of the key's slot (or None), claiming one when `create` is set."""
+        h = key_hash(key)
+        start = h % self.slots
+        reusable = None
+        soonest = None
+
+        for i in range(MAX_PROBE):
+            offset = self._offset((start + i) % self.slots)
+            slot_hash, _, expires_at = SLOT.unpack_from(self.map, offset)
+
+            if slot_hash == h:
+                return offset
+            if slot_hash == 0:
+                if reusable is None:
+                    reusable = offset
+                break
+            if expires_at <= now and reusable is None:
+                reusable = offset
+            if soonest is None or expires_at < soonest[0]:
+                soonest = (expires_at, offset)
+
+        if not create:
+            return None
+
+        offset = reusable if reusable is not None else soonest[1]
+        SLOT.pack_into(self.map, offset, h, 0, 0.0)
+        return offset
+
+    def _get(self, key, now):
+        offset = self._find(key, now, create=False)
+        if offset is None:
+            return 0, now
+        _, count, expires_at = SLOT.unpack_from(self.map, offset)
+        return (count, expires_at) if expires_at > now else (0, now)
+
+    def _incr(self, key, expiry, amount, now):
+        offset = self._find(key, now, create=True)
+        h, count, expires_at = SLOT.unpack_from(self.map, offset)
+        if expires_at <= now:
+            count, expires_at = 0, now + expiry
+        count += amount
+        SLOT.pack_into(self.map, offset, h, count, expires_at)
+        return count
+
+    # ---------- Storage API ----------
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        now = time.time()
+        with self._locked():
+            return self._incr(key, expiry, amount, now)
+
+    def get(self, key: str) -> int:
+        now = time.time()
+        with self._locked():
+            return self._get(key, now)[0]
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self._locked():
+            return self._get(key, now)[1]
+
+    def check(self) -> bool:
+        return not self.map.closed
+
+    def reset(self) -> int:
+        now = time.time()
+        cleared = 0
+        with self._locked():
+            for index in range(self.slots):
+                offset = self._offset(index)
+                slot_hash, _, expires_at = SLOT.unpack_from(self.map, offset)
+                if slot_hash:
+                    cleared += expires_at > now
+                    SLOT.pack_into(self.map, offset, 0, 0, 0.0)
+        return cleared
+
+    def clear(self, key: str) -> None:
+        now = time.time()
+        with self._locked():
+            offset = self._find(key, now, create=False)
+            if offset is not None:
+                # keep the hash so probe chains through this slot stay intact
+                h = SLOT.unpack_from(self.map, offset)[0]
+                SLOT.pack_into(self.map, offset, h, 0, 0.0)
+
+    # ---------- Sliding window counter ----------
+    def _sliding_window(self, key, expiry, now):
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count = self._get(previous_key, now)[0]
+        current_count = self._get(current_key, now)[0]
+
+        if previous_count == 0:
+            previous_ttl = 0.0
+        else:
+            previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return current_key, (previous_count, previous_ttl, current_count, current_ttl)
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+
+        now = time.time()
+        with self._locked():
+            current_key, (previous_count, previous_ttl, current_count, _) = (
+                self._sliding_window(key, expiry, now)
+            )
+            weighted = previous_count * previous_ttl / expiry + current_count
+            if int(weighted) + amount > limit:
+                return False
+
+            # The current window's counter is still read as "previous" during the next window
+            self._incr(current_key, 2 * expiry, amount, now)
+            return True
+
+    def get_sliding_window(self, key: str, expiry: int):
+        now = time.time()
+        with self._locked():
+            return self._sliding_window(key, expiry, now)[1]
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        now = time.time()
+        for k in self.sliding_window_keys(key, expiry, now):
+            self.clear(k)
+
+
+class _FileLock:
+    """Thread lock + exclusive flock, held for one table operation."""
+
+    __slots__ = ("lock", "fd")
+
+    def __init__(self, lock, fd):
+        self.lock = lock
+        self.fd = fd
+
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        except BaseException:
+            self.lock.release()
+            raise
+
+    def __exit__(self, *exc):
+        fcntl.flock(self.fd, fcntl.LOCK_UN)
+        self.lock.release()
@@ -0,0 +1,200 @@
+# backend/utils/metrics.py
+"""
+Minimal in-process metrics with Prometheus text exposition.
+
+Counters, gauges and histograms keyed by label values, kept per process and
+rendered by render() for the /metrics endpoint. Each update is a dict lookup
+and a few additions under a lock, so they are cheap enough for hot paths.
+Label values must come from a small set (route rules, collection names,
+query shapes), never from raw URLs or user input.
+"""
+
+import bisect
+import threading
+from collections import deque
+
+# Latency buckets in seconds: 0.5ms .. 10s
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# Payload size buckets in bytes: 256B .. 4MB
+SIZE_BUCKETS = tuple(256 * 4 ** i for i in range(8))
+
+_registry = []
+_registry_lock = threading.Lock()
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=()) -> str:
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in pairs) + "}"
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value != value:
+        return "NaN"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+        with _registry_lock:
+            _registry.append(self)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for values, value in sorted(self.snapshot().items()):
+            lines.extend(self._render_one(values, value))
+        return lines
+
+    def _render_one(self, values, value):
+        return [f"{self.name}{_labels(self.label_names, values)} {_number(value)}"]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels, amount=1):
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels, value):
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, *labels, value):
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                # per-bucket counts (last one is +Inf), sum, count
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][i] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def snapshot(self) -> dict:
+        """{label values: (bucket counts, sum, count)} copied under the lock."""
+        with self._lock:
+            return {k: (list(v[0]), v[1], v[2]) for k, v in self._values.items()}
+
+    def quantile(self, labels, q):
+        """Estimate the q-quantile for one label set from its buckets (upper bound)."""
+        entry = self.snapshot().get(tuple(labels))
+        if not entry or not entry[2]:
+            return None
+        counts, _, total = entry
+        rank = q * total
+        seen = 0
+        for bound, n in zip(self.buckets + (float("inf"),), counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def _render_one(self, values, entry):
+        counts, total_sum, total = entry
+        lines = []
+        cumulative = 0
+        for bound, n in zip(self.buckets + (float("inf"),), counts):
+            cumulative += n
+            le = _labels(self.label_names, values, [("le", _number(bound))])
+            lines.append(f"{self.name}_bucket{le} {cumulative}")
+        base = _labels(self.label_names, values)
+        lines.append(f"{self.name}_sum{base} {_number(total_sum)}")
+        lines.append(f"{self.name}_count{base} {total}")
+        return lines
+
+
+class Summary(Metric):
+    """
+    Quantiles over the most recent `window` observations per label set, plus
+    the all-time sum and count. Observing is an append to a bounded deque;
+    sorting only happens when the metric is rendered.
+    """
+    kind = "summary"
+
+    def __init__(self, name, help, labels=(), quantiles=(0.5, 0.95, 0.99), window=1024):
+        super().__init__(name, help, labels)
+        self.quantiles = tuple(quantiles)
+        self.window = window
+
+    def observe(self, *labels, value):
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [deque(maxlen=self.window), 0.0, 0]
+            entry[0].append(value)
+            entry[1] += value
+            entry[2] += 1
+
+    def snapshot(self) -> dict:
+        """{label values: (recent observations, sum, count)} copied under the lock."""
+        with self._lock:
+            return {k: (list(v[0]), v[1], v[2]) for k, v in self._values.items()}
+
+    def _render_one(self, values, entry):
+        recent, total_sum, total = entry
+        recent.sort()
+        lines = []
+        for q in self.quantiles:
+            value = recent[min(int(q * len(recent)), len(recent) - 1)] if recent else float("nan")
+            labels = _labels(self.label_names, values, [("quantile", q)])
+            lines.append(f"{self.name}{labels} {_number(value)}")
+        base = _labels(self.label_names, values)
+        lines.append(f"{self.name}_sum{base} {_number(total_sum)}")
+        lines.append(f"{self.name}_count{base} {total}")
+        return lines
+
+
+def render() -> str:
+    """Every registered metric in Prometheus text format (version 0.0.4)."""
+    with _registry_lock:
+        metrics = list(_registry)
+    lines = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,241 @@
+# backend/utils/mongo_monitoring.py
+"""
+pymongo command and connection pool monitoring.
+
+CommandMetrics records every command's latency per (collection, command,
+query shape), where the shape is the filter/sort/pipeline with all values
+replaced by "?". Shapes therefore repeat per call site, not per argument,
+and `{"companies": "?"}` tells you which query a slow find came from.
+getMore batches are attributed to the shape of the command that opened the
+cursor. Commands slower than MONGO_SLOW_MS are logged with their shape.
+
+PoolMetrics tracks connection checkout wait time and pool size per server.
+Both are registered on the client in utils/db.get_client().
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pymongo import monitoring
+from utils.metrics import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+MONGO_SLOW_MS = float(os.getenv("MONGO_SLOW_MS", "100"))
+MAX_SHAPE_LENGTH = 300
+# Open cursors remembered for getMore attribution
+MAX_TRACKED_CURSORS = 10000
+
+command_seconds = Histogram(
+    "mongo_command_duration_seconds",
+    "MongoDB command latency",
+    ["collection", "command", "shape"],
+)
+command_documents = Counter(
+    "mongo_command_documents_returned_total",
+    "Documents returned by MongoDB commands",
+    ["collection", "command", "shape"],
+)
+command_failures = Counter(
+    "mongo_command_failures_total",
+    "MongoDB commands that failed",
+    ["collection", "command"],
+)
+checkout_seconds = Histogram(
+    "mongo_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the pool",
+    ["address"],
+)
+checkout_failures = Counter(
+    "mongo_pool_checkout_failures_total",
+    "Connection checkouts that failed",
+    ["address", "reason"],
+)
+pool_connections = Gauge(
+    "mongo_pool_connections",
+    "Open connections per server",
+    ["address"],
+)
+pool_checked_out = Gauge(
+    "mongo_pool_checked_out_connections",
+    "Connections currently checked out per server",
+    ["address"],
+)
+
+# Commands whose payload does not say much about the query
+IGNORED_COMMANDS = {
+    "hello", "ismaster", "isMaster", "ping", "saslStart", "saslContinue",
+    "endSessions", "buildInfo", "getLastError",
+}
+
+
+# Command fields that make up the shape of simple read commands
+SHAPE_FIELDS = {
+    "find": ("filter", "sort"),
+    "count": ("query",),
+    "distinct": ("query",),
+    "findAndModify": ("query", "sort"),
+}
+
+
+def _shape(value):
+    """The value with every leaf replaced by "?", keeping keys and operators."""
+    if isinstance(value, dict):
+        return {k: _shape(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)) and value and all(isinstance(v, dict) for v in value):
+        return [_shape(v) for v in value]
+    return "?"
+
+
+def query_shape(name, command) -> str:
+    """Compact shape string for a command document ("" for commands without one)."""
+    if name == "aggregate":
+        shaped = {"pipeline": [
+            {k: _shape(v) if k == "$match" else "?" for k, v in stage.items()}
+            for stage in command.get("pipeline", [])
+        ]}
+    elif name in ("update", "delete"):
+        statements = command.get("updates") or command.get("deletes") or [{}]
+        shaped = {"q": _shape(statements[0].get("q", {}))}
+        if len(statements) > 1:
+            shaped["batch"] = True
+    elif name in SHAPE_FIELDS:
+        shaped = {f: _shape(command[f]) for f in SHAPE_FIELDS[name] if command.get(f) is not None}
+        if "sort" in shaped:
+            # sort directions matter for index use; keep them
+            shaped["sort"] = dict(command["sort"])
+    else:
+        return ""
+
+    return json.dumps(shaped, separators=(",", ":"), default=str)[:MAX_SHAPE_LENGTH]
+
+
+def _returned(reply) -> int:
+    cursor = reply.get("cursor")
+    if isinstance(cursor, dict):
+        return len(cursor.get("firstBatch") or cursor.get("nextBatch") or [])
+    if "value" in reply:  # findAndModify
+        return 1 if reply["value"] else 0
+    return 0
+
+
+class CommandMetrics(monitoring.CommandListener):
+    def __init__(self, slow_ms=MONGO_SLOW_MS):
+        self.slow_ms = slow_ms
+        self._lock = threading.Lock()
+        self._inflight = {}               # (connection, request id) -> labels
+        self._cursors = OrderedDict()     # cursor id -> (collection, shape)
+
+    def _labels(self, event):
+        cmd = event.command
+        name = event.command_name
+
+        if name == "getMore":
+            with self._lock:
+                collection, shape = self._cursors.get(cmd.get("getMore"), (cmd.get("collection", ""), ""))
+            return collection, name, shape, cmd
+
+        collection = cmd.get(name)
+        if not isinstance(collection, str):
+            collection = ""
+        return collection, name, query_shape(name, cmd), cmd
+
+    def started(self, event):
+        if event.command_name in IGNORED_COMMANDS:
+            return
+        labels = self._labels(event)
+        with self._lock:
+            self._inflight[(event.connection_id, event.request_id)] = labels
+
+    def _finish(self, event):
+        with self._lock:
+            return self._inflight.pop((event.connection_id, event.request_id), None)
+
+    def succeeded(self, event):
+        labels = self._finish(event)
+        if labels is None:
+            return
+        collection, name, shape, cmd = labels
+        seconds = event.duration_micros / 1e6
+
+        command_seconds.observe(collection, name, shape, value=seconds)
+        command_documents.inc(collection, name, shape, amount=_returned(event.reply))
+        self._track_cursor(event.reply, collection, shape, cmd)
+
+        if seconds * 1000 >= self.slow_ms:
+            logger.warning(
+                "[MONGO SLOW] %.1fms %s %s %s", seconds * 1000, name, collection, shape
+            )
+
+    def failed(self, event):
+        labels = self._finish(event)
+        if labels is None:
+            return
+        collection, name, shape, _ = labels
+        command_seconds.observe(collection, name, shape, value=event.duration_micros / 1e6)
+        command_failures.inc(collection, name)
+
+    def _track_cursor(self, reply, collection, shape, cmd):
+        cursor = reply.get("cursor")
+        if not isinstance(cursor, dict):
+            return
+        cursor_id = cursor.get("id")
+        with self._lock:
+            if cursor_id:
+                self._cursors[cursor_id] = (collection, shape)
+                while len(self._cursors) > MAX_TRACKED_CURSORS:
+                    self._cursors.popitem(last=False)
+            elif "getMore" in cmd:
+                # exhausted
+                self._cursors.pop(cmd["getMore"], None)
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    def _address(self, event):
+        host, port = event.address
+        return f"{host}:{port}"
+
+    # Events without a metric of their own
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_created(self, event):
+        pool_connections.inc(self._address(event))
+
+    def connection_closed(self, event):
+        pool_connections.dec(self._address(event))
+
+    def connection_checked_out(self, event):
+        address = self._address(event)
+        pool_checked_out.inc(address)
+        # ConnectionCheckedOutEvent.duration exists on pymongo >= 4.7
+        duration = getattr(event, "duration", None)
+        if duration is not None:
+            checkout_seconds.observe(address, value=duration)
+
+    def connection_check_out_failed(self, event):
+        checkout_failures.inc(self._address(event), event.reason)
+
+    def connection_checked_in(self, event):
+        pool_checked_out.dec(self._address(event))
+
+
+def mongo_listeners() -> list:
+    return [CommandMetrics(), PoolMetrics()]
@@ -0,0 +1,124 @@
+# backend/utils/request_metrics.py
+"""
+Per-route request metrics, recorded by app-level request hooks.
+
+Every request is labelled by blueprint, route rule and method, so
+/api/companies/<company> is one series however many companies are asked
+for (unmatched URLs share the "<unmatched>" rule, and methods outside
+STANDARD_METHODS are recorded as "OTHER", so clients cannot create series).
+For each route this keeps a latency histogram, recent-window p50/p95/p99,
+response size, responses by status code and requests in flight, all
+exported at /metrics. init_request_metrics() hooks the Flask app and
+init_async_request_metrics() the Quart app in asgi.py.
+
+Latency is measured until the response object is ready; for streamed
+(NDJSON) responses that excludes sending the body, and their size is not
+known up front, so it is not recorded.
+"""
+
+import time
+from flask import g, request
+from utils.metrics import Counter, Gauge, Histogram, Summary, SIZE_BUCKETS
+
+ROUTE_LABELS = ["blueprint", "rule", "method"]
+UNMATCHED_RULE = "<unmatched>"
+STANDARD_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+OTHER_METHOD = "OTHER"
+
+request_seconds = Histogram(
+    "http_request_duration_seconds",
+    "Request latency per route",
+    ROUTE_LABELS,
+)
+request_quantiles = Summary(
+    "http_request_duration_recent_seconds",
+    "Request latency quantiles over each route's recent requests",
+    ROUTE_LABELS,
+)
+response_bytes = Histogram(
+    "http_response_size_bytes",
+    "Response body size per route",
+    ROUTE_LABELS,
+    buckets=SIZE_BUCKETS,
+)
+responses_total = Counter(
+    "http_responses_total",
+    "Responses per route and status code",
+    ROUTE_LABELS + ["status"],
+)
+in_flight = Gauge(
+    "http_requests_in_flight",
+    "Requests currently being handled per route",
+    ROUTE_LABELS,
+)
+
+
+def route_labels(req=None):
+    """(blueprint, rule, method) for the current (or the given) request."""
+    req = req or request
+    rule = req.url_rule.rule if req.url_rule is not None else UNMATCHED_RULE
+    method = req.method if req.method in STANDARD_METHODS else OTHER_METHOD
+    return (req.blueprint or "", rule, method)
+
+
+def _record(labels, started, status, size):
+    elapsed = time.perf_counter() - started
+    request_seconds.observe(*labels, value=elapsed)
+    request_quantiles.observe(*labels, value=elapsed)
+    responses_total.inc(*labels, str(status))
+    if size is not None:
+        response_bytes.observe(*labels, value=size)
+
+
+def init_request_metrics(app):
+    def start_request_timer():
+        g._metrics_labels = route_labels()
+        g._metrics_started = time.perf_counter()
+        in_flight.inc(*g._metrics_labels)
+
+    # Run before other hooks (e.g. the rate limiter) so rejected requests are counted too
+    app.before_request_funcs.setdefault(None, []).insert(0, start_request_timer)
+
+    @app.after_request
+    def record_request_metrics(response):
+        labels = g.get("_metrics_labels")
+        if labels is None:
+            return response
+
+        size = None if response.is_streamed else response.calculate_content_length() or 0
+        _record(labels, g._metrics_started, response.status_code, size)
+        return response
+
+    @app.teardown_request
+    def finish_request(exc=None):
+        labels = g.pop("_metrics_labels", None)
+        if labels is not None:
+            in_flight.dec(*labels)
+
+
+def init_async_request_metrics(app):
+    """The same hooks for a Quart app."""
+    from quart import g as async_g, request as async_request
+
+    async def start_request_timer():
+        async_g._metrics_labels = route_labels(async_request)
+        async_g._metrics_started = time.perf_counter()
+        in_flight.inc(*async_g._metrics_labels)
+
+    app.before_request_funcs.setdefault(None, []).insert(0, start_request_timer)
+
+    @app.after_request
+    async def record_request_metrics(response):
+        labels = async_g.get("_metrics_labels")
+        if labels is None:
+            return response
+
+        # content_length is unknown (None) for streamed bodies
+        _record(labels, async_g._metrics_started, response.status_code, response.content_length)
+        return response
+
+    @app.teardown_request
+    async def finish_request(exc=None):
+        labels = async_g.pop("_metrics_labels", None)
+        if labels is not None:
+            in_flight.dec(*labels)
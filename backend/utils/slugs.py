@@ -0,0 +1,19 @@
+def extract_slug(doc):
+    # Preferred
+    if isinstance(doc.get("slug"), str):
+        return doc["slug"]
+
+    # Legacy LeetCode ingestion
+    if isinstance(doc.get("titleSlug"), str):
+        return doc["titleSlug"]
+
+    # When slug was used as _id
+    if isinstance(doc.get("_id"), str):
+        return doc["_id"]
+
+    # Fallback from link
+    link = doc.get("link")
+    if isinstance(link, str) and "/problems/" in link:
+        return link.split("/problems/")[1].strip("/")
+
+    return None
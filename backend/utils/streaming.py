@@ -0,0 +1,35 @@
+import json
+from flask import Response, request, stream_with_context
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# Documents fetched per MongoDB round trip while streaming
+STREAM_BATCH_SIZE = 200
+
+def wants_ndjson(req=None) -> bool:
+    """
+    True when the client opted into streaming (?stream=1 or Accept: application/x-ndjson).
+    `req` defaults to the Flask request; async views pass their own.
+    """
+    req = req if req is not None else request
+    if req.args.get("stream", "").lower() in ("1", "true"):
+        return True
+
+    accept = req.accept_mimetypes
+    return accept[NDJSON_MIMETYPE] > accept["application/json"]
+
+def ndjson_line(row) -> str:
+    return json.dumps(row, separators=(",", ":")) + "\n"
+
+def ndjson_response(rows) -> Response:
+    """Stream an iterable of dicts as newline-delimited JSON, one row at a time."""
+    def generate():
+        for row in rows:
+            yield ndjson_line(row)
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+async def ndjson_lines(rows):
+    """Async counterpart of ndjson_response's body, for async views."""
+    async for row in rows:
+        yield ndjson_line(row)